@@ -0,0 +1,89 @@
+"""Compare data fixture cost of a new Faker per test with the seeded identity pool
+
+Usage: uv run python -m benchmarks.data_pool [--tests 500]
+
+Warm numbers are fixture setup plus one first, last and zip per test in a running session. Cold numbers
+are the first test of a new process (an xdist worker), including imports.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from utils.generator import DataGenerator, IdentityPool
+
+# Time from import to the first identity in a fresh interpreter, printed in seconds
+COLD_SCRIPTS = {
+    "Faker per test": (
+        "import time; started = time.perf_counter()\n"
+        "from utils.generator import DataGenerator\n"
+        "generator = DataGenerator(); generator.first_name(), generator.last_name(), generator.zip_code()\n"
+        "print(time.perf_counter() - started)"
+    ),
+    "pool": (
+        "import sys, time; started = time.perf_counter()\n"
+        "from utils.generator import IdentityPool\n"
+        "pool = IdentityPool(path=sys.argv[1]); generator = pool.generator(pool.test_seed('test'))\n"
+        "generator.first_name(), generator.last_name(), generator.zip_code()\n"
+        "print(time.perf_counter() - started)"
+    ),
+}
+
+
+def checkout_identity(generator) -> tuple[str, str, str]:
+    """Data a checkout test asks for"""
+    return generator.first_name(), generator.last_name(), generator.zip_code()
+
+
+def faker_per_test(tests: int) -> float:
+    """Return average seconds per test of the data fixture as it was: a new DataGenerator every test"""
+    started = time.perf_counter()
+    for _ in range(tests):
+        checkout_identity(DataGenerator())
+    return (time.perf_counter() - started) / tests
+
+
+def pooled(pool: IdentityPool, tests: int) -> float:
+    """Return average seconds per test of the pooled data fixture, pool already filled"""
+    len(pool.identities)
+    started = time.perf_counter()
+    for test in range(tests):
+        checkout_identity(pool.generator(pool.test_seed(f"test_{test}")))
+    return (time.perf_counter() - started) / tests
+
+
+def cold_start(name: str, pool_file: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_SCRIPTS[name], pool_file],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tests", type=int, default=500, help="data fixtures set up per variant")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool_file = os.path.join(directory, "data_pool.json")
+        started = time.perf_counter()
+        len(IdentityPool(path=pool_file).identities)
+        refill = time.perf_counter() - started
+
+        print(f"{'variant':<16} {'warm us/test':>13} {'cold ms':>9}")
+        warm = faker_per_test(args.tests)
+        print(f"{'Faker per test':<16} {warm * 1e6:>13.1f} {cold_start('Faker per test', pool_file) * 1000:>9.1f}")
+        warm = pooled(IdentityPool(path=pool_file), args.tests)
+        print(f"{'pool':<16} {warm * 1e6:>13.1f} {cold_start('pool', pool_file) * 1000:>9.1f}")
+        print(f"Pool refill with Faker ({IdentityPool().size} identities): {refill * 1000:.1f}ms, once per seed")
+
+
+if __name__ == "__main__":
+    main()
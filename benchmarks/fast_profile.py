@@ -0,0 +1,84 @@
+"""Compare page load and suite time with and without the fast browser profile
+
+Usage: uv run python -m benchmarks.fast_profile [--loads 10] [--local] [--suite]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from data.tests_data import Links
+from utils.driver_factory import create_driver
+from utils.local_server import LocalServer
+
+# Milliseconds from navigation start to load event of the current document
+LOAD_TIME_SCRIPT = "var nav = performance.getEntriesByType('navigation')[0]; return nav ? nav.loadEventEnd : 0;"
+
+
+def load_ms(driver, url: str) -> float:
+    driver.get(url)
+    return driver.execute_script(LOAD_TIME_SCRIPT)
+
+
+def time_profile(fast_profile: bool, loads: int) -> dict[str, float]:
+    """Time launch, first load in a new browser and repeated loads of the login page"""
+    # One browser visits first, so with the fast profile the next one finds assets in the shared cache
+    warmup = create_driver(fast_profile)
+    load_ms(warmup, Links.BASE_URL)
+    warmup.quit()
+
+    started = time.perf_counter()
+    driver = create_driver(fast_profile)
+    launch = (time.perf_counter() - started) * 1000
+    try:
+        first = load_ms(driver, Links.BASE_URL)
+        repeated = statistics.median(load_ms(driver, Links.BASE_URL) for _ in range(loads))
+    finally:
+        driver.quit()
+    return {"launch": launch, "first load": first, "repeat load": repeated}
+
+
+def time_suite(fast_profile: bool, local: bool) -> float:
+    """Run the test suite in a subprocess and return wall time in seconds"""
+    env = {**os.environ, "FAST_PROFILE": "true" if fast_profile else "false"}
+    if local:
+        env["LOCAL_SERVER"] = "true"
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "pytest", "tests/", "-q", "-p", "no:cacheprovider"], env=env, check=False)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--loads", type=int, default=10, help="page loads timed per profile")
+    parser.add_argument("--local", action="store_true", help="run against the bundled local server")
+    parser.add_argument("--suite", action="store_true", help="also time a full test run per profile")
+    args = parser.parse_args()
+
+    server = None
+    if args.local:
+        server = LocalServer()
+        server.start()
+        Links.rebase(server.base_url)
+    try:
+        results = {name: time_profile(name == "fast", args.loads) for name in ("standard", "fast")}
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(f"{'profile':<10} {'launch ms':>10} {'first load ms':>14} {'repeat load ms':>15}")
+    for name, timings in results.items():
+        print(f"{name:<10} {timings['launch']:>10.0f} {timings['first load']:>14.0f} {timings['repeat load']:>15.0f}")
+
+    if args.suite:
+        suite = {name: time_suite(name == "fast", args.local) for name in ("standard", "fast")}
+        print(f"{'profile':<10} {'suite s':>10}")
+        for name, seconds in suite.items():
+            print(f"{name:<10} {seconds:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
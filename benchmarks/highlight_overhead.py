@@ -0,0 +1,59 @@
+"""Measure per-action overhead of element highlighting
+
+Usage: uv run python -m benchmarks.highlight_overhead [--actions 50] [--local]
+"""
+
+import argparse
+import time
+
+from data.tests_data import Links
+from locators.page_locators import LoginPageLocators
+from pages.base_page import HIGHLIGHT_MODES
+from pages.login_page import LoginPage
+from utils.driver_factory import create_driver
+from utils.local_server import LocalServer
+
+
+def time_actions(page: LoginPage, actions: int) -> float:
+    """Return average seconds per action_get_attr call"""
+    started = time.perf_counter()
+    for _ in range(actions):
+        page.action_get_attr(LoginPageLocators.USERNAME, "placeholder")
+    return (time.perf_counter() - started) / actions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, default=50, help="actions timed per mode")
+    parser.add_argument("--local", action="store_true", help="run against the bundled local server")
+    args = parser.parse_args()
+
+    server = None
+    if args.local:
+        server = LocalServer()
+        server.start()
+        Links.rebase(server.base_url)
+
+    driver = create_driver()
+    try:
+        page = LoginPage(driver)
+        page.open_url(Links.BASE_URL)
+        # Warm up element lookup and script caches before measuring
+        time_actions(page, 5)
+        results = {}
+        for mode in HIGHLIGHT_MODES:
+            page.highlight_mode = mode
+            results[mode] = time_actions(page, args.actions)
+    finally:
+        driver.quit()
+        if server is not None:
+            server.stop()
+
+    print(f"{'mode':<8} {'ms/action':>10} {'overhead':>10}")
+    for mode, seconds in results.items():
+        overhead = (seconds - results["off"]) * 1000
+        print(f"{mode:<8} {seconds * 1000:>10.2f} {overhead:>+10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Measure element lookup latency of original XPath locators against compiled ones
+
+Usage: uv run python -m benchmarks.locator_latency [--lookups 20] [--local]
+"""
+
+import argparse
+import time
+
+from data.tests_data import Links, Users
+from locators.page_locators import (
+    CartPageLocators,
+    CheckoutPageLocators,
+    InventoryPageLocators,
+    LoginPageLocators,
+    OrderPageLocators,
+    OverviewPageLocators,
+    ProductPageLocators,
+)
+from pages.login_page import LoginPage
+from utils.driver_factory import create_driver
+from utils.local_server import LocalServer
+
+
+def page_urls() -> dict:
+    """Page each locator class is measured on"""
+    return {
+        LoginPageLocators: Links.BASE_URL,
+        InventoryPageLocators: Links.PRODUCTS,
+        ProductPageLocators: Links.PRODUCT,
+        CartPageLocators: Links.CART,
+        CheckoutPageLocators: Links.CHECKOUT,
+        OverviewPageLocators: Links.OVERVIEW,
+        OrderPageLocators: Links.ORDER,
+    }
+
+
+def time_lookup(driver, locator: tuple[str, str], lookups: int) -> float:
+    """Return average seconds per find_elements call"""
+    started = time.perf_counter()
+    for _ in range(lookups):
+        driver.find_elements(*locator)
+    return (time.perf_counter() - started) / lookups
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lookups", type=int, default=20, help="lookups timed per locator")
+    parser.add_argument("--local", action="store_true", help="run against the bundled local server")
+    args = parser.parse_args()
+
+    server = None
+    if args.local:
+        server = LocalServer()
+        server.start()
+        Links.rebase(server.base_url)
+
+    driver = create_driver()
+    rows = []
+    try:
+        page = LoginPage(driver)
+        page.authenticated_as(Users.STANDARD_USER_NAME)
+        driver.execute_script("window.localStorage.setItem('cart-contents', '[4, 0]');")
+        for locators, url in page_urls().items():
+            page.open_url(url)
+            for name, xpath in locators.XPATHS.items():
+                compiled = getattr(locators, name)
+                before = time_lookup(driver, xpath, args.lookups)
+                after = time_lookup(driver, compiled, args.lookups)
+                rows.append((f"{locators.__name__}.{name}", compiled[0], before, after))
+    finally:
+        driver.quit()
+        if server is not None:
+            server.stop()
+
+    print(f"{'locator':<50} {'compiled to':<14} {'xpath ms':>9} {'compiled ms':>12} {'change':>8}")
+    for name, strategy, before, after in rows:
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{name:<50} {strategy:<14} {before * 1000:>9.3f} {after * 1000:>12.3f} {change:>+7.1f}%")
+    total_before = sum(row[2] for row in rows)
+    total_after = sum(row[3] for row in rows)
+    print(f"{'total':<65} {total_before * 1000:>9.3f} {total_after * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Measure logging cost on the test thread per BasePage action
+
+Usage: uv run python -m benchmarks.logging_overhead [--actions 20000]
+
+Each action logs what element_is_visible + action_get_text log: two DEBUG records with a locator.
+"""
+
+import argparse
+import logging
+import os
+import queue
+import tempfile
+import time
+from logging.handlers import QueueListener
+
+from locators.page_locators import InventoryPageLocators
+from utils.logger import LazyQueueHandler, file_formatter
+
+LOCATOR = InventoryPageLocators.PAGE_TITLE
+
+
+def eager_action(logger: logging.Logger) -> None:
+    """Logging as BasePage did before: f-strings formatted even if nobody reads DEBUG"""
+    logger.debug(f"Waiting for element to be visible: {LOCATOR}")
+    logger.debug(f"Got text: '{'Products'}'")
+
+
+def lazy_action(logger: logging.Logger) -> None:
+    logger.debug("Waiting for element to be visible: %s", LOCATOR)
+    logger.debug("Got text: '%s'", "Products")
+
+
+def time_actions(logger: logging.Logger, action, actions: int) -> float:
+    """Return average seconds spent on the calling thread per action"""
+    started = time.perf_counter()
+    for _ in range(actions):
+        action(logger)
+    return (time.perf_counter() - started) / actions
+
+
+def run(name: str, level: int, action, actions: int, use_queue: bool, log_format: str, logs_dir: str) -> float:
+    logger = logging.getLogger(f"bench.{name}")
+    logger.propagate = False
+    logger.setLevel(level)
+    file_handler = logging.FileHandler(os.path.join(logs_dir, f"{name}.log"), encoding="utf-8")
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(file_formatter(log_format))
+    listener = None
+    if use_queue:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(LazyQueueHandler(log_queue))
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+    else:
+        logger.addHandler(file_handler)
+    try:
+        return time_actions(logger, action, actions)
+    finally:
+        if listener is not None:
+            listener.stop()
+        file_handler.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--actions", type=int, default=20000, help="actions timed per setup")
+    args = parser.parse_args()
+
+    setups = [
+        ("sync, DEBUG, f-strings (old)", logging.DEBUG, eager_action, False, "text"),
+        ("queue, DEBUG, lazy", logging.DEBUG, lazy_action, True, "text"),
+        ("queue, DEBUG, lazy, jsonl", logging.DEBUG, lazy_action, True, "jsonl"),
+        ("queue, DEBUG off, lazy", logging.INFO, lazy_action, True, "text"),
+    ]
+    with tempfile.TemporaryDirectory() as logs_dir:
+        results = [
+            (name, run(f"setup{index}", level, action, args.actions, use_queue, log_format, logs_dir))
+            for index, (name, level, action, use_queue, log_format) in enumerate(setups)
+        ]
+
+    print(f"{'setup':<32} {'us/action':>10}")
+    for name, seconds in results:
+        print(f"{name:<32} {seconds * 1_000_000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 import os
+from urllib.parse import urljoin, urlsplit
 
 from dotenv import load_dotenv
 
@@ -14,6 +15,15 @@ class Links:
     OVERVIEW = os.getenv("OVERVIEW", "https://www.saucedemo.com/checkout-step-two.html")
     ORDER = os.getenv("ORDER", "https://www.saucedemo.com/checkout-complete.html")
 
+    @classmethod
+    def rebase(cls, base_url: str) -> None:
+        """Point all links at another host keeping their paths and queries"""
+        for name in ("PRODUCTS", "PRODUCT", "CART", "CHECKOUT", "OVERVIEW", "ORDER"):
+            parts = urlsplit(getattr(cls, name))
+            path = parts.path.lstrip("/") + (f"?{parts.query}" if parts.query else "")
+            setattr(cls, name, urljoin(base_url, path))
+        cls.BASE_URL = base_url
+
 
 class Users:
     STANDARD_USER_NAME = os.getenv("STANDARD_USER_NAME", "standard_user")
@@ -0,0 +1,78 @@
+import os
+import re
+
+from dotenv import load_dotenv
+from selenium.webdriver.common.by import By
+
+load_dotenv()
+
+LOCATOR_COMPILE = os.getenv("LOCATOR_COMPILE", "true").strip().lower() != "false"
+
+# One location step like "div", "div[2]" or "input[@id='user-name'][contains(@class,'x')]"
+STEP = re.compile(r"(?P<tag>[a-zA-Z][\w-]*)(?P<predicates>(?:\[[^\]]+\])*)")
+PREDICATE = re.compile(r"\[([^\]]+)\]")
+EQUALS = re.compile(r"^@(?P<attr>[\w-]+)='(?P<value>[^']*)'$")
+CONTAINS = re.compile(r"^contains\(@(?P<attr>[\w-]+),\s*'(?P<value>[^']*)'\)$")
+POSITION = re.compile(r"^(?P<index>\d+)$")
+CSS_IDENT = re.compile(r"^-?[_a-zA-Z][\w-]*$")
+
+
+def _predicate_to_css(predicate: str) -> str | None:
+    if match := EQUALS.match(predicate):
+        attr, value = match["attr"], match["value"]
+        if attr == "id" and CSS_IDENT.match(value):
+            return f"#{value}"
+        return f"[{attr}='{value}']"
+    if match := CONTAINS.match(predicate):
+        return f"[{match['attr']}*='{match['value']}']"
+    if match := POSITION.match(predicate):
+        return f":nth-of-type({match['index']})"
+    return None
+
+
+def xpath_to_css(xpath: str) -> str | None:
+    """Translate a simple absolute XPath to an equivalent CSS selector, None if it can't be done exactly
+
+    Supports "//" and "/" axes, tag names and predicates comparing an attribute, contains() on an
+    attribute and element position. Anything else (text(), functions, unions, wildcards) is left as XPath.
+    """
+    if not xpath.startswith("//"):
+        return None
+    parts = re.split(r"(//|/)", xpath)[1:]
+    selector = []
+    for axis, step in zip(parts[::2], parts[1::2], strict=True):
+        match = STEP.fullmatch(step)
+        if match is None:
+            return None
+        css = match["tag"]
+        for position, predicate in enumerate(PREDICATE.findall(match["predicates"])):
+            translated = _predicate_to_css(predicate)
+            # Position after another predicate counts filtered nodes, which CSS can't express
+            if translated is None or (position and translated.startswith(":nth-of-type")):
+                return None
+            css += translated
+        if selector:
+            selector.append(" " if axis == "//" else " > ")
+        selector.append(css)
+    return "".join(selector)
+
+
+def compile_locator(locator: tuple[str, str]) -> tuple[str, str]:
+    """Return the cheapest equivalent of a locator, the locator itself if there is none"""
+    by, value = locator
+    if by != By.XPATH:
+        return locator
+    css = xpath_to_css(value)
+    return locator if css is None else (By.CSS_SELECTOR, css)
+
+
+def compiled(cls):
+    """Replace XPath locators of a locator class with CSS equivalents, keeping originals in cls.XPATHS"""
+    cls.XPATHS = {}
+    for name, value in list(vars(cls).items()):
+        if not (isinstance(value, tuple) and len(value) == 2 and value[0] == By.XPATH):
+            continue
+        cls.XPATHS[name] = value
+        if LOCATOR_COMPILE:
+            setattr(cls, name, compile_locator(value))
+    return cls
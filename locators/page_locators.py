@@ -1,6 +1,9 @@
 from selenium.webdriver.common.by import By
 
+from locators.compiler import compiled
 
+
+@compiled
 class LoginPageLocators:
     USERNAME = (By.XPATH, "//input[@id='user-name']")
     PASSWORD = (By.XPATH, "//input[@id='password']")
@@ -9,6 +12,7 @@ class LoginPageLocators:
     ERROR_BUTTON = (By.XPATH, "//div[@id='login_button_container']/div/form/div[3]/h3/button")
 
 
+@compiled
 class InventoryPageLocators:
     PAGE_TITLE = (By.XPATH, "//div[@id='header_container']/div[2]/span")
     HAMBURGER_ICON = (By.XPATH, "//button[@id='react-burger-menu-btn']")
@@ -22,22 +26,6 @@ class InventoryPageLocators:
     SORT_LOW_HIGH = (By.XPATH, "//div[@id='header_container']/div[2]/div/span/select/option[@value='lohi']")
     SORT_HIGH_LOW = (By.XPATH, "//div[@id='header_container']/div[2]/div/span/select/option[@value='hilo']")
     INVENTORY_ITEM = (By.XPATH, "//div[@class='inventory_item']")
-    INVENTORY_ITEM_URL = (
-        By.XPATH,
-        "//div[@class='inventory_list']//div[@class='inventory_item']//div[@class='inventory_item_label']//a[contains(@id,'title_link')]",
-    )
-    INVENTORY_ITEM_NAME = (
-        By.XPATH,
-        "//div[@class='inventory_list']//div[@class='inventory_item']//div[@class='inventory_item_label']//div[contains(@class,'inventory_item_name')]",
-    )
-    INVENTORY_ITEM_DESC = (
-        By.XPATH,
-        "//div[@class='inventory_list']//div[@class='inventory_item']//div[@class='inventory_item_label']//div[@class='inventory_item_desc']",
-    )
-    INVENTORY_ITEM_PRICE = (
-        By.XPATH,
-        "//div[@class='inventory_list']//div[@class='inventory_item']//div[contains(@class,'pricebar')]//div[contains(@class,'inventory_item_price')]",
-    )
     ADD_TO_CART_BUTTON = (
         By.XPATH,
         "//div[@class='inventory_list']//div[@class='inventory_item']//div[contains(@class,'pricebar')]//button[contains(@data-test,'add-to-cart')]",
@@ -46,8 +34,17 @@ class InventoryPageLocators:
         By.XPATH,
         "//div[@class='inventory_list']//div[@class='inventory_item']//div[contains(@class,'pricebar')]//button[contains(@data-test,'remove')]",
     )
+    # Fields read from every INVENTORY_ITEM by BasePage.snapshot_elements
+    INVENTORY_ITEM_FIELDS = {
+        "link": (".inventory_item_label a[id$='_title_link']", "id"),
+        "name": (".inventory_item_name", "text"),
+        "desc": (".inventory_item_desc", "text"),
+        "price": (".pricebar .inventory_item_price", "text"),
+        "button": (".pricebar button", "data-test"),
+    }
 
 
+@compiled
 class ProductPageLocators:
     NAME = (By.XPATH, "//div[@id='inventory_item_container']//div[contains(@class,'inventory_details_name')]")
     DESC = (By.XPATH, "//div[@id='inventory_item_container']//div[contains(@class,'inventory_details_desc')]")
@@ -58,29 +55,27 @@ class ProductPageLocators:
     BACK_BUTTON = (By.XPATH, "//button[@id='back-to-products']")
 
 
+@compiled
 class CartPageLocators:
     PAGE_TITLE = (By.XPATH, "//div[@id='header_container']/div[2]/span")
     CART_ITEM = (By.XPATH, "//div[@class='cart_item']")
-    CART_ITEM_NAME = (
-        By.XPATH,
-        "//div[@class='cart_list']//div[@class='cart_item']//div[@class='cart_item_label']//div[contains(@class,'inventory_item_name')]",
-    )
-    CART_ITEM_DESC = (
-        By.XPATH,
-        "//div[@class='cart_list']//div[@class='cart_item']//div[@class='cart_item_label']//div[contains(@class,'inventory_item_desc')]",
-    )
-    CART_ITEM_PRICE = (
-        By.XPATH,
-        "//div[@class='cart_list']//div[@class='cart_item']//div[@class='cart_item_label']//div[@class='item_pricebar']//div[contains(@class,'inventory_item_price')]",
-    )
     REMOVE_BUTTON = (
         By.XPATH,
         "//div[@class='cart_list']//div[@class='cart_item']//div[@class='item_pricebar']//button[contains(@data-test,'remove')]",
     )
+    # Fields read from every CART_ITEM by BasePage.snapshot_elements
+    CART_ITEM_FIELDS = {
+        "link": (".cart_item_label a[id$='_title_link']", "id"),
+        "name": (".cart_item_label .inventory_item_name", "text"),
+        "desc": (".cart_item_label .inventory_item_desc", "text"),
+        "price": (".item_pricebar .inventory_item_price", "text"),
+        "button": (".item_pricebar button", "data-test"),
+    }
     CONTINUE_SHOPPING_BUTTON = (By.XPATH, "//button[@id='continue-shopping']")
     CHECKOUT_BUTTON = (By.XPATH, "//button[@id='checkout']")
 
 
+@compiled
 class CheckoutPageLocators:
     PAGE_TITLE = (By.XPATH, "//div[@id='header_container']/div[2]/span")
     FIRST_NAME = (By.XPATH, "//input[@data-test='firstName']")
@@ -92,12 +87,9 @@ class CheckoutPageLocators:
     ERROR_BUTTON = (By.XPATH, "//h3[@data-test='error']/button")
 
 
+@compiled
 class OverviewPageLocators:
     PAGE_TITLE = (By.XPATH, "//div[@id='header_container']/div[2]/span")
-    ITEM_PRICE = (
-        By.XPATH,
-        "//div[@class='cart_list']//div[@class='cart_item']//div[@class='cart_item_label']//div[@class='item_pricebar']//div[contains(@class,'inventory_item_price')]",
-    )
     ITEM_TOTAL_PRICE = (
         By.XPATH,
         "//div[@id='checkout_summary_container']//div[contains(@class,'summary_subtotal_label')]",
@@ -108,6 +100,7 @@ class OverviewPageLocators:
     FINISH_BUTTON = (By.XPATH, "//button[@id='finish']")
 
 
+@compiled
 class OrderPageLocators:
     PAGE_TITLE = (By.XPATH, "//div[@id='header_container']/div[2]/span")
     PAGE_SUBTITLE = (By.XPATH, "//div[@id='checkout_complete_container']//h2[contains(@class,'complete-header')]")
@@ -1,59 +1,362 @@
+import contextlib
+import os
+import time
+from collections.abc import Iterator
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import ActionChains
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support.ui import WebDriverWait
 
 from data.tests_data import Links
-from utils.logger import get_logger
+from utils.action_timings import action_timings
+from utils.browser_wait import BrowserWaitUnavailable
+from utils.page_context import PageContext
+
+HIGHLIGHT_MODES = ("off", "on", "record")
+HEADLESS = os.getenv("HEADLESS", "headless").strip().lower() != "ui"
+# Nobody sees highlights in headless runs, so they are off there unless asked for
+HIGHLIGHT = os.getenv("HIGHLIGHT", "off" if HEADLESS else "on").strip().lower()
+if HIGHLIGHT not in HIGHLIGHT_MODES:
+    raise ValueError(f"HIGHLIGHT must be one of {HIGHLIGHT_MODES}, got '{HIGHLIGHT}'")
+
+WAIT_TIMEOUT = float(os.getenv("WAIT_TIMEOUT", "15"))
+ABSENCE_TIMEOUT = float(os.getenv("ABSENCE_TIMEOUT", "2"))
+
+# "browser" resolves waits inside the page, "classic" polls from Python every 0.3s
+WAIT_ENGINE = os.getenv("WAIT_ENGINE", "browser").strip().lower()
+if WAIT_ENGINE not in ("browser", "classic"):
+    raise ValueError(f"WAIT_ENGINE must be 'browser' or 'classic', got '{WAIT_ENGINE}'")
+
+# "normal" waits for every image, "eager" returns after DOMContentLoaded, "none" right after navigation starts.
+# Navigation then waits for the page's readiness locator, so the page is usable either way.
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager").strip().lower()
+if PAGE_LOAD_STRATEGY not in PAGE_LOAD_STRATEGIES:
+    raise ValueError(f"PAGE_LOAD_STRATEGY must be one of {PAGE_LOAD_STRATEGIES}, got '{PAGE_LOAD_STRATEGY}'")
+
+# Rendered by React on every page, readiness marker for pages without one of their own
+ROOT_RENDERED = (By.CSS_SELECTOR, "#root > *")
+# With "none" get() may return while the old document is still shown, so it is marked before leaving
+MARK_STALE_SCRIPT = "window.__staleDocument = true;"
+NEW_DOCUMENT_SCRIPT = "return !window.__staleDocument && document.readyState !== 'loading';"
+
+# Time page object transitions (login -> inventory, cart -> checkout, ...) as the user sees them
+TRANSITION_TIMING = os.getenv("TRANSITION_TIMING", "true").strip().lower() != "false"
+# "warn" logs transitions slower than the page's render budget, "fail" also fails the test
+PERF_BUDGET_MODES = ("off", "warn", "fail")
+PERF_BUDGETS = os.getenv("PERF_BUDGETS", "warn").strip().lower()
+if PERF_BUDGETS not in PERF_BUDGET_MODES:
+    raise ValueError(f"PERF_BUDGETS must be one of {PERF_BUDGET_MODES}, got '{PERF_BUDGETS}'")
+
+# Absolute time in ms, comparable across documents, taken right before the action
+TRANSITION_START_SCRIPT = "performance.mark('transition-start'); return performance.timeOrigin + performance.now();"
+# Read once the target page is ready. The app may route in the same document or load a new one, so times
+# are taken relative to the absolute start. Buffered entries are handed to a new observer right away and
+# can be taken without waiting for its callback.
+TRANSITION_END_SCRIPT = """
+var start = arguments[0], origin = performance.timeOrigin, now = origin + performance.now();
+function since(time) {
+    return origin + time - start;
+}
+function observed(type) {
+    try {
+        var observer = new PerformanceObserver(function () {});
+        observer.observe({type: type, buffered: true});
+        var entries = observer.takeRecords();
+        observer.disconnect();
+        return entries.filter(function (entry) { return since(entry.startTime) >= 0; });
+    } catch (error) {
+        return [];
+    }
+}
+var sameDocument = origin < start;
+var navigation = sameDocument ? null : performance.getEntriesByType("navigation")[0];
+var paints = observed("largest-contentful-paint");
+var longTasks = observed("longtask");
+if (sameDocument) {
+    performance.measure("transition", "transition-start");
+}
+return {
+    document: sameDocument ? "same" : "new",
+    ready_ms: now - start,
+    dom_content_loaded_ms: navigation ? since(navigation.domContentLoadedEventEnd) : null,
+    lcp_ms: paints.length ? since(paints[paints.length - 1].startTime) : null,
+    long_tasks: longTasks.length,
+    long_task_ms: longTasks.reduce(function (sum, task) { return sum + task.duration; }, 0)
+};
+"""
+
+
+def any_of(*locators: tuple[str, str]) -> tuple[str, str]:
+    """Combine locators into one that matches any of them, first locator if their strategies differ"""
+    strategies = {by for by, _ in locators}
+    if strategies == {By.CSS_SELECTOR}:
+        return By.CSS_SELECTOR, ", ".join(value for _, value in locators)
+    if strategies == {By.XPATH}:
+        return By.XPATH, " | ".join(value for _, value in locators)
+    return locators[0]
+
+
+# Highlight element and restore its original style later in a single round trip
+HIGHLIGHT_SCRIPT = """
+var element = arguments[0], color = arguments[1], original = element.getAttribute("style");
+element.style.backgroundColor = color;
+element.style.border = "1px solid #000";
+setTimeout(function () {
+    if (original === null) {
+        element.removeAttribute("style");
+    } else {
+        element.setAttribute("style", original);
+    }
+}, 400);
+"""
+
+# Collect fields of all matched items in one round trip, null until every item is visible
+SNAPSHOT_SCRIPT = """
+var using = arguments[0], value = arguments[1], fields = arguments[2];
+var items = [];
+if (using === "xpath") {
+    var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (var i = 0; i < result.snapshotLength; i++) {
+        items.push(result.snapshotItem(i));
+    }
+} else {
+    items = Array.prototype.slice.call(document.querySelectorAll(using === "id" ? "#" + CSS.escape(value) : value));
+}
+function visible(element) {
+    var style = window.getComputedStyle(element);
+    var rect = element.getBoundingClientRect();
+    return style.display !== "none" && style.visibility !== "hidden" && (rect.width > 0 || rect.height > 0);
+}
+if (!items.length || !items.every(visible)) {
+    return null;
+}
+return items.map(function (item) {
+    var record = {};
+    Object.keys(fields).forEach(function (name) {
+        var element = fields[name][0] ? item.querySelector(fields[name][0]) : item;
+        var prop = fields[name][1];
+        record[name] = !element ? null : prop === "text" ? element.innerText.trim() : element.getAttribute(prop);
+    });
+    return record;
+});
+"""
+SNAPSHOT_STRATEGIES = {By.XPATH: "xpath", By.CSS_SELECTOR: "css", By.ID: "id"}
 
 
 class BasePage:
+    highlight_mode = HIGHLIGHT
+    wait_engine = WAIT_ENGINE
+    # Seconds to wait for something to appear and for something expected to be gone
+    timeout = WAIT_TIMEOUT
+    absence_timeout = ABSENCE_TIMEOUT
+    # Per locator overrides, e.g. {InventoryPageLocators.CART_COUNT: 5}
+    locator_timeouts: dict[tuple[str, str], float] = {}
+    # Name of Links attribute with the page URL and element that shows the page is usable
+    link: str | None = None
+    ready_locator = ROOT_RENDERED
+    # Milliseconds the page may take to render after the action that opens it, None for no budget
+    render_budget_ms: float | None = None
+    # Page classes that declare their own link, and navigation times per page in this process
+    page_classes: list[type["BasePage"]] = []
+    navigation_timings: dict[str, list[float]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Own copy of inherited overrides, so adding one to a page class doesn't change its parent or siblings
+        cls.locator_timeouts = {**super(cls, cls).locator_timeouts, **vars(cls).get("locator_timeouts", {})}
+        if "link" in vars(cls):
+            BasePage.page_classes.append(cls)
+
     def __init__(self, driver):
         self.driver = driver
         self.url = Links.BASE_URL
-        self.wait = WebDriverWait(self.driver, 15, 0.3)
-        self.logger = get_logger(self.__class__.__name__)
+        self.context = PageContext.of(self.driver)
+        self.wait = self.context.wait(self.timeout)
+        self.browser_wait = self.context.browser_wait(self.timeout)
+        self.page_state = self.context.page_state
+        self.logger = self.context.logger(self.__class__.__name__)
 
     def init_site(self) -> None:
         """Open base URL"""
         self.logger.info(f"Opening base URL: {self.url}")
-        self.driver.get(self.url)
+        self.navigate(self.url)
 
     def open_url(self, url) -> None:
         """Open specific URL"""
         self.logger.info(f"Opening URL: {url}")
+        self.navigate(url)
+
+    @staticmethod
+    def page_for_url(url: str) -> type["BasePage"]:
+        """Return page class showing URL, BasePage if no page declares it"""
+        path = urlsplit(url).path
+        for page in BasePage.page_classes:
+            if urlsplit(getattr(Links, page.link)).path == path:
+                return page
+        return BasePage
+
+    @staticmethod
+    def page_for_link(link: str) -> type["BasePage"]:
+        """Return page class declaring Links attribute name"""
+        # Page classes register when imported, the registry imports all of them
+        import pages.registry  # noqa: F401
+
+        for page in BasePage.page_classes:
+            if page.link == link:
+                return page
+        raise ValueError(f"No page declares link '{link}'")
+
+    @contextlib.contextmanager
+    def transition_to(self, link: str, unless: tuple[str, str] | None = None) -> Iterator[None]:
+        """Time how long the page with given link takes to render after the action in the block
+
+        Waits for the page's ready element. Unless is an element that shows the action did not open the
+        page, like a validation error, in which case nothing is recorded.
+        """
+        if not TRANSITION_TIMING:
+            yield
+            return
+        page = self.page_for_link(link)
+        started = self.driver.execute_script(TRANSITION_START_SCRIPT)
+        yield
+        self.element_is_present(page.ready_locator if unless is None else any_of(page.ready_locator, unless))
+        if unless is not None and not self.element_exists_now(page.ready_locator):
+            return
+        timing = self.driver.execute_script(TRANSITION_END_SCRIPT, started)
+        transition = {
+            "from": self.__class__.__name__,
+            "to": page.__name__,
+            **{name: round(value, 1) if isinstance(value, float) else value for name, value in timing.items()},
+            "budget_ms": page.render_budget_ms if PERF_BUDGETS != "off" else None,
+        }
+        self.context.transitions.append(transition)
+        self.logger.debug("%s rendered %.0fms after action", page.__name__, transition["ready_ms"])
+        if transition["budget_ms"] is not None and transition["ready_ms"] > transition["budget_ms"]:
+            self.logger.warning(
+                "%s rendered in %.0fms, over its %.0fms budget",
+                page.__name__,
+                transition["ready_ms"],
+                transition["budget_ms"],
+            )
+
+    def navigate(self, url: str) -> None:
+        """Open URL and return as soon as its page is usable, recording how long that took"""
+        started = time.perf_counter()
+        if PAGE_LOAD_STRATEGY == "none":
+            self.driver.execute_script(MARK_STALE_SCRIPT)
         self.driver.get(url)
+        if PAGE_LOAD_STRATEGY == "none":
+            new_document = WebDriverWait(self.driver, self.timeout, 0.05)
+            with action_timings.waiting():
+                new_document.until(lambda driver: driver.execute_script(NEW_DOCUMENT_SCRIPT))
+        page = self.page_for_url(url)
+        # Pages the app won't show a logged out user redirect to BASE_URL
+        self.element_is_present(any_of(page.ready_locator, self.page_for_url(Links.BASE_URL).ready_locator))
+        elapsed = time.perf_counter() - started
+        BasePage.navigation_timings.setdefault(page.__name__, []).append(elapsed)
+        self.logger.debug("%s ready in %.0fms", page.__name__, elapsed * 1000)
+
+    def timeout_for(self, element, timeout: float | None = None, absence: bool = False) -> float:
+        """Pick timeout from call, then per locator, then per page (absence waits use a short window)"""
+        if timeout is not None:
+            return timeout
+        if isinstance(element, tuple) and element in self.locator_timeouts:
+            return self.locator_timeouts[element]
+        return self.absence_timeout if absence else self.timeout
+
+    def wait_for(
+        self,
+        condition: str,
+        element,
+        classic,
+        text: str | None = None,
+        scroll: bool = False,
+        timeout: float | None = None,
+        absence: bool = False,
+    ):
+        """Resolve condition in browser, polling for classic expected condition when that is not possible"""
+        timeout = self.timeout_for(element, timeout, absence)
+        if self.wait_engine == "browser":
+            try:
+                with action_timings.waiting():
+                    return self.browser_wait.until(condition, element, text=text, scroll=scroll, timeout=timeout)
+            except BrowserWaitUnavailable as error:
+                self.logger.debug("In-browser wait unavailable, polling instead: %s", error.msg)
+        wait = self.context.wait(timeout)
+        if scroll:
+            with action_timings.waiting():
+                present = wait.until(expected.presence_of_element_located(element))
+            self.go_to_element(present)
+        with action_timings.waiting():
+            return wait.until(classic)
 
-    def element_is_visible(self, element) -> WebElement:
+    def probe(self, condition: str, element, classic) -> bool:
+        """Check condition once without waiting"""
+        try:
+            self.wait_for(condition, element, classic, timeout=0)
+        except TimeoutException:
+            return False
+        return True
+
+    def element_is_visible(self, element, timeout: float | None = None) -> WebElement:
         """Wait for element to be visible"""
-        self.logger.debug(f"Waiting for element to be visible: {element}")
-        self.go_to_element(self.element_is_present(element))
-        return self.wait.until(expected.visibility_of_element_located(element))
+        self.logger.debug("Waiting for element to be visible: %s", element)
+        return self.wait_for(
+            "visible", element, expected.visibility_of_element_located(element), scroll=True, timeout=timeout
+        )
 
-    def elements_are_visible(self, element) -> list[WebElement]:
+    def elements_are_visible(self, element, timeout: float | None = None) -> list[WebElement]:
         """Get all visible elements"""
-        self.logger.debug(f"Getting all visible elements: {element}")
-        return self.wait.until(expected.visibility_of_all_elements_located(element))
+        self.logger.debug("Getting all visible elements: %s", element)
+        return self.wait_for(
+            "all_visible", element, expected.visibility_of_all_elements_located(element), timeout=timeout
+        )
 
-    def element_is_present(self, element) -> WebElement:
+    def element_is_present(self, element, timeout: float | None = None) -> WebElement:
         """Wait for element to be present in DOM"""
-        self.logger.debug(f"Waiting for element to be present: {element}")
-        return self.wait.until(expected.presence_of_element_located(element))
+        self.logger.debug("Waiting for element to be present: %s", element)
+        return self.wait_for("present", element, expected.presence_of_element_located(element), timeout=timeout)
 
-    def elements_are_present(self, element) -> list[WebElement]:
+    def elements_are_present(self, element, timeout: float | None = None) -> list[WebElement]:
         """Get all present elements"""
-        self.logger.debug(f"Getting all present elements: {element}")
-        return self.wait.until(expected.presence_of_all_elements_located(element))
+        self.logger.debug("Getting all present elements: %s", element)
+        return self.wait_for(
+            "all_present", element, expected.presence_of_all_elements_located(element), timeout=timeout
+        )
 
-    def element_is_not_visible(self, element) -> bool:
-        """Check if element is not visible"""
-        self.logger.debug(f"Checking element is not visible: {element}")
-        return self.wait.until(expected.invisibility_of_element_located(element))
+    def element_is_not_visible(self, element, timeout: float | None = None) -> bool:
+        """Check if element is not visible, allowing a short window for it to disappear"""
+        self.logger.debug("Checking element is not visible: %s", element)
+        return self.wait_for(
+            "invisible", element, expected.invisibility_of_element_located(element), timeout=timeout, absence=True
+        )
 
-    def element_is_clickable(self, element) -> WebElement:
+    def element_is_clickable(self, element, timeout: float | None = None) -> WebElement:
         """Wait for element to be clickable"""
-        self.logger.debug(f"Waiting for element to be clickable: {element}")
-        return self.wait.until(expected.element_to_be_clickable(element))
+        self.logger.debug("Waiting for element to be clickable: %s", element)
+        return self.wait_for("clickable", element, expected.element_to_be_clickable(element), timeout=timeout)
+
+    def element_has_text(self, element, text: str, timeout: float | None = None) -> bool:
+        """Wait for element text to contain given text"""
+        self.logger.debug("Waiting for text '%s' in element: %s", text, element)
+        return self.wait_for(
+            "text", element, expected.text_to_be_present_in_element(element, text), text=text, timeout=timeout
+        )
+
+    def element_exists_now(self, element) -> bool:
+        """Check if element is in DOM right now without waiting"""
+        self.logger.debug("Probing element presence: %s", element)
+        return self.probe("present", element, expected.presence_of_element_located(element))
+
+    def element_is_visible_now(self, element) -> bool:
+        """Check if element is visible right now without waiting"""
+        self.logger.debug("Probing element visibility: %s", element)
+        return self.probe("visible", element, expected.visibility_of_element_located(element))
 
     def scroll_to_bottom(self) -> None:
         """Scroll page to bottom"""
@@ -91,14 +394,14 @@ class BasePage:
 
     def action_left_click_on_elements(self, elements: list) -> None:
         """Click on multiple elements"""
-        self.logger.debug(f"Clicking on {len(elements)} elements")
+        self.logger.debug("Clicking on %s elements", len(elements))
         for element in elements:
             self.action_left_click(element)
 
     def action_fill_text(self, element, txt: str) -> None:
         """Fill text into element"""
-        self.logger.debug(f"Filling text: '{txt}'")
-        element: WebElement = self.wait.until(expected.element_to_be_clickable(element))
+        self.logger.debug("Filling text: '%s'", txt)
+        element: WebElement = self.element_is_clickable(element)
         element.clear()
         self.highlight_element(element, "green")
         element.send_keys(txt)
@@ -106,50 +409,65 @@ class BasePage:
     def action_clear_text(self, element) -> None:
         """Clear text from element"""
         self.logger.debug("Clearing text from element")
-        element: WebElement = self.wait.until(expected.element_to_be_clickable(element))
+        element: WebElement = self.element_is_clickable(element)
         self.highlight_element(element, "green")
         element.clear()
 
     def action_get_text(self, element) -> str:
         """Get element text"""
-        element: WebElement = self.wait.until(expected.visibility_of_element_located(element))
+        element: WebElement = self.wait_for("visible", element, expected.visibility_of_element_located(element))
         self.highlight_element(element, "green")
         text = element.text
-        self.logger.debug(f"Got text: '{text}'")
+        self.logger.debug("Got text: '%s'", text)
         return text
 
     def action_get_text_from_elements(self, elements: list[WebElement]) -> list[str]:
         """Get text from multiple elements"""
-        self.logger.debug(f"Getting text from {len(elements)} elements")
+        self.logger.debug("Getting text from %s elements", len(elements))
         return [element.text for element in elements]
 
+    def snapshot_elements(self, element, fields: dict[str, tuple[str, str]]) -> list[dict]:
+        """Wait for all items to be visible and read their fields in one script call
+
+        Fields map a record key to a CSS selector relative to the item (empty for the item itself)
+        and either "text" or an attribute name.
+        """
+        self.logger.debug("Taking snapshot of %s for elements: %s", list(fields), element)
+        by, value = element
+        if by not in SNAPSHOT_STRATEGIES:
+            raise ValueError(f"Snapshot does not support locator strategy '{by}'")
+        with action_timings.waiting():
+            return self.wait.until(
+                lambda driver: driver.execute_script(SNAPSHOT_SCRIPT, SNAPSHOT_STRATEGIES[by], value, fields)
+            )
+
     def get_element_by_text(self, elements: list[WebElement], name: str) -> WebElement:
         """Find element by text content"""
-        self.logger.debug(f"Finding element by text: '{name}'")
+        self.logger.debug("Finding element by text: '%s'", name)
         name = name.lower()
         return [element for element in elements if element.text.lower() == name][0]
 
     def action_get_attr(self, element, attribute) -> str:
         """Get element attribute"""
-        self.logger.debug(f"Getting attribute '{attribute}' from element")
-        element: WebElement = self.wait.until(expected.visibility_of_element_located(element))
+        self.logger.debug("Getting attribute '%s' from element", attribute)
+        element: WebElement = self.wait_for("visible", element, expected.visibility_of_element_located(element))
         self.highlight_element(element, "green")
         return element.get_attribute(attribute)
 
     def action_get_attr_from_elements(self, elements: list[WebElement], attribute) -> list[str]:
         """Get attribute from multiple elements"""
-        self.logger.debug(f"Getting attribute '{attribute}' from {len(elements)} elements")
+        self.logger.debug("Getting attribute '%s' from %s elements", attribute, len(elements))
         return [element.get_attribute(attribute) for element in elements]
 
     def action_get_url(self) -> str:
         """Get current page URL"""
         pages_url = self.driver.current_url
-        self.logger.debug(f"Current URL: {pages_url}")
+        self.logger.debug("Current URL: %s", pages_url)
         return pages_url
 
     def action_drag_and_drop_by_offset(self, element, x_coords, y_coords) -> None:
         """Drag and drop element by offset"""
-        self.logger.debug(f"Dragging element by offset: x={x_coords}, y={y_coords}")
+        self.logger.debug("Dragging element by offset: x=%s, y=%s", x_coords, y_coords)
         action = ActionChains(self.driver)
         action.drag_and_drop_by_offset(element, x_coords, y_coords)
         action.perform()
@@ -165,28 +483,37 @@ class BasePage:
         """Move cursor to element"""
         self.logger.debug("Moving cursor to element")
         action = ActionChains(self.driver)
-        self.wait.until(expected.visibility_of(element))
+        self.wait_for("visible", element, expected.visibility_of(element))
         action.move_to_element(element)
         action.perform()
 
     def highlight_element(self, element, color: str) -> None:
-        """Highlight element with color"""
-        original_style = element.get_attribute("style")
-        new_style = f"background-color: {color}; border: 1px solid #000; {original_style}"
-        self.driver.execute_script(
-            "var tmpArguments = arguments;setTimeout(function () {tmpArguments[0].setAttribute('style', '"
-            + new_style
-            + "');},0);",
-            element,
-        )
-        self.driver.execute_script(
-            "var tmpArguments = arguments;setTimeout(function () {tmpArguments[0].setAttribute('style', '"
-            + original_style
-            + "');},400);",
-            element,
-        )
+        """Highlight element with color ("off" skips it, "record" only logs it)"""
+        if self.highlight_mode == "off":
+            return
+        if self.highlight_mode == "record":
+            self.logger.debug("Highlight %s: element %s", color, element.id)
+            return
+        self.driver.execute_script(HIGHLIGHT_SCRIPT, element, color)
 
     def find_value_in_data(self, value, data: list) -> bool:
         """Check if value exists in data"""
-        self.logger.debug(f"Checking if value '{value}' exists in data")
+        self.logger.debug("Checking if value '%s' exists in data", value)
         return value in data
+
+
+# Helpers the actions are built from, timed as part of the action that called them
+UNTIMED_METHODS = {
+    "page_for_url",
+    "page_for_link",
+    "transition_to",
+    "timeout_for",
+    "wait_for",
+    "probe",
+    "find_value_in_data",
+}
+
+for _name, _method in list(vars(BasePage).items()):
+    if callable(_method) and not _name.startswith("_") and _name not in UNTIMED_METHODS:
+        setattr(BasePage, _name, action_timings.timed(_method))
+del _name, _method
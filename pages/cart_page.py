@@ -6,6 +6,9 @@ from pages.inventory_page import InventoryPage
 
 class CartPage(InventoryPage):
     cart = CartPageLocators()
+    link = "CART"
+    ready_locator = CartPageLocators.CHECKOUT_BUTTON
+    render_budget_ms = 1000
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -22,20 +25,25 @@ class CartPage(InventoryPage):
         """Get all cart item elements"""
         return self.elements_are_visible(self.cart.CART_ITEM)
 
+    def get_cart_snapshot(self) -> list[dict]:
+        """Get id, name, desc, price and cart state of all cart items, scraped once per page state"""
+        return self.page_state.cached("cart_snapshot", self._scrape_cart_snapshot)
+
+    def _scrape_cart_snapshot(self) -> list[dict]:
+        records = self.snapshot_elements(self.cart.CART_ITEM, self.cart.CART_ITEM_FIELDS)
+        return [self.parse_item_record(record) for record in records]
+
     def get_list_of_cart_item_names(self) -> list[str]:
         """Get list of cart item names"""
-        item_names = self.elements_are_visible(self.cart.CART_ITEM_NAME)
-        return self.action_get_text_from_elements(item_names)
+        return [item["name"] for item in self.get_cart_snapshot()]
 
     def get_list_of_cart_item_descs(self) -> list[str]:
         """Get list of cart item descriptions"""
-        item_descs = self.elements_are_visible(self.cart.CART_ITEM_DESC)
-        return self.action_get_text_from_elements(item_descs)
+        return [item["desc"] for item in self.get_cart_snapshot()]
 
     def get_list_of_cart_item_prices(self) -> list[float]:
         """Get list of cart item prices"""
-        item_prices = self.elements_are_visible(self.cart.CART_ITEM_PRICE)
-        return [float(price.text.replace("$", "")) for price in item_prices]
+        return [item["price"] for item in self.get_cart_snapshot()]
 
     def get_list_of_remove_buttons(self) -> list[WebElement]:
         """Get all remove buttons"""
@@ -81,9 +89,13 @@ class CartPage(InventoryPage):
     def click_continue_shopping(self) -> None:
         """Click continue shopping button"""
         self.logger.info("Clicking continue shopping")
-        self.action_left_click(self.element_is_visible(self.cart.CONTINUE_SHOPPING_BUTTON))
+        button = self.element_is_visible(self.cart.CONTINUE_SHOPPING_BUTTON)
+        with self.transition_to("PRODUCTS"):
+            self.action_left_click(button)
 
     def click_checkout(self) -> None:
         """Click checkout button"""
         self.logger.info("Clicking checkout")
-        self.action_left_click(self.element_is_visible(self.cart.CHECKOUT_BUTTON))
+        button = self.element_is_visible(self.cart.CHECKOUT_BUTTON)
+        with self.transition_to("CHECKOUT"):
+            self.action_left_click(button)
@@ -4,6 +4,9 @@ from pages.cart_page import CartPage
 
 class CheckoutPage(CartPage):
     checkout = CheckoutPageLocators()
+    link = "CHECKOUT"
+    ready_locator = CheckoutPageLocators.CONTINUE_BUTTON
+    render_budget_ms = 1000
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -91,9 +94,13 @@ class CheckoutPage(CartPage):
     def click_cancel_checkout(self) -> None:
         """Click cancel button"""
         self.logger.info("Clicking cancel")
-        self.action_left_click(self.element_is_visible(self.checkout.CANCEL_BUTTON))
+        button = self.element_is_visible(self.checkout.CANCEL_BUTTON)
+        with self.transition_to("CART"):
+            self.action_left_click(button)
 
     def click_continue_checkout(self) -> None:
         """Click continue button"""
         self.logger.info("Clicking continue")
-        self.action_left_click(self.element_is_visible(self.checkout.CONTINUE_BUTTON))
+        button = self.element_is_visible(self.checkout.CONTINUE_BUTTON)
+        with self.transition_to("OVERVIEW", unless=self.checkout.ERROR_MESSAGE):
+            self.action_left_click(button)
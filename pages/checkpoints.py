@@ -0,0 +1,206 @@
+import os
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from typing import NamedTuple
+
+from dotenv import load_dotenv
+
+from data.tests_data import Links
+from pages.base_page import BasePage
+from utils.command_counter import CommandCounter
+from utils.flows import prefixes
+from utils.logger import get_logger
+
+load_dotenv()
+
+CHECKPOINTS = os.getenv("CHECKPOINTS", "true").strip().lower() != "false"
+# Every n-th use of a checkpoint replays the real UI path and checks it still leads to the stored state (0 = never)
+CHECKPOINT_VALIDATE_EVERY = int(os.getenv("CHECKPOINT_VALIDATE_EVERY", "10"))
+
+READ_STORAGE_SCRIPT = "return Object.assign({}, window.localStorage);"
+WRITE_STORAGE_SCRIPT = """
+var items = arguments[0];
+window.localStorage.clear();
+Object.keys(items).forEach(function (key) { window.localStorage.setItem(key, items[key]); });
+"""
+
+
+@dataclass
+class Checkpoint:
+    """App state at a flow milestone: saucedemo keeps all of it in its cookies and localStorage"""
+
+    name: str
+    url: str
+    cookies: list[dict]
+    local_storage: dict[str, str]
+
+    def state(self) -> tuple[dict, dict, str]:
+        """Cookie values and paths, storage and URL, the parts that must match between UI path and restore"""
+        cookies = {cookie["name"]: (cookie["value"], cookie.get("path", "/")) for cookie in self.cookies}
+        return cookies, self.local_storage, self.url
+
+
+class Step(NamedTuple):
+    """UI step of a flow: name, URL it lands on and action that takes it from the previous step"""
+
+    name: str
+    url: str
+    action: Callable[[], None]
+
+
+@dataclass
+class CheckpointStats:
+    """Counters, timings and WebDriver commands of checkpoint use"""
+
+    captured: int = 0
+    restored: int = 0
+    validated: int = 0
+    steps_run: int = 0
+    steps_skipped: int = 0
+    step_commands: int = 0
+    restore_commands: int = 0
+    # UI steps, their time and commands when they last ran, of the prefixes that were restored instead
+    skipped_commands: int = 0
+    restore_seconds: float = 0.0
+    skipped_seconds: float = 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        return self.skipped_seconds - self.restore_seconds
+
+    @property
+    def saved_commands(self) -> int:
+        return self.skipped_commands - self.restore_commands
+
+    def add(self, other: "CheckpointStats") -> None:
+        for field in fields(self):
+            setattr(self, field.name, getattr(self, field.name) + getattr(other, field.name))
+
+    def summary_lines(self) -> list[str]:
+        return [
+            f"Checkpoints captured: {self.captured}, restored: {self.restored}, validated against UI: {self.validated}",
+            f"Flow steps run: {self.steps_run}, skipped by restoring: {self.steps_skipped}",
+            f"WebDriver commands in steps: {self.step_commands}, restoring: {self.restore_commands}, "
+            f"saved: {self.saved_commands} of {self.step_commands + self.skipped_commands}",
+            f"Restoring took {self.restore_seconds:.2f}s, estimated time saved: {self.saved_seconds:.1f}s",
+        ]
+
+
+class CheckpointStore:
+    """Checkpoints of this session, one per flow prefix, reached through the UI once and restored in later tests
+
+    Flows are lists of steps. Flows that start with the same steps form a trie, walking a flow restores the
+    deepest prefix that has a checkpoint and runs only the steps after it, capturing a checkpoint after each.
+    """
+
+    def __init__(self, enabled: bool = CHECKPOINTS, validate_every: int = CHECKPOINT_VALIDATE_EVERY):
+        self.enabled = enabled
+        self.validate_every = validate_every
+        self.checkpoints: dict[tuple[str, ...], Checkpoint] = {}
+        # Seconds and WebDriver commands each step took when it last ran, by prefix ending in the step
+        self.step_seconds: dict[tuple[str, ...], float] = {}
+        self.step_commands: dict[tuple[str, ...], int] = {}
+        self.uses: Counter[tuple[str, ...]] = Counter()
+        # Stats and steps of the running test, reported to the controller after each test
+        self.stats = CheckpointStats()
+        self.flow: list[str] = []
+        self.logger = get_logger("Checkpoints")
+
+    def start_test(self) -> None:
+        self.stats = CheckpointStats()
+        self.flow = []
+
+    def reach(self, page: BasePage, name: str, url: str, path: Callable[[], None]) -> None:
+        """Bring app to checkpoint name at url, through UI path on first use and by restoring its state later
+
+        Name must cover everything the path depends on, like the user.
+        """
+        self.walk(page, [Step(name, url, path)])
+
+    def walk(self, page: BasePage, steps: list[Step]) -> None:
+        """Bring app to the end of a flow, restoring its deepest checkpointed prefix and running the steps after it
+
+        Step names must cover everything their action depends on, like the user.
+        """
+        names = tuple(step.name for step in steps)
+        self.flow = list(names)
+        if not self.enabled:
+            for step in steps:
+                step.action()
+            return
+        depth = next((depth for depth in range(len(steps), 0, -1) if names[:depth] in self.checkpoints), 0)
+        if depth:
+            prefix = names[:depth]
+            self.uses[prefix] += 1
+            if self.validate_every and self.uses[prefix] % self.validate_every == 0:
+                self._run(page, steps[:depth], 0)
+                self.validate(self.capture(page, "/".join(prefix), steps[depth - 1].url), self.checkpoints[prefix])
+                self.stats.validated += 1
+                self.logger.info("Checkpoint '%s' still matches its UI path", "/".join(prefix))
+            else:
+                self.restore(page, self.checkpoints[prefix], prefix)
+        self._run(page, steps, depth)
+
+    def _run(self, page: BasePage, steps: list[Step], start: int) -> None:
+        """Run steps from start through the UI, capturing a checkpoint after each step that has none"""
+        names = tuple(step.name for step in steps)
+        counter = CommandCounter.of(page.driver)
+        for depth in range(start + 1, len(steps) + 1):
+            step, prefix = steps[depth - 1], names[:depth]
+            started, commands = time.perf_counter(), counter.total
+            step.action()
+            landing_url = page.action_get_url()
+            self.step_seconds[prefix] = time.perf_counter() - started
+            self.step_commands[prefix] = counter.total - commands
+            self.stats.steps_run += 1
+            self.stats.step_commands += self.step_commands[prefix]
+            if landing_url != step.url:
+                raise AssertionError(f"Step '{'/'.join(prefix)}' ended on {landing_url}, expected {step.url}")
+            if prefix not in self.checkpoints:
+                self.checkpoints[prefix] = self.capture(page, "/".join(prefix), step.url)
+                self.uses[prefix] += 1
+                self.stats.captured += 1
+                self.logger.info("Captured checkpoint '%s'", "/".join(prefix))
+
+    @staticmethod
+    def capture(page: BasePage, name: str, url: str) -> Checkpoint:
+        """Read cookies and localStorage of the app"""
+        return Checkpoint(
+            name=name,
+            url=url,
+            cookies=page.driver.get_cookies(),
+            local_storage=page.driver.execute_script(READ_STORAGE_SCRIPT),
+        )
+
+    def restore(self, page: BasePage, checkpoint: Checkpoint, prefix: tuple[str, ...]) -> None:
+        """Write checkpoint state into the browser and open its page"""
+        counter = CommandCounter.of(page.driver)
+        started, commands = time.perf_counter(), counter.total
+        self.logger.info("Restoring checkpoint '%s'", checkpoint.name)
+        # Cookies and storage can only be written on the app's origin, pooled browsers are reset to it
+        if not page.action_get_url().startswith(Links.BASE_URL):
+            page.init_site()
+        page.driver.delete_all_cookies()
+        for cookie in checkpoint.cookies:
+            # Expiry is relative to when the checkpoint was captured
+            page.driver.add_cookie({name: value for name, value in cookie.items() if name != "expiry"})
+        page.driver.execute_script(WRITE_STORAGE_SCRIPT, checkpoint.local_storage)
+        page.open_url(checkpoint.url)
+        self.stats.restored += 1
+        self.stats.restore_seconds += time.perf_counter() - started
+        self.stats.restore_commands += counter.total - commands
+        skipped = prefixes(list(prefix))
+        self.stats.steps_skipped += len(skipped)
+        self.stats.skipped_seconds += sum(self.step_seconds.get(step, 0.0) for step in skipped)
+        self.stats.skipped_commands += sum(self.step_commands.get(step, 0) for step in skipped)
+
+    @staticmethod
+    def validate(actual: Checkpoint, expected: Checkpoint) -> None:
+        """Check that the UI path still leads to the state a checkpoint restores"""
+        if actual.state() != expected.state():
+            raise AssertionError(
+                f"Checkpoint '{expected.name}' drifted from its UI path: UI gives {actual.state()}, "
+                f"checkpoint restores {expected.state()}"
+            )
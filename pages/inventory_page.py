@@ -1,13 +1,26 @@
+import json
 import random
+from collections.abc import Iterable
+from urllib.parse import urljoin
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.remote.webelement import WebElement
 
+from data.catalog import PRODUCTS, PRODUCTS_BY_ID, Product
+from data.tests_data import Links
 from locators.page_locators import InventoryPageLocators
 from pages.login_page import LoginPage
 
+# The app keeps the ids of products in the cart as a JSON list, in the order they were added
+SEED_CART_SCRIPT = "window.localStorage.setItem('cart-contents', arguments[0]);"
+
 
 class InventoryPage(LoginPage):
     inventory = InventoryPageLocators()
+    link = "PRODUCTS"
+    ready_locator = InventoryPageLocators.INVENTORY_ITEM
+    # Renders the whole catalog
+    render_budget_ms = 2000
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -22,7 +35,9 @@ class InventoryPage(LoginPage):
 
     def click_logout_button(self) -> None:
         """Click logout button"""
-        self.action_left_click(self.element_is_visible(self.inventory.LOGOUT_BUTTON))
+        button = self.element_is_visible(self.inventory.LOGOUT_BUTTON)
+        with self.transition_to("BASE_URL"):
+            self.action_left_click(button)
 
     def logout(self) -> None:
         """Logout from application"""
@@ -41,19 +56,24 @@ class InventoryPage(LoginPage):
 
     def open_cart_page(self) -> None:
         """Open cart page"""
-        self.action_left_click(self.element_is_visible(self.inventory.CART_ICON))
-
-    def check_cart_count_exists(self) -> bool:
-        """Check if cart count badge exists"""
-        cart_count = self.element_is_present(self.inventory.CART_COUNT)
-        return cart_count is not None
+        button = self.element_is_visible(self.inventory.CART_ICON)
+        with self.transition_to("CART"):
+            self.action_left_click(button)
+
+    def check_cart_count_exists(self, timeout: float | None = None) -> bool:
+        """Check if cart count badge appears, waiting at most the short absence window by default"""
+        try:
+            self.element_is_present(self.inventory.CART_COUNT, self.absence_timeout if timeout is None else timeout)
+        except TimeoutException:
+            return False
+        return True
 
     def check_cart_count_not_exist(self) -> bool:
         """Check if cart count badge doesn't exist"""
         return self.element_is_not_visible(self.inventory.CART_COUNT)
 
     def get_cart_item_count(self) -> int:
-        """Get number of items in cart"""
+        """Get number of items in cart, giving the badge a short window to render after adding products"""
         if self.check_cart_count_exists():
             return int(self.action_get_text(self.inventory.CART_COUNT))
         return 0
@@ -66,33 +86,47 @@ class InventoryPage(LoginPage):
         """Get all product elements"""
         return self.elements_are_visible(self.inventory.INVENTORY_ITEM)
 
+    @staticmethod
+    def parse_item_record(record: dict) -> dict:
+        """Convert raw snapshot fields to product id, price and cart state"""
+        # Get number from id like 'item_4_title_link' -> 4
+        link = record["link"]
+        button = record["button"]
+        return {
+            "id": int(link.split("_")[1]) if link and "item_" in link else None,
+            "name": record["name"],
+            "desc": record["desc"],
+            "price": float(record["price"].replace("$", "")),
+            "in_cart": None if button is None else button.startswith("remove"),
+        }
+
+    def get_product_snapshot(self) -> list[dict]:
+        """Get id, name, desc, price and cart state of all products, scraped once per page state"""
+        return self.page_state.cached("product_snapshot", self._scrape_product_snapshot)
+
+    def _scrape_product_snapshot(self) -> list[dict]:
+        records = self.snapshot_elements(self.inventory.INVENTORY_ITEM, self.inventory.INVENTORY_ITEM_FIELDS)
+        return [self.parse_item_record(record) for record in records]
+
     def get_list_of_product_urls(self) -> list[str]:
         """Get list of product URLs"""
-        product_links = self.elements_are_present(self.inventory.INVENTORY_ITEM_URL)
-        urls = self.action_get_attr_from_elements(product_links, "id")
-        urls_with_id = []
-        for product_id in urls:
-            # Get number from id like 'item_4_title_link' -> '4'
-            if product_id and "item_" in product_id:
-                num_id = product_id.split("_")[1]
-                url = f"https://www.saucedemo.com/inventory-item.html?id={num_id}"
-                urls_with_id.append(url)
-        return urls_with_id
+        return [
+            urljoin(Links.BASE_URL, f"inventory-item.html?id={product['id']}")
+            for product in self.get_product_snapshot()
+            if product["id"] is not None
+        ]
 
     def get_list_of_product_names(self) -> list[str]:
         """Get list of product names"""
-        product_names = self.elements_are_visible(self.inventory.INVENTORY_ITEM_NAME)
-        return self.action_get_text_from_elements(product_names)
+        return [product["name"] for product in self.get_product_snapshot()]
 
     def get_list_of_product_descs(self) -> list[str]:
         """Get list of product descriptions"""
-        product_descs = self.elements_are_visible(self.inventory.INVENTORY_ITEM_DESC)
-        return self.action_get_text_from_elements(product_descs)
+        return [product["desc"] for product in self.get_product_snapshot()]
 
     def get_list_of_product_prices(self) -> list[float]:
         """Get list of product prices"""
-        product_prices = self.elements_are_visible(self.inventory.INVENTORY_ITEM_PRICE)
-        return [float(price.text.replace("$", "")) for price in product_prices]
+        return [product["price"] for product in self.get_product_snapshot()]
 
     def get_list_of_add_to_cart_buttons(self) -> list[WebElement]:
         """Get all add to cart buttons"""
@@ -108,6 +142,21 @@ class InventoryPage(LoginPage):
         self.logger.info(f"Adding {len(add_to_cart_buttons)} products to cart")
         self.action_left_click_on_elements(add_to_cart_buttons)
 
+    def seed_cart(self, product_ids: Iterable[int] | None = None) -> list[Product]:
+        """Put products in cart without clicking, all products by default, and return their catalog records
+
+        Writes the app's cart-contents entry and reloads the current page, so the badge and the add and remove
+        buttons show the seeded cart. The browser must be on the app, like after authenticated_as.
+        """
+        ids = [product.id for product in PRODUCTS] if product_ids is None else list(dict.fromkeys(product_ids))
+        unknown = [product_id for product_id in ids if product_id not in PRODUCTS_BY_ID]
+        if unknown:
+            raise ValueError(f"No products with ids {unknown} in catalog")
+        self.logger.info(f"Seeding cart with {len(ids)} products")
+        self.driver.execute_script(SEED_CART_SCRIPT, json.dumps(ids))
+        self.navigate(self.action_get_url())
+        return [PRODUCTS_BY_ID[product_id] for product_id in ids]
+
     def remove_all_from_cart(self) -> None:
         """Remove all products from cart"""
         remove_from_cart_buttons = self.get_list_of_remove_from_cart_buttons()
@@ -1,9 +1,22 @@
+import os
+
+from selenium.webdriver.support import expected_conditions as expected
+
+from data.tests_data import Links
 from locators.page_locators import LoginPageLocators
 from pages.base_page import BasePage
 
+LOGIN_BYPASS = os.getenv("LOGIN_BYPASS", "true").strip().lower() != "false"
+SESSION_COOKIE = "session-username"
+
 
 class LoginPage(BasePage):
     login_page = LoginPageLocators()
+    link = "BASE_URL"
+    ready_locator = LoginPageLocators.LOGIN_BUTTON
+    render_budget_ms = 1000
+    # Users whose injected session was compared against a real UI login in this process
+    verified_users: set[str] = set()
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -26,7 +39,9 @@ class LoginPage(BasePage):
     def click_login_button(self) -> None:
         """Click login button"""
         self.logger.info("Clicking login button")
-        self.action_left_click(self.element_is_visible(self.login_page.LOGIN_BUTTON))
+        button = self.element_is_visible(self.login_page.LOGIN_BUTTON)
+        with self.transition_to("PRODUCTS", unless=self.login_page.ERROR_MESSAGE):
+            self.action_left_click(button)
 
     def login(self, username: str, password: str) -> None:
         """Perform login with credentials"""
@@ -76,3 +91,52 @@ class LoginPage(BasePage):
     def click_login_error_button(self) -> None:
         """Click error message close button"""
         self.action_left_click(self.element_is_visible(self.login_page.ERROR_BUTTON))
+
+    def set_session_cookie(self, username: str) -> None:
+        """Set app session cookie without going through login form"""
+        cookie = {"name": SESSION_COOKIE, "value": username, "path": "/"}
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Network.setCookie", {**cookie, "url": Links.BASE_URL})
+            return
+        if not self.action_get_url().startswith(Links.BASE_URL):
+            self.init_site()
+        self.driver.add_cookie(cookie)
+
+    def authenticated_as(self, username: str, password: str | None = None, url: str | None = None) -> None:
+        """Open page as logged in user by injecting session cookie"""
+        url = url or Links.PRODUCTS
+        if not LOGIN_BYPASS:
+            self.open_login_page()
+            self.login(username, password)
+            if url != Links.PRODUCTS:
+                self.open_url(url)
+            return
+        if password is not None and username not in LoginPage.verified_users:
+            self.verify_session_injection(username, password)
+        self.logger.info(f"Injecting session for: {username}")
+        self.set_session_cookie(username)
+        self.open_url(url)
+
+    def verify_session_injection(self, username: str, password: str) -> None:
+        """Check that injected session matches state after real UI login"""
+        self.logger.info(f"Verifying session injection against UI login: {username}")
+        self.open_login_page()
+        login_url = self.action_get_url()
+        self.login(username, password)
+        self.wait.until(expected.url_changes(login_url))
+        real_url = self.action_get_url()
+        real_cookie = self.driver.get_cookie(SESSION_COOKIE)
+
+        self.driver.delete_all_cookies()
+        self.set_session_cookie(username)
+        self.open_url(Links.PRODUCTS)
+        injected_cookie = self.driver.get_cookie(SESSION_COOKIE)
+        landing_url = self.action_get_url()
+
+        if real_cookie is None:
+            raise AssertionError(f"UI login did not set '{SESSION_COOKIE}' cookie")
+        real_state = (real_cookie["value"], real_cookie["path"], real_url)
+        injected_state = (injected_cookie["value"], injected_cookie["path"], landing_url) if injected_cookie else None
+        if real_state != injected_state:
+            raise AssertionError(f"Injected session {injected_state} does not match UI login {real_state}")
+        LoginPage.verified_users.add(username)
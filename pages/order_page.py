@@ -4,6 +4,9 @@ from pages.cart_page import CartPage
 
 class OrderPage(CartPage):
     order = OrderPageLocators()
+    link = "ORDER"
+    ready_locator = OrderPageLocators.BACK_BUTTON
+    render_budget_ms = 1000
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -22,4 +25,6 @@ class OrderPage(CartPage):
 
     def click_order_back_button(self) -> None:
         """Click back button"""
-        self.action_left_click(self.element_is_visible(self.order.BACK_BUTTON))
+        button = self.element_is_visible(self.order.BACK_BUTTON)
+        with self.transition_to("PRODUCTS"):
+            self.action_left_click(button)
@@ -6,6 +6,9 @@ from pages.cart_page import CartPage
 
 class OverviewPage(CartPage):
     overview = OverviewPageLocators()
+    link = "OVERVIEW"
+    ready_locator = OverviewPageLocators.FINISH_BUTTON
+    render_budget_ms = 1000
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -16,8 +19,7 @@ class OverviewPage(CartPage):
 
     def get_list_of_overview_item_prices(self) -> list[float]:
         """Get list of item prices"""
-        item_prices = self.elements_are_visible(self.overview.ITEM_PRICE)
-        return [float(price.text.replace("$", "")) for price in item_prices]
+        return [item["price"] for item in self.get_cart_snapshot()]
 
     def calc_overview_item_total_price(self) -> float:
         """Calculate total price of items"""
@@ -73,8 +75,12 @@ class OverviewPage(CartPage):
 
     def click_cancel_overview(self) -> None:
         """Click cancel button"""
-        self.action_left_click(self.element_is_visible(self.overview.CANCEL_BUTTON))
+        button = self.element_is_visible(self.overview.CANCEL_BUTTON)
+        with self.transition_to("PRODUCTS"):
+            self.action_left_click(button)
 
     def click_finish_overview(self) -> None:
         """Click finish button"""
-        self.action_left_click(self.element_is_visible(self.overview.FINISH_BUTTON))
+        button = self.element_is_visible(self.overview.FINISH_BUTTON)
+        with self.transition_to("ORDER"):
+            self.action_left_click(button)
@@ -4,6 +4,9 @@ from pages.inventory_page import InventoryPage
 
 class ProductPage(InventoryPage):
     product = ProductPageLocators()
+    link = "PRODUCT"
+    ready_locator = ProductPageLocators.BACK_BUTTON
+    render_budget_ms = 1000
 
     def __init__(self, driver):
         super().__init__(driver)
@@ -31,4 +34,6 @@ class ProductPage(InventoryPage):
 
     def click_back_to_products_button(self) -> None:
         """Click back to products button"""
-        self.action_left_click(self.element_is_visible(self.product.BACK_BUTTON))
+        button = self.element_is_visible(self.product.BACK_BUTTON)
+        with self.transition_to("PRODUCTS"):
+            self.action_left_click(button)
@@ -0,0 +1,76 @@
+import time
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.base_page import BasePage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.inventory_page import InventoryPage
+from pages.login_page import LoginPage
+from pages.order_page import OrderPage
+from pages.overview_page import OverviewPage
+from pages.product_page import ProductPage
+
+PAGE_CLASSES: dict[str, type[BasePage]] = {
+    "login_page": LoginPage,
+    "inventory_page": InventoryPage,
+    "product_page": ProductPage,
+    "cart_page": CartPage,
+    "checkout_page": CheckoutPage,
+    "overview_page": OverviewPage,
+    "order_page": OrderPage,
+}
+
+
+@dataclass
+class PageStats:
+    """Counters and timings collected by page registries"""
+
+    setups: int = 0
+    setup_seconds: float = 0.0
+    offered: int = 0
+    built: int = 0
+    build_seconds: float = 0.0
+
+    @property
+    def avg_build(self) -> float:
+        return self.build_seconds / self.built if self.built else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated time saved by not building page objects that tests never used"""
+        return (self.offered - self.built) * self.avg_build
+
+    def summary_lines(self) -> list[str]:
+        return [
+            f"Page objects built: {self.built} of {self.offered} offered (avg {self.avg_build * 1000:.3f}ms)",
+            f"pages fixture setup: {self.setup_seconds * 1000:.1f}ms total over {self.setups} tests",
+            f"Estimated time saved by lazy construction: {self.saved_seconds * 1000:.1f}ms",
+        ]
+
+
+class PageRegistry(Mapping):
+    """Page objects of one test, each built on first access"""
+
+    def __init__(self, driver: WebDriver, stats: PageStats | None = None, classes: dict = PAGE_CLASSES):
+        self.driver = driver
+        self.stats = stats or PageStats()
+        self.classes = classes
+        self.built: dict[str, BasePage] = {}
+        self.stats.offered += len(classes)
+
+    def __getitem__(self, name: str) -> BasePage:
+        if name not in self.built:
+            started = time.perf_counter()
+            self.built[name] = self.classes[name](self.driver)
+            self.stats.built += 1
+            self.stats.build_seconds += time.perf_counter() - started
+        return self.built[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.classes)
+
+    def __len__(self) -> int:
+        return len(self.classes)
@@ -1,44 +1,121 @@
+import glob
+import json
 import os
+import platform
+import time
+from dataclasses import asdict
+from datetime import datetime
 
 import pytest
 from dotenv import load_dotenv
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-
-from pages.cart_page import CartPage
-from pages.checkout_page import CheckoutPage
-from pages.inventory_page import InventoryPage
-from pages.login_page import LoginPage
-from pages.order_page import OrderPage
-from pages.overview_page import OverviewPage
-from pages.product_page import ProductPage
-from utils.generator import DataGenerator
-from utils.logger import get_logger, log_test_end, log_test_start
+
+from data.tests_data import Links
+from pages.base_page import PAGE_LOAD_STRATEGY, PERF_BUDGETS, WAIT_ENGINE, BasePage
+from pages.checkpoints import CheckpointStats, CheckpointStore
+from pages.registry import PageRegistry, PageStats
+from utils.action_timings import REPORTS_DIR, action_timings, percentile
+from utils.browser_profile import FAST_PROFILE, save_profile_template, set_asset_blocking
+from utils.chromedriver import chromedriver_path
+from utils.command_counter import CommandCounter
+from utils.driver_factory import HEADLESS, create_driver
+from utils.driver_pool import DriverPool
+from utils.durations import load_durations, partition, save_durations
+from utils.flows import FlowTrie, save_flows
+from utils.generator import IdentityPool
+from utils.local_server import LocalServer
+from utils.logger import get_logger, log_filepath, log_test_end, log_test_start, merge_logs, stop_logging
+from utils.page_context import PageContext
+from utils.run_history import RUN_HISTORY, RunHistoryPlugin
 
 load_dotenv()
 
-HEADLESS_VALUE = os.getenv("HEADLESS", "headless").strip().lower()
-HEADLESS = HEADLESS_VALUE != "ui"
-CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "/usr/bin/chromedriver")
+REUSE_BROWSER = os.getenv("REUSE_BROWSER", "true").strip().lower() != "false"
+POOL_SPARES = int(os.getenv("POOL_SPARES", "0"))
+POOL_MAX_SIZE = int(os.getenv("POOL_MAX_SIZE", "0"))
+POOL_IDLE_TIMEOUT = float(os.getenv("POOL_IDLE_TIMEOUT", "0"))
+POOL_MAX_MEMORY_MB = float(os.getenv("POOL_MAX_MEMORY_MB", "0"))
+LOCAL_SERVER = os.getenv("LOCAL_SERVER", "false").strip().lower() == "true"
+LOCAL_SERVER_HOST = os.getenv("LOCAL_SERVER_HOST", "127.0.0.1")
+LOCAL_SERVER_PORT = int(os.getenv("LOCAL_SERVER_PORT", "8765"))
 
+COMMAND_COUNTS_FILE = os.path.join(REPORTS_DIR, "command_counts.json")
+TRANSITIONS_FILE = os.path.join(REPORTS_DIR, "transitions.json")
 
-def _get_chromedriver_path() -> str:
-    """Return path to ChromeDriver, downloading via webdriver-manager if needed."""
-    if os.path.exists(CHROMEDRIVER_PATH):
-        return CHROMEDRIVER_PATH
-    return ChromeDriverManager().install()
+# Pool and page stats are kept at module level so the terminal summary can report them
+_driver_pool = None
+_local_server: LocalServer | None = None
+_page_stats = PageStats()
+_checkpoints = CheckpointStore()
+# Per-test durations of this run and collection order reported by xdist workers
+_durations: dict[str, float] = {}
+_collection_order: list[str] = []
+# WebDriver commands sent by each test, reported by xdist workers through user_properties
+_command_counts: dict[str, dict] = {}
+# Page transitions timed in each test, reported the same way
+_transitions: dict[str, list[dict]] = {}
+# Flow steps each test walked and checkpoint use of all tests, reported the same way
+_flows: dict[str, list[str]] = {}
+_checkpoint_stats = CheckpointStats()
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def preload_chromedriver():
-    """Warm up ChromeDriver cache before running tests."""
-    _get_chromedriver_path()
+    """Resolve ChromeDriver once before the first browser test, tests without a browser don't need it."""
+    chromedriver_path()
+
+
+def pytest_addoption(parser):
+    """Add --shard option for splitting the suite across CI machines."""
+    parser.addoption(
+        "--shard",
+        default=None,
+        help="run only shard i of N (e.g. 2/4), balanced by recorded test durations",
+    )
+
+
+def _parse_shard(value: str) -> tuple[int, int]:
+    index, _, count = value.partition("/")
+    if not (index.isdigit() and count.isdigit() and 1 <= int(index) <= int(count)):
+        raise pytest.UsageError(f"--shard expects i/N with 1 <= i <= N, got {value!r}")
+    return int(index), int(count)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep only tests of the selected shard, the same split on every machine for the same history."""
+    if not config.getoption("shard"):
+        return
+    index, count = _parse_shard(config.getoption("shard"))
+    selected = set(partition([item.nodeid for item in items], load_durations(), count)[index - 1])
+    deselected = [item for item in items if item.nodeid not in selected]
+    items[:] = [item for item in items if item.nodeid in selected]
+    config.hook.pytest_deselected(items=deselected)
+
+
+def _is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
 
 
 def pytest_configure(config):
-    """Ensure reports directory exists before test run."""
+    """Ensure reports directory exists and point links at local server before collection."""
+    global _local_server
+    config.addinivalue_line("markers", "assets: load images and fonts even when FAST_PROFILE blocks them")
+    config.addinivalue_line("markers", "max_commands(limit): fail test if it sends more WebDriver commands than limit")
+
+    # Workers inherit environment of the controller, so their log files share its run id
+    if not _is_xdist_worker(config):
+        os.environ.setdefault("LOG_RUN_ID", datetime.now().strftime("%Y%m%d_%H%M%S"))
+
+    if LOCAL_SERVER:
+        # Same URLs, and so the same node ids, in every process; xdist requires that for the collections to match
+        Links.rebase(f"http://{LOCAL_SERVER_HOST}:{LOCAL_SERVER_PORT}/")
+        # One server in the controller process serves the browsers of all workers
+        if not _is_xdist_worker(config) and not config.option.collectonly:
+            _local_server = LocalServer(LOCAL_SERVER_HOST, LOCAL_SERVER_PORT)
+            _local_server.start()
+
+    if RUN_HISTORY and not _is_xdist_worker(config) and not config.option.collectonly:
+        config.pluginmanager.register(RunHistoryPlugin(_history_settings(config)), "run_history")
+
     project_root = os.path.dirname(os.path.dirname(__file__))
     reports_dir = os.path.join(project_root, "reports")
 
@@ -50,6 +127,20 @@ def pytest_configure(config):
         raise PermissionError(f"Reports directory '{reports_dir}' is not writable")
 
 
+def _history_settings(config) -> dict:
+    """Settings that change how fast tests run, runs are only compared with runs that share them"""
+    return {
+        "base_url": Links.BASE_URL,
+        "headless": HEADLESS,
+        "reuse_browser": REUSE_BROWSER,
+        "fast_profile": FAST_PROFILE,
+        "page_load_strategy": PAGE_LOAD_STRATEGY,
+        "wait_engine": WAIT_ENGINE,
+        "workers": getattr(config.option, "numprocesses", None),
+        "platform": platform.platform(terse=True),
+    }
+
+
 @pytest.fixture(scope="function", autouse=True)
 def log_test_execution(request):
     """Log test execution start and end."""
@@ -64,73 +155,253 @@ def log_test_execution(request):
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Store test result for logging."""
+    """Store test result for logging and check WebDriver command and render time budgets."""
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
 
+    counter = getattr(item, "command_counter", None)
+    if rep.when != "call" or counter is None:
+        return
+    if _checkpoints.flow:
+        rep.user_properties.append(("flow", _checkpoints.flow))
+        rep.user_properties.append(("checkpoints", asdict(_checkpoints.stats)))
+    summary = counter.summary()
+    rep.user_properties.append(("webdriver_commands", summary))
+    transitions = list(item.page_context.transitions)
+    if transitions:
+        rep.user_properties.append(("transitions", transitions))
+    if not rep.passed:
+        return
+
+    # Budget failures of a passing test, all of them are reported, the command budget first
+    failures = []
+    budget = item.get_closest_marker("max_commands")
+    if budget is not None and summary["total"] > budget.args[0]:
+        top = ", ".join(f"{name}={value['count']}" for name, value in list(summary["commands"].items())[:5])
+        failures.append(f"Test sent {summary['total']} WebDriver commands, budget is {budget.args[0]} ({top})")
+    over = [transition for transition in transitions if _over_budget(transition)]
+    if over and PERF_BUDGETS == "fail":
+        failures.append(
+            "Pages rendered over budget: "
+            + ", ".join(f"{t['from']} -> {t['to']} {t['ready_ms']:.0f}ms (budget {t['budget_ms']:.0f}ms)" for t in over)
+        )
+    if failures:
+        rep.outcome = "failed"
+        rep.longrepr = "\n".join(failures)
+
+
+def _over_budget(transition: dict) -> bool:
+    return transition["budget_ms"] is not None and transition["ready_ms"] > transition["budget_ms"]
+
+
+def pytest_runtest_logreport(report):
+    """Add up setup, call and teardown time of every test and collect its command counts, transitions and flow."""
+    _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + report.duration
+    for name, value in report.user_properties:
+        if name == "webdriver_commands":
+            _command_counts[report.nodeid] = value
+        elif name == "transitions":
+            _transitions[report.nodeid] = value
+        elif name == "flow":
+            _flows[report.nodeid] = value
+        elif name == "checkpoints":
+            _checkpoint_stats.add(CheckpointStats(**value))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_node_collection_finished(node, ids):
+    """Remember collection order, workers all collect the same tests."""
+    if not _collection_order:
+        _collection_order.extend(ids)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Balance tests across workers by recorded durations and keep shared flow prefixes on one worker."""
+    if config.getoption("dist") != "load":
+        return None
+    from utils.xdist_scheduler import DurationScheduling
+
+    return DurationScheduling(config, log)
+
+
+def pytest_unconfigure(config):
+    """Stop local server once the controller and all workers are done."""
+    if _local_server is not None:
+        _local_server.stop()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Save durations for the next run, export run statistics and merge worker logs into one serial-ordered log."""
+    if _is_xdist_worker(session.config):
+        if action_timings.samples:
+            worker = session.config.workerinput["workerid"]
+            action_timings.dump(os.path.join(REPORTS_DIR, f"action_timings_{worker}.json"))
+        # Write out queued records before the worker reports it is finished
+        stop_logging()
+        return
+    action_timings.merge_files(os.path.join(REPORTS_DIR, "action_timings_gw*.json"))
+    if action_timings.samples:
+        action_timings.export()
+    if _durations:
+        save_durations(_durations)
+    if _flows:
+        save_flows(_flows)
+    if _command_counts:
+        with open(COMMAND_COUNTS_FILE, "w", encoding="utf-8") as file:
+            json.dump(_command_counts, file, indent=2)
+    if _transitions:
+        with open(TRANSITIONS_FILE, "w", encoding="utf-8") as file:
+            json.dump(_transitions, file, indent=2)
+    worker_logs = sorted(glob.glob(log_filepath("gw*")))
+    if worker_logs:
+        # Controller keeps its log file open, flush it and write the merged log to a file of its own
+        stop_logging()
+        controller_log = [path for path in [log_filepath()] if os.path.exists(path)]
+        merge_logs(controller_log + worker_logs, log_filepath("merged"), _collection_order)
+
+
+@pytest.fixture(scope="session")
+def driver_pool(preload_chromedriver):
+    """Keep browsers alive for the whole session (per xdist worker)."""
+    global _driver_pool
+    _driver_pool = DriverPool(
+        create_driver,
+        reuse=REUSE_BROWSER,
+        spares=POOL_SPARES,
+        max_size=POOL_MAX_SIZE,
+        idle_timeout=POOL_IDLE_TIMEOUT,
+        max_memory_mb=POOL_MAX_MEMORY_MB,
+    )
+    yield _driver_pool
+    # Keep a warmed up profile alive past its browser, it is copied once Chrome has quit and flushed it
+    profile = getattr(_driver_pool.idle[-1][0], "profile_dir", None) if FAST_PROFILE and _driver_pool.idle else None
+    _driver_pool.close()
+    if profile is not None:
+        save_profile_template(profile.name)
+
 
 @pytest.fixture(scope="function")
-def driver():
-    """Initialize Chrome WebDriver with disabled popups and automation detection."""
-    options = Options()
-
-    # Turn off password popups
-    prefs = {
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "profile.password_manager_leak_detection": False,
-    }
-    options.add_experimental_option("prefs", prefs)
-
-    # Chrome args to make tests stable
-    base_arguments = [
-        "--window-size=1920,1080",
-        "--no-sandbox",
-        "--disable-dev-shm-usage",
-        "--disable-features=PasswordCheck,PasswordLeakDetection,SafetyTipUI,PasswordManagerOnboarding",
-        "--disable-save-password-bubble",
-        "--disable-notifications",
-        "--disable-infobars",
-        "--disable-extensions",
-        "--disable-blink-features=AutomationControlled",
-        "--no-first-run",
-        "--disable-search-engine-choice-screen",
-    ]
-
-    # Add headless if needed
-    if HEADLESS:
-        options.add_argument("--headless")
-        options.add_argument("--disable-gpu")
-
-    for argument in base_arguments:
-        options.add_argument(argument)
-
-    # Setup ChromeDriver
-    chromedriver_path = _get_chromedriver_path()
-    service = ChromeService(executable_path=chromedriver_path)
-
-    # Create driver
-    driver = webdriver.Chrome(service=service, options=options)
+def driver(driver_pool, request):
+    """Provide a pooled Chrome WebDriver with clean cookies and storage."""
+    driver = driver_pool.acquire()
+    if FAST_PROFILE:
+        set_asset_blocking(driver, request.node.get_closest_marker("assets") is None)
+    # Count only the test's own commands, not pool health checks and resets
+    request.node.command_counter = CommandCounter.of(driver)
+    request.node.command_counter.reset()
+    request.node.page_context = PageContext.of(driver)
+    request.node.page_context.transitions.clear()
+    _checkpoints.start_test()
     yield driver
-    driver.quit()
+    driver_pool.release(driver)
+
+
+def _command_summary_lines() -> list[str]:
+    by_command: dict[str, list[float]] = {}
+    for counts in _command_counts.values():
+        for name, value in counts["commands"].items():
+            totals = by_command.setdefault(name, [0, 0.0])
+            totals[0] += value["count"]
+            totals[1] += value["seconds"]
+    total = sum(counts["total"] for counts in _command_counts.values())
+    seconds = sum(counts["seconds"] for counts in _command_counts.values())
+    lines = [f"{total} commands in {seconds:.1f}s over {len(_command_counts)} tests, details in {COMMAND_COUNTS_FILE}"]
+    for name, (count, command_seconds) in sorted(by_command.items(), key=lambda item: -item[1][0])[:8]:
+        lines.append(f"  {name}: {count} ({command_seconds * 1000 / count:.1f}ms avg)")
+    lines.append("Chattiest tests:")
+    for nodeid, counts in sorted(_command_counts.items(), key=lambda item: -item[1]["total"])[:5]:
+        lines.append(f"  {counts['total']:>5} {nodeid}")
+    return lines
+
+
+def _transition_summary_lines() -> list[str]:
+    by_route: dict[str, list[float]] = {}
+    over = []
+    for nodeid, transitions in _transitions.items():
+        for transition in transitions:
+            by_route.setdefault(f"{transition['from']} -> {transition['to']}", []).append(transition["ready_ms"])
+            if _over_budget(transition):
+                over.append((nodeid, transition))
+    lines = [f"Time from action to rendered page, details in {TRANSITIONS_FILE}"]
+    for route, timings in sorted(by_route.items()):
+        timings = sorted(timings)
+        lines.append(
+            f"  {route}: {len(timings)} transitions, p50 {percentile(timings, 50):.0f}ms, "
+            f"p95 {percentile(timings, 95):.0f}ms"
+        )
+    if over:
+        lines.append(f"Over render budget ({len(over)}):")
+        for nodeid, transition in over[:10]:
+            lines.append(
+                f"  {transition['to']} {transition['ready_ms']:.0f}ms > {transition['budget_ms']:.0f}ms in {nodeid}"
+            )
+    return lines
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report how much time browser reuse and lazy page objects saved and how long navigation took."""
+    if _driver_pool is not None:
+        terminalreporter.write_sep("-", "browser pool")
+        for line in _driver_pool.stats.summary_lines():
+            terminalreporter.write_line(line)
+    if _page_stats.setups:
+        terminalreporter.write_sep("-", "page objects")
+        for line in _page_stats.summary_lines():
+            terminalreporter.write_line(line)
+    if _flows:
+        terminalreporter.write_sep("-", "checkpoints")
+        for line in _checkpoint_stats.summary_lines() + FlowTrie(_flows).summary_lines():
+            terminalreporter.write_line(line)
+    if _command_counts:
+        terminalreporter.write_sep("-", "webdriver commands")
+        for line in _command_summary_lines():
+            terminalreporter.write_line(line)
+    if action_timings.samples:
+        terminalreporter.write_sep("-", "page object actions")
+        for line in action_timings.summary_lines():
+            terminalreporter.write_line(line)
+    if _transitions:
+        terminalreporter.write_sep("-", f"page transitions (budgets: {PERF_BUDGETS})")
+        for line in _transition_summary_lines():
+            terminalreporter.write_line(line)
+    if BasePage.navigation_timings:
+        terminalreporter.write_sep("-", f"navigation (page load strategy: {PAGE_LOAD_STRATEGY})")
+        for page, timings in sorted(BasePage.navigation_timings.items()):
+            timings = sorted(timings)
+            terminalreporter.write_line(
+                f"{page}: {len(timings)} navigations, median {timings[len(timings) // 2] * 1000:.0f}ms, "
+                f"max {timings[-1] * 1000:.0f}ms"
+            )
 
 
 @pytest.fixture(scope="function")
 def pages(driver):
-    """Initialize all page objects for tests."""
-    login_page = LoginPage(driver)
-    inventory_page = InventoryPage(driver)
-    product_page = ProductPage(driver)
-    cart_page = CartPage(driver)
-    checkout_page = CheckoutPage(driver)
-    overview_page = OverviewPage(driver)
-    order_page = OrderPage(driver)
-    return locals()
+    """Provide page objects for tests, each built on first access."""
+    started = time.perf_counter()
+    registry = PageRegistry(driver, _page_stats)
+    _page_stats.setups += 1
+    _page_stats.setup_seconds += time.perf_counter() - started
+    return registry
+
+
+@pytest.fixture(scope="session")
+def checkpoints():
+    """Provide app state checkpoints shared by all tests of the session."""
+    return _checkpoints
+
+
+@pytest.fixture(scope="session")
+def data_pool():
+    """Provide seeded checkout identities shared by all tests, Faker loads only if the pool needs refilling."""
+    return IdentityPool()
 
 
 @pytest.fixture(scope="function")
-def data():
-    """Initialize test data generator (Faker)."""
-    generator = DataGenerator()
-    return locals()
+def data(data_pool, request):
+    """Provide test data generator drawing from the shared pool with a per-test seed."""
+    seed = data_pool.test_seed(request.node.nodeid)
+    get_logger("TestData").debug("Test data seed %s (DATA_SEED=%s)", seed, data_pool.seed)
+    return {"generator": data_pool.generator(seed)}
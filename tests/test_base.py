@@ -1,11 +1,43 @@
 import pytest
 
+from data.tests_data import Links
+from pages.checkpoints import Step
+
 
 class BaseTest:
     """Base test class with common fixtures"""
 
     @pytest.fixture(autouse=True)
-    def injector(self, pages, data):
-        """Inject pages and data fixtures into test class"""
+    def injector(self, pages, data, checkpoints):
+        """Inject pages, data and checkpoints fixtures into test class"""
         self.pages = pages
         self.data = data
+        self.checkpoints = checkpoints
+
+    def checkout_flow(self, username, password) -> list[Step]:
+        """Steps from login to the checkout form, tests walk the prefix they start from"""
+        return [
+            Step(
+                f"login:{username}",
+                Links.PRODUCTS,
+                lambda: self.pages["login_page"].authenticated_as(username, password),
+            ),
+            Step("cart", Links.CART, lambda: self.pages["inventory_page"].open_cart_page()),
+            Step("checkout", Links.CHECKOUT, lambda: self.pages["cart_page"].click_checkout()),
+        ]
+
+    def overview_flow(self, username, password) -> list[Step]:
+        """Checkout flow followed by submitting the test's checkout data, which names the step
+
+        Tests only share the overview checkpoint when their checkout data is the same.
+        """
+        first_name = self.data["generator"].first_name()
+        last_name = self.data["generator"].last_name()
+        zip_code = self.data["generator"].zip_code()
+
+        def fill_checkout_form():
+            self.pages["checkout_page"].fill_checkout_form(first_name, last_name, zip_code)
+            self.pages["checkout_page"].click_continue_checkout()
+
+        overview = Step(f"overview:{first_name}|{last_name}|{zip_code}", Links.OVERVIEW, fill_checkout_form)
+        return [*self.checkout_flow(username, password), overview]
@@ -20,8 +20,7 @@ class TestCart(BaseTest):
         """Test opening cart page"""
         log_test_start(self.logger, "test_open_cart", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_cart_page()
         actual_cart_title = self.pages["cart_page"].get_cart_page_title()
         expected_cart_title = expected_title
@@ -50,9 +49,7 @@ class TestCart(BaseTest):
         """Test continue shopping button from cart"""
         log_test_start(self.logger, "test_click_continue_shopping", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
+        self.checkpoints.walk(self.pages["cart_page"], self.checkout_flow(username, password)[:2])
         self.pages["cart_page"].click_continue_shopping()
         actual_title_after_back_from_cart = self.pages["inventory_page"].get_products_page_title()
         expected_title_after_back_from_cart = expected_title
@@ -88,17 +85,22 @@ class TestCart(BaseTest):
         """Test removing all items from cart"""
         log_test_start(self.logger, "test_remove_all_from_cart", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].add_all_to_cart()
+        self.pages["login_page"].authenticated_as(username, password)
+        self.pages["inventory_page"].seed_cart()
         actual_product_count = self.pages["inventory_page"].get_products_count()
         expected_cart_item_count = self.pages["inventory_page"].get_cart_item_count()
+        actual_remove_button_count = len(self.pages["inventory_page"].get_list_of_remove_from_cart_buttons())
 
         log_assertion(self.logger, expected_cart_item_count, actual_product_count, "Cart count matches product count")
         assert expected_cart_item_count == actual_product_count, (
             f"The actual product count '{actual_product_count}' does not match the expected cart item count '{expected_cart_item_count}'"
         )
 
+        log_assertion(self.logger, actual_product_count, actual_remove_button_count, "Every product shows remove")
+        assert actual_remove_button_count == actual_product_count, (
+            f"Only {actual_remove_button_count} of {actual_product_count} products show a remove button after seeding"
+        )
+
         self.pages["inventory_page"].open_cart_page()
         self.pages["cart_page"].remove_all_from_cart()
         expected_cart_is_empty = self.pages["cart_page"].check_cart_is_empty()
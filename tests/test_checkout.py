@@ -10,6 +10,10 @@ class TestCheckout(BaseTest):
 
     logger = get_logger(__name__)
 
+    def open_checkout(self, username, password):
+        """Open checkout form as user, restored from a checkpoint after the first time"""
+        self.checkpoints.walk(self.pages["checkout_page"], self.checkout_flow(username, password))
+
     @pytest.mark.parametrize(
         "username, password, expected_title, expected_url",
         [(Users.STANDARD_USER_NAME, Users.STANDARD_USER_PASSWORD, CheckoutPage.CHECKOUT_TITLE, Links.CHECKOUT)],
@@ -18,8 +22,7 @@ class TestCheckout(BaseTest):
         """Test opening checkout page"""
         log_test_start(self.logger, "test_open_checkout", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_cart_page()
         self.pages["cart_page"].click_checkout()
         actual_checkout_title = self.pages["checkout_page"].get_checkout_page_title()
@@ -47,10 +50,7 @@ class TestCheckout(BaseTest):
         """Test cancel checkout button"""
         log_test_start(self.logger, "test_cancel_checkout", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
+        self.open_checkout(username, password)
         self.pages["checkout_page"].click_cancel_checkout()
         actual_title_after_cancel_checkout = self.pages["cart_page"].get_cart_page_title()
         expected_title_after_cancel_checkout = expected_title
@@ -87,8 +87,7 @@ class TestCheckout(BaseTest):
         """Test filling checkout form"""
         log_test_start(self.logger, "test_fill_checkout", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_cart_page()
         self.pages["cart_page"].click_checkout()
         check_form = self.pages["checkout_page"].check_checkout_form()
@@ -142,10 +141,7 @@ class TestCheckout(BaseTest):
         """Test mandatory first name field"""
         log_test_start(self.logger, "test_mandatory_first_name", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
+        self.open_checkout(username, password)
         last_name = self.data["generator"].last_name()
         zip_code = self.data["generator"].zip_code()
         self.pages["checkout_page"].enter_last_name(last_name)
@@ -174,10 +170,7 @@ class TestCheckout(BaseTest):
         """Test mandatory last name field"""
         log_test_start(self.logger, "test_mandatory_last_name", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
+        self.open_checkout(username, password)
         first_name = self.data["generator"].first_name()
         zip_code = self.data["generator"].zip_code()
         self.pages["checkout_page"].enter_first_name(first_name)
@@ -206,10 +199,7 @@ class TestCheckout(BaseTest):
         """Test mandatory zip code field"""
         log_test_start(self.logger, "test_mandatory_zip_code", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
+        self.open_checkout(username, password)
         first_name = self.data["generator"].first_name()
         last_name = self.data["generator"].last_name()
         self.pages["checkout_page"].enter_first_name(first_name)
@@ -235,10 +225,7 @@ class TestCheckout(BaseTest):
         """Test closing error message"""
         log_test_start(self.logger, "test_close_error_message", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
+        self.open_checkout(username, password)
         self.pages["checkout_page"].click_continue_checkout()
         self.pages["checkout_page"].click_checkout_error_button()
         actual_error_message_not_exist = self.pages["checkout_page"].error_checkout_message_not_exist()
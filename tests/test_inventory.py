@@ -20,8 +20,7 @@ class TestInventory(BaseTest):
         """Test menu links are displayed correctly"""
         log_test_start(self.logger, "test_check_menu_links", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_hamburger_menu()
         actual_menu_links = self.pages["inventory_page"].get_menu_links_text()
         expected_menu_links = expected_links
@@ -38,8 +37,7 @@ class TestInventory(BaseTest):
         """Test purchasing single item"""
         log_test_start(self.logger, "test_purchase_one_item", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_random_product()
         actual_product_price = self.pages["product_page"].get_product_price()
         self.pages["product_page"].click_add_product_to_cart()
@@ -91,15 +89,19 @@ class TestInventory(BaseTest):
         """Test purchasing all items"""
         log_test_start(self.logger, "test_purchase_all_item", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
+        seeded_product_names = [product.name for product in self.pages["inventory_page"].seed_cart()]
         all_product_names = self.pages["inventory_page"].get_list_of_product_names()
         all_product_prices = self.pages["inventory_page"].get_list_of_product_prices()
 
         self.logger.info(f"Found {len(all_product_names)} products")
         assert len(all_product_names) > 0, "No products found on inventory page"
 
-        self.pages["inventory_page"].add_all_to_cart()
+        log_assertion(self.logger, all_product_names, seeded_product_names, "Seeded products match inventory")
+        assert all_product_names == seeded_product_names, (
+            "The products seeded into cart do not match to product names shown in inventory"
+        )
+
         self.pages["inventory_page"].open_cart_page()
         all_cart_item_names = self.pages["cart_page"].get_list_of_cart_item_names()
         all_cart_item_prices = self.pages["cart_page"].get_list_of_cart_item_prices()
@@ -154,8 +156,7 @@ class TestInventory(BaseTest):
         """Test adding and removing products from cart"""
         log_test_start(self.logger, "test_add_to_cart", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         all_product_elements = self.pages["inventory_page"].get_all_product_elements()
         self.pages["inventory_page"].add_all_to_cart()
         actual_cart_item_count = self.pages["inventory_page"].get_cart_item_count()
@@ -177,8 +178,7 @@ class TestInventory(BaseTest):
         """Test sorting products alphabetically A to Z"""
         log_test_start(self.logger, "test_sort_a_to_z", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].sort_products_a_to_z()
         all_product_names = self.pages["inventory_page"].get_list_of_product_names()
 
@@ -195,8 +195,7 @@ class TestInventory(BaseTest):
         """Test sorting products alphabetically Z to A"""
         log_test_start(self.logger, "test_sort_z_to_a", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].sort_products_z_to_a()
         all_product_names = self.pages["inventory_page"].get_list_of_product_names()
 
@@ -213,8 +212,7 @@ class TestInventory(BaseTest):
         """Test sorting products by price low to high"""
         log_test_start(self.logger, "test_sort_low_to_high", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].sort_products_low_to_high()
         all_product_prices = self.pages["inventory_page"].get_list_of_product_prices()
 
@@ -231,8 +229,7 @@ class TestInventory(BaseTest):
         """Test sorting products by price high to low"""
         log_test_start(self.logger, "test_sort_high_to_low", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].sort_products_high_to_low()
         all_product_prices = self.pages["inventory_page"].get_list_of_product_prices()
 
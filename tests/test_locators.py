@@ -0,0 +1,163 @@
+import os
+
+import pytest
+from lxml import html
+from lxml.cssselect import CSSSelector
+from selenium.webdriver.common.by import By
+
+from data.tests_data import Links, Users
+from locators.compiler import compile_locator, xpath_to_css
+from locators.page_locators import (
+    CartPageLocators,
+    CheckoutPageLocators,
+    InventoryPageLocators,
+    LoginPageLocators,
+    OrderPageLocators,
+    OverviewPageLocators,
+    ProductPageLocators,
+)
+from tests.test_base import BaseTest
+from utils.logger import get_logger, log_assertion, log_test_end, log_test_start
+
+# Live locator check in a browser: "off" (default), "on", or "capture" to also save the page as a DOM fixture
+LOCATOR_LIVE_CHECK = os.getenv("LOCATOR_LIVE_CHECK", "off").strip().lower()
+if LOCATOR_LIVE_CHECK not in ("off", "on", "capture"):
+    raise ValueError(f"LOCATOR_LIVE_CHECK must be 'off', 'on' or 'capture', got {LOCATOR_LIVE_CHECK!r}")
+
+# Pages captured in each state, compared against without a browser
+DOM_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "dom")
+
+# Product ids put in the cart so cart, overview and remove button locators have something to match
+SEEDED_CART = "[4, 0]"
+
+LOCATOR_STATES = [
+    (LoginPageLocators, "login"),
+    (InventoryPageLocators, "inventory"),
+    (ProductPageLocators, "product"),
+    (CartPageLocators, "cart"),
+    (CheckoutPageLocators, "checkout"),
+    (OverviewPageLocators, "overview"),
+    (OrderPageLocators, "order"),
+]
+
+
+def dom_fixture_path(state: str) -> str:
+    return os.path.join(DOM_FIXTURES_DIR, f"{state}.html")
+
+
+class TestLocatorsOffline:
+    """Compiled locators find the same elements as the original XPaths in captured pages, without a browser"""
+
+    @pytest.mark.parametrize("locators, state", LOCATOR_STATES)
+    def test_compiled_locators_match_xpaths(self, locators, state):
+        """Test every compiled locator matches the same elements as its XPath in the page captured for the state"""
+        document = html.parse(dom_fixture_path(state))
+        mismatches = {}
+        for name, xpath in locators.XPATHS.items():
+            compiled = getattr(locators, name)
+            if compiled[0] != By.CSS_SELECTOR:
+                continue
+            expected = [document.getpath(element) for element in document.xpath(xpath[1])]
+            actual = [document.getpath(element) for element in CSSSelector(compiled[1], translator="html")(document)]
+            if expected != actual:
+                mismatches[name] = (xpath[1], compiled[1], len(expected), len(actual))
+
+        assert mismatches == {}, f"Compiled locators do not match their XPaths: {mismatches}"
+
+
+@pytest.mark.skipif(LOCATOR_LIVE_CHECK == "off", reason="live locator check is off, set LOCATOR_LIVE_CHECK=on")
+class TestLocators(BaseTest):
+    """Compiled locators find the same elements as the original XPaths in the running app"""
+
+    logger = get_logger(__name__)
+
+    def open_state(self, state: str) -> None:
+        """Bring app into a state where the page's locators match elements"""
+        login_page = self.pages["login_page"]
+        if state == "login":
+            login_page.open_login_page()
+            login_page.click_login_button()
+            return
+        login_page.authenticated_as(Users.STANDARD_USER_NAME, Users.STANDARD_USER_PASSWORD)
+        login_page.driver.execute_script("window.localStorage.setItem('cart-contents', arguments[0]);", SEEDED_CART)
+        if state == "inventory":
+            login_page.driver.refresh()
+            self.pages["inventory_page"].open_hamburger_menu()
+        elif state == "checkout":
+            login_page.open_url(Links.CHECKOUT)
+            self.pages["checkout_page"].click_continue_checkout()
+        else:
+            urls = {"product": Links.PRODUCT, "cart": Links.CART, "overview": Links.OVERVIEW, "order": Links.ORDER}
+            login_page.open_url(urls[state])
+
+    @pytest.mark.parametrize("locators, state", LOCATOR_STATES)
+    def test_compiled_locators_match_xpaths(self, locators, state):
+        """Test every compiled locator matches the same elements as its XPath"""
+        log_test_start(self.logger, "test_compiled_locators_match_xpaths", {"locators": locators.__name__})
+
+        self.open_state(state)
+        driver = self.pages["login_page"].driver
+        if LOCATOR_LIVE_CHECK == "capture":
+            with open(dom_fixture_path(state), "w", encoding="utf-8") as fixture:
+                fixture.write(f"<!DOCTYPE html>\n{driver.page_source}\n")
+        mismatches = {}
+        for name, xpath in locators.XPATHS.items():
+            compiled = getattr(locators, name)
+            expected_ids = [element.id for element in driver.find_elements(*xpath)]
+            actual_ids = [element.id for element in driver.find_elements(*compiled)]
+            if expected_ids != actual_ids:
+                mismatches[name] = (xpath[1], compiled[1], len(expected_ids), len(actual_ids))
+
+        log_assertion(self.logger, {}, mismatches, f"{locators.__name__} compiled locators")
+        assert mismatches == {}, f"Compiled locators do not match their XPaths: {mismatches}"
+
+        log_test_end(self.logger, "test_compiled_locators_match_xpaths", "PASSED")
+
+
+class TestLocatorCompiler:
+    """XPath to CSS translation, without a browser"""
+
+    @pytest.mark.parametrize(
+        "xpath, expected_css",
+        [
+            ("//input", "input"),
+            ("//input[@id='user-name']", "input#user-name"),
+            ("//div[@id='1st']", "div[id='1st']"),
+            ("//div[@class='inventory_item']", "div[class='inventory_item']"),
+            ("//h3[@data-test='error']", "h3[data-test='error']"),
+            ("//a[contains(@class,'bm-item')]", "a[class*='bm-item']"),
+            ("//a[contains(@class, 'bm-item')]", "a[class*='bm-item']"),
+            ("//div[2]", "div:nth-of-type(2)"),
+            ("//div[@id='header_container']/div[2]/span", "div#header_container > div:nth-of-type(2) > span"),
+            ("//div[@id='shopping_cart_container']//a", "div#shopping_cart_container a"),
+            ("//select/option[@value='az']", "select > option[value='az']"),
+            ("//button[@id='x'][contains(@class,'y')]", "button#x[class*='y']"),
+        ],
+    )
+    def test_xpath_to_css(self, xpath, expected_css):
+        """Test supported XPath forms translate to the equivalent CSS selector"""
+        assert xpath_to_css(xpath) == expected_css
+
+    @pytest.mark.parametrize(
+        "xpath",
+        [
+            "/html/body/div",
+            "div[@id='x']",
+            "//div/following-sibling::span",
+            "//div/..",
+            "//*[@id='x']",
+            "//a | //b",
+            "//span[text()='Products']",
+            "//div[starts-with(@id,'item')]",
+            "//div[@class='x'][2]",
+            "//div[last()]",
+        ],
+    )
+    def test_unsupported_xpath_is_not_translated(self, xpath):
+        """Test XPath forms CSS can't express exactly stay XPath"""
+        assert xpath_to_css(xpath) is None
+        assert compile_locator((By.XPATH, xpath)) == (By.XPATH, xpath)
+
+    def test_non_xpath_locator_is_kept(self):
+        """Test locators that are not XPath are returned as they are"""
+        assert compile_locator((By.ID, "user-name")) == (By.ID, "user-name")
@@ -0,0 +1,100 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+from utils.merge_shards import OUTCOME_FILTER, RUN_COUNT, _outcome_filter, _report_data, count_outcomes, merge_reports
+
+SHARD_TESTS = {
+    "test_shard_1.py": (
+        "import pytest\n\n\n"
+        "def test_passes():\n    pass\n\n\n"
+        "def test_fails():\n    assert False\n\n\n"
+        "@pytest.mark.skip(reason='shard')\n"
+        "def test_skipped():\n    pass\n"
+    ),
+    "test_shard_2.py": (
+        "import pytest\n\n\n"
+        "def test_passes_too():\n    pass\n\n\n"
+        "def test_passes_again():\n    pass\n\n\n"
+        "@pytest.mark.xfail(reason='shard')\n"
+        "def test_expected_failure():\n    assert False\n"
+    ),
+}
+
+
+# Outcome filter checkbox, whether it is disabled and the count next to it
+FILTER_COUNT = re.compile(r'data-test-result="(\w+)"( disabled)?[^>]*>\s*<span class="\1">(\d+)')
+
+
+def filter_counts(page: str) -> dict[str, tuple[int, bool]]:
+    return {outcome: (int(count), bool(disabled)) for outcome, disabled, count in FILTER_COUNT.findall(page)}
+
+
+class TestMergeShards:
+    """Merging pytest-html reports of shards, without a browser"""
+
+    @pytest.fixture
+    def shard_reports(self, tmp_path) -> list[str]:
+        """Run two shards in a separate pytest process each and return their self-contained reports."""
+        reports = []
+        for name, source in SHARD_TESTS.items():
+            (tmp_path / name).write_text(source, encoding="utf-8")
+            report = tmp_path / f"{name.removesuffix('.py')}.html"
+            subprocess.run(
+                [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", name, f"--html={report}"]
+                + ["--self-contained-html"],
+                cwd=tmp_path,
+                capture_output=True,
+                check=False,
+            )
+            reports.append(str(report))
+        return reports
+
+    def test_merged_report_counts_outcomes_of_all_shards(self, shard_reports, tmp_path):
+        """Test merged report has the tests of both shards and the sum of their outcome counts"""
+        merged_path = tmp_path / "merged.html"
+        merge_reports(shard_reports, str(merged_path))
+        merged = merged_path.read_text(encoding="utf-8")
+
+        assert len(_report_data(merged)["tests"]) == 6
+        assert count_outcomes(_report_data(merged)) == {"passed": 3, "failed": 1, "skipped": 1, "xfailed": 1}
+        counts = filter_counts(merged)
+        assert counts["passed"] == (3, False)
+        assert counts["failed"] == (1, False)
+        assert counts["skipped"] == (1, False)
+        assert counts["xfailed"] == (1, False)
+        assert counts["error"] == (0, True)
+        assert RUN_COUNT.search(merged)[1] == "5"
+        assert "on 2 shards.</p>" in merged
+
+    @pytest.mark.parametrize(
+        "checkbox, count, expected",
+        [
+            (
+                'data-test-result="passed" />\n            <span class="passed">1 Passed,</span>',
+                4,
+                'data-test-result="passed" />\n            <span class="passed">4 Passed,</span>',
+            ),
+            (
+                'data-test-result="failed" />\n            <span class="failed">1 Failed,</span>',
+                0,
+                'data-test-result="failed" disabled />\n            <span class="failed">0 Failed,</span>',
+            ),
+            (
+                'data-test-result="error" disabled/>\n            <span class="error">0 Errors,</span>',
+                2,
+                'data-test-result="error"/>\n            <span class="error">2 Errors,</span>',
+            ),
+            (
+                'data-test-result="xfailed" disabled>\n            <span class="xfailed">0 Expected failures,</span>',
+                1,
+                'data-test-result="xfailed">\n            <span class="xfailed">1 Expected failures,</span>',
+            ),
+        ],
+        ids=["4.1-enabled", "4.1-disabled", "4.1-enabled-again", "4.2-enabled-again"],
+    )
+    def test_outcome_filter_is_rewritten_in_pytest_html_4_markup(self, checkbox, count, expected):
+        """Test outcome filter counts are rewritten in the markup of pytest-html 4.1 and 4.2"""
+        assert OUTCOME_FILTER.sub(lambda match: _outcome_filter(match, count), checkbox) == expected
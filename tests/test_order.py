@@ -27,8 +27,7 @@ class TestOrder(BaseTest):
         """Test opening order confirmation page"""
         log_test_start(self.logger, "test_open_order", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_random_product()
         self.pages["product_page"].click_add_product_to_cart()
         self.pages["product_page"].open_cart_page()
@@ -84,8 +83,7 @@ class TestOrder(BaseTest):
         """Test back to products from order page"""
         log_test_start(self.logger, "test_back_from_order", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_random_product()
         self.pages["product_page"].click_add_product_to_cart()
         self.pages["product_page"].open_cart_page()
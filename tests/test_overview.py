@@ -10,6 +10,10 @@ class TestOverview(BaseTest):
 
     logger = get_logger(__name__)
 
+    def open_overview(self, username, password):
+        """Open overview page as user, restored from a checkpoint after the first time"""
+        self.checkpoints.walk(self.pages["overview_page"], self.overview_flow(username, password))
+
     @pytest.mark.parametrize(
         "username, password, expected_title, expected_url",
         [
@@ -20,15 +24,7 @@ class TestOverview(BaseTest):
         """Test opening overview page"""
         log_test_start(self.logger, "test_open_overview", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
-        first_name = self.data["generator"].first_name()
-        last_name = self.data["generator"].last_name()
-        zip_code = self.data["generator"].zip_code()
-        self.pages["checkout_page"].fill_checkout_form(first_name, last_name, zip_code)
-        self.pages["checkout_page"].click_continue_checkout()
+        self.open_overview(username, password)
         actual_overview_title = self.pages["overview_page"].get_overview_page_title()
         expected_overview_title = expected_title
         actual_overview_url = self.pages["overview_page"].action_get_url()
@@ -56,15 +52,7 @@ class TestOverview(BaseTest):
         """Test cancel button from overview page"""
         log_test_start(self.logger, "test_cancel_overview", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
-        first_name = self.data["generator"].first_name()
-        last_name = self.data["generator"].last_name()
-        zip_code = self.data["generator"].zip_code()
-        self.pages["checkout_page"].fill_checkout_form(first_name, last_name, zip_code)
-        self.pages["checkout_page"].click_continue_checkout()
+        self.open_overview(username, password)
         self.pages["overview_page"].click_cancel_overview()
         actual_title_after_cancel_overview = self.pages["inventory_page"].get_products_page_title()
         expected_title_after_cancel_overview = expected_title
@@ -103,15 +91,7 @@ class TestOverview(BaseTest):
         """Test finish button completes order"""
         log_test_start(self.logger, "test_finish_overview", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
-        self.pages["inventory_page"].open_cart_page()
-        self.pages["cart_page"].click_checkout()
-        first_name = self.data["generator"].first_name()
-        last_name = self.data["generator"].last_name()
-        zip_code = self.data["generator"].zip_code()
-        self.pages["checkout_page"].fill_checkout_form(first_name, last_name, zip_code)
-        self.pages["checkout_page"].click_continue_checkout()
+        self.open_overview(username, password)
         self.pages["overview_page"].click_finish_overview()
         actual_title_after_finish_overview = self.pages["order_page"].get_order_page_title()
         expected_title_after_finish_overview = expected_title
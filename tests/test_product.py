@@ -20,8 +20,7 @@ class TestProduct(BaseTest):
         """Test opening product page"""
         log_test_start(self.logger, "test_open_product", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         all_product_names = self.pages["inventory_page"].get_list_of_product_names()
         all_product_prices = self.pages["inventory_page"].get_list_of_product_prices()
         self.pages["inventory_page"].open_random_product()
@@ -48,8 +47,7 @@ class TestProduct(BaseTest):
         """Test adding product to cart"""
         log_test_start(self.logger, "test_add_product_to_cart", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_random_product()
         actual_product_name = self.pages["product_page"].get_product_name()
         actual_product_price = self.pages["product_page"].get_product_price()
@@ -82,8 +80,7 @@ class TestProduct(BaseTest):
         """Test removing product from cart"""
         log_test_start(self.logger, "test_remove_product_from_cart", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_random_product()
         self.pages["product_page"].click_add_product_to_cart()
         actual_cart_item_count = self.pages["product_page"].get_cart_item_count()
@@ -113,8 +110,7 @@ class TestProduct(BaseTest):
         """Test back to products button"""
         log_test_start(self.logger, "test_back_to_products", {"username": username, "password": "***"})
 
-        self.pages["login_page"].open_login_page()
-        self.pages["login_page"].login(username, password)
+        self.pages["login_page"].authenticated_as(username, password)
         self.pages["inventory_page"].open_random_product()
         self.pages["product_page"].click_back_to_products_button()
         actual_title_after_back_from_product = self.pages["inventory_page"].get_products_page_title()
@@ -0,0 +1,156 @@
+import contextlib
+import functools
+import glob
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+
+REPORTS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reports")
+ACTION_TIMINGS_FILE = os.path.join(REPORTS_DIR, "action_timings.json")
+PERCENTILES = (50, 95, 99)
+# Upper bounds in milliseconds of the histogram buckets, the last bucket takes everything slower
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return 0.0
+    rank = max(1, -(-percent * len(values) // 100))
+    return values[rank - 1]
+
+
+def histogram(values: list[float]) -> dict[str, int]:
+    """Count values in seconds per BUCKETS_MS bucket"""
+    counts = dict.fromkeys([f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"], 0)
+    for value in values:
+        ms = value * 1000
+        bound = next((bound for bound in BUCKETS_MS if ms <= bound), None)
+        counts[f"<={bound}ms" if bound is not None else f">{BUCKETS_MS[-1]}ms"] += 1
+    return counts
+
+
+def _stats(samples: list[tuple[float, float]]) -> dict:
+    """Percentiles in milliseconds of waiting, executing and total time of samples"""
+    totals = sorted(total for _, total in samples)
+    parts = {
+        "wait": sorted(wait for wait, _ in samples),
+        "execute": sorted(total - wait for wait, total in samples),
+        "total": totals,
+    }
+    return {
+        "count": len(samples),
+        "seconds": round(sum(totals), 6),
+        "wait_seconds": round(sum(parts["wait"]), 6),
+        **{
+            name: {f"p{percent}": round(percentile(values, percent) * 1000, 3) for percent in PERCENTILES}
+            for name, values in parts.items()
+        },
+        "histogram": histogram(totals),
+    }
+
+
+class ActionTimings:
+    """Wall time of BasePage actions, split into waiting for the page and executing, per page class
+
+    Only the outermost action is recorded, so time spent in actions called by other actions (the
+    clickable wait of action_fill_text) is counted once, as part of the action the page object called.
+    """
+
+    def __init__(self):
+        # Page class name to action name to (waiting, total) seconds of every call
+        self.samples: dict[str, dict[str, list[tuple[float, float]]]] = {}
+        self._local = threading.local()
+
+    def timed(self, action: Callable) -> Callable:
+        """Wrap page object method so each outermost call is recorded"""
+
+        @functools.wraps(action)
+        def wrapper(page, *args, **kwargs):
+            if getattr(self._local, "waited", None) is not None:
+                return action(page, *args, **kwargs)
+            self._local.waited = 0.0
+            started = time.perf_counter()
+            try:
+                return action(page, *args, **kwargs)
+            finally:
+                total = time.perf_counter() - started
+                self.record(type(page).__name__, action.__name__, self._local.waited, total)
+                self._local.waited = None
+
+        return wrapper
+
+    @contextlib.contextmanager
+    def waiting(self) -> Iterator[None]:
+        """Count the time spent in the block as waiting of the running action"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if getattr(self._local, "waited", None) is not None:
+                self._local.waited += time.perf_counter() - started
+
+    def record(self, page: str, action: str, waited: float, total: float) -> None:
+        self.samples.setdefault(page, {}).setdefault(action, []).append((waited, total))
+
+    def merge(self, samples: dict[str, dict[str, list]]) -> None:
+        for page, actions in samples.items():
+            for action, values in actions.items():
+                self.samples.setdefault(page, {}).setdefault(action, []).extend(tuple(value) for value in values)
+
+    def dump(self, path: str) -> None:
+        """Write raw samples, so an xdist controller can compute percentiles over all workers"""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.samples, file)
+
+    def merge_files(self, pattern: str) -> None:
+        """Merge and remove raw samples written by xdist workers"""
+        for path in sorted(glob.glob(pattern)):
+            with open(path, encoding="utf-8") as file:
+                self.merge(json.load(file))
+            os.remove(path)
+
+    def by_action(self) -> dict[str, list[tuple[float, float]]]:
+        actions: dict[str, list[tuple[float, float]]] = {}
+        for page_actions in self.samples.values():
+            for action, values in page_actions.items():
+                actions.setdefault(action, []).extend(values)
+        return actions
+
+    def aggregate(self) -> dict:
+        """Percentiles and histograms per action over all pages, and per page class and action"""
+        return {
+            "actions": {action: _stats(values) for action, values in sorted(self.by_action().items())},
+            "pages": {
+                page: {action: _stats(values) for action, values in sorted(actions.items())}
+                for page, actions in sorted(self.samples.items())
+            },
+        }
+
+    def export(self, path: str = ACTION_TIMINGS_FILE) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.aggregate(), file, indent=2)
+
+    def summary_lines(self, limit: int = 8) -> list[str]:
+        actions = sorted(self.by_action().items(), key=lambda item: -sum(total for _, total in item[1]))
+        lines = [f"{'action':<32} {'calls':>6} {'total s':>8} {'wait %':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"]
+        for action, values in actions[:limit]:
+            stats = _stats(values)
+            wait_share = stats["wait_seconds"] / stats["seconds"] * 100 if stats["seconds"] else 0.0
+            total = stats["total"]
+            lines.append(
+                f"{action:<32} {stats['count']:>6} {stats['seconds']:>8.2f} {wait_share:>6.0f}% "
+                f"{total['p50']:>8.1f} {total['p95']:>8.1f} {total['p99']:>8.1f}"
+            )
+        pages = {
+            page: sum(total for values in actions.values() for _, total in values)
+            for page, actions in self.samples.items()
+        }
+        by_time = sorted(pages.items(), key=lambda item: -item[1])
+        lines.append("Time in actions by page: " + ", ".join(f"{page} {seconds:.2f}s" for page, seconds in by_time))
+        return lines
+
+
+action_timings = ActionTimings()
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import threading
+
+from dotenv import load_dotenv
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+load_dotenv()
+
+FAST_PROFILE = os.getenv("FAST_PROFILE", "false").strip().lower() == "true"
+CHROME_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".chrome")
+CHROME_CACHE_DIR = os.getenv("CHROME_CACHE_DIR", os.path.join(CHROME_DIR, "cache"))
+CHROME_PROFILE_TEMPLATE = os.getenv("CHROME_PROFILE_TEMPLATE", os.path.join(CHROME_DIR, "profile-template"))
+
+# Assets no test looks at, blocked through CDP unless a test is marked with @pytest.mark.assets
+BLOCKED_ASSETS = ["*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.svg", "*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+# Background work Chrome does on startup that tests never need
+FAST_ARGUMENTS = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-domain-reliability",
+    "--disable-client-side-phishing-detection",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--no-default-browser-check",
+    f"--disk-cache-dir={CHROME_CACHE_DIR}",
+]
+
+_template_lock = threading.Lock()
+
+
+def _profile_from_template() -> tempfile.TemporaryDirectory:
+    """Copy profile template into a directory of its own, an empty one while there is no template yet
+
+    Chrome locks its user data dir, so browsers can't share one. The copy is removed once the
+    returned object is garbage collected after the browser quits.
+    """
+    profile = tempfile.TemporaryDirectory(prefix="chrome-profile-", ignore_cleanup_errors=True)
+    with _template_lock:
+        if os.path.isdir(CHROME_PROFILE_TEMPLATE):
+            shutil.copytree(
+                CHROME_PROFILE_TEMPLATE,
+                profile.name,
+                dirs_exist_ok=True,
+                ignore=shutil.ignore_patterns("Singleton*", "*.lock", "lockfile"),
+            )
+    return profile
+
+
+def apply_fast_profile(options: Options) -> tempfile.TemporaryDirectory:
+    """Add fast profile arguments to options and return the browser's profile directory"""
+    os.makedirs(CHROME_CACHE_DIR, exist_ok=True)
+    profile = _profile_from_template()
+    for argument in FAST_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_argument(f"--user-data-dir={profile.name}")
+    return profile
+
+
+def save_profile_template(profile_dir: str) -> None:
+    """Copy a warmed up browser's profile as the template for later browsers, if there is none yet"""
+    if os.path.isdir(CHROME_PROFILE_TEMPLATE):
+        return
+    staging = f"{CHROME_PROFILE_TEMPLATE}.{os.getpid()}.tmp"
+    shutil.copytree(
+        profile_dir, staging, ignore=shutil.ignore_patterns("Singleton*", "*.lock", "lockfile", "Cache", "Code Cache")
+    )
+    try:
+        # Another xdist worker may have saved its template first
+        os.rename(staging, CHROME_PROFILE_TEMPLATE)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def set_asset_blocking(driver: WebDriver, blocked: bool) -> None:
+    """Block or allow images and fonts for all following requests of a browser"""
+    if getattr(driver, "assets_blocked", None) == blocked:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_ASSETS if blocked else []})
+    driver.assets_blocked = blocked
@@ -0,0 +1,164 @@
+import time
+
+from selenium.common.exceptions import (
+    JavascriptException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+CONDITIONS = ("present", "all_present", "visible", "all_visible", "clickable", "invisible", "text")
+LOCATOR_STRATEGIES = {By.XPATH: "xpath", By.CSS_SELECTOR: "css", By.ID: "id"}
+# Errors raised when a navigation destroys the page while the script is waiting
+NAVIGATION_ERRORS = ("document unloaded", "execution context was destroyed", "inspected target navigated")
+
+# Check condition now and on every DOM mutation or animation frame until it holds or time runs out
+WAIT_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var using = arguments[0], value = arguments[1], condition = arguments[2];
+var text = arguments[3], scroll = arguments[4], timeout = arguments[5];
+var observer = null, frame = null, timer = null, scrolled = false, finished = false;
+
+function find() {
+    if (using === "element") {
+        return value && value.isConnected ? [value] : [];
+    }
+    if (using === "xpath") {
+        var result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(using === "id" ? "#" + CSS.escape(value) : value));
+}
+
+function visible(element) {
+    for (var node = element; node && node.nodeType === 1; node = node.parentElement) {
+        var style = window.getComputedStyle(node);
+        if (style.display === "none" || style.opacity === "0") {
+            return false;
+        }
+    }
+    return window.getComputedStyle(element).visibility !== "hidden" && element.getClientRects().length > 0;
+}
+
+function check() {
+    var nodes = find();
+    var first = nodes[0];
+    if (first && scroll && !scrolled) {
+        first.scrollIntoView();
+        scrolled = true;
+    }
+    switch (condition) {
+        case "present":
+            return first ? { value: first } : null;
+        case "all_present":
+            return nodes.length ? { value: nodes } : null;
+        case "visible":
+            return first && visible(first) ? { value: first } : null;
+        case "all_visible":
+            return nodes.length && nodes.every(visible) ? { value: nodes } : null;
+        case "clickable":
+            return first && visible(first) && !first.disabled ? { value: first } : null;
+        case "invisible":
+            return !first || !visible(first) ? { value: true } : null;
+        case "text":
+            return first && first.innerText.indexOf(text) !== -1 ? { value: true } : null;
+    }
+    return { error: "Unknown condition: " + condition };
+}
+
+function finish(result) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) {
+        observer.disconnect();
+    }
+    if (frame !== null) {
+        window.cancelAnimationFrame(frame);
+    }
+    window.clearTimeout(timer);
+    done(result);
+}
+
+function poll() {
+    if (finished) {
+        return;
+    }
+    var result = check();
+    if (result) {
+        finish(result);
+    }
+}
+
+function onFrame() {
+    poll();
+    if (!finished) {
+        frame = window.requestAnimationFrame(onFrame);
+    }
+}
+
+poll();
+if (!finished) {
+    timer = window.setTimeout(function () { finish({ timeout: true }); }, timeout);
+    observer = new MutationObserver(poll);
+    observer.observe(document.documentElement, { subtree: true, childList: true, attributes: true, characterData: true });
+    // Style and layout changes that are not DOM mutations are caught on the next frame
+    frame = window.requestAnimationFrame(onFrame);
+}
+"""
+
+
+class BrowserWaitUnavailable(WebDriverException):
+    """In-browser wait could not run and caller should poll from Python instead"""
+
+
+class BrowserWait:
+    """Resolve element conditions inside the page with one async script call"""
+
+    def __init__(self, driver: WebDriver, timeout: float):
+        self.driver = driver
+        self.timeout = timeout
+
+    def until(
+        self, condition: str, element, text: str | None = None, scroll: bool = False, timeout: float | None = None
+    ):
+        """Return element(s) or True once condition holds, raise TimeoutException otherwise"""
+        if condition not in CONDITIONS:
+            raise ValueError(f"Unknown wait condition '{condition}'")
+        if isinstance(element, WebElement):
+            using, value = "element", element
+        elif element[0] in LOCATOR_STRATEGIES:
+            using, value = LOCATOR_STRATEGIES[element[0]], element[1]
+        else:
+            raise BrowserWaitUnavailable(f"Locator strategy '{element[0]}' is not supported in browser")
+
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            try:
+                result = self.driver.execute_async_script(
+                    WAIT_SCRIPT, using, value, condition, text, scroll, remaining_ms
+                )
+            except StaleElementReferenceException:
+                if condition == "invisible":
+                    return True
+                raise
+            except JavascriptException as error:
+                # Page navigated away while waiting, check again on the new document
+                if any(message in str(error.msg).lower() for message in NAVIGATION_ERRORS) and remaining_ms:
+                    continue
+                raise BrowserWaitUnavailable(error.msg) from error
+            if result is None or "error" in result:
+                raise BrowserWaitUnavailable(f"Wait script failed: {result}")
+            if result.get("timeout"):
+                raise TimeoutException(f"Condition '{condition}' not met for {element} within {timeout}s")
+            return result["value"]
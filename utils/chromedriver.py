@@ -0,0 +1,119 @@
+import contextlib
+import functools
+import json
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows, downloads are not serialized there
+    fcntl = None
+
+from dotenv import load_dotenv
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.core.os_manager import ChromeType, OperationSystemManager
+
+from utils.logger import get_logger
+
+load_dotenv()
+
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "/usr/bin/chromedriver")
+# Chrome major version to driver binary, so known versions resolve without network
+CHROMEDRIVER_MANIFEST = os.getenv(
+    "CHROMEDRIVER_MANIFEST", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".chromedriver.json")
+)
+
+
+def installed_chrome_major() -> str | None:
+    """Return major version of installed Chrome or Chromium, None if none is found"""
+    os_manager = OperationSystemManager()
+    for chrome_type in (ChromeType.GOOGLE, ChromeType.CHROMIUM):
+        version = os_manager.get_browser_version_from_os(chrome_type)
+        if version:
+            return version.split(".")[0]
+    return None
+
+
+def load_manifest(path: str = CHROMEDRIVER_MANIFEST) -> dict[str, str]:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest: dict[str, str], path: str = CHROMEDRIVER_MANIFEST) -> None:
+    """Write manifest atomically, xdist workers may resolve at the same time"""
+    directory = os.path.dirname(path) or "."
+    with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False, encoding="utf-8") as file:
+        json.dump(dict(sorted(manifest.items())), file, indent=2)
+        file.write("\n")
+    os.replace(file.name, path)
+
+
+@contextlib.contextmanager
+def _manifest_lock(path: str = CHROMEDRIVER_MANIFEST) -> Iterator[None]:
+    """Let one process at a time download a driver, the others then find it in the manifest"""
+    if fcntl is None:
+        yield
+        return
+    with open(f"{path}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def driver_major(path: str) -> str:
+    """Major version from the version directory webdriver-manager installs a driver in, "unknown" if none"""
+    for part in reversed(os.path.normpath(path).split(os.sep)):
+        if re.fullmatch(r"\d+(\.\d+)+", part):
+            return part.split(".")[0]
+    return "unknown"
+
+
+def _from_manifest(manifest: dict[str, str], major: str | None) -> tuple[str, str] | None:
+    if major is None:
+        # Can't tell which Chrome is installed, trust the newest driver we already have
+        for known in sorted(manifest, key=lambda known: int(known) if known.isdigit() else -1, reverse=True):
+            if os.path.exists(manifest[known]):
+                return manifest[known], f"manifest (Chrome version unknown, using driver for {known})"
+    elif major in manifest and os.path.exists(manifest[major]):
+        return manifest[major], f"manifest (Chrome {major})"
+    return None
+
+
+def _resolve() -> tuple[str, str]:
+    """Return driver path and where it came from"""
+    if os.path.exists(CHROMEDRIVER_PATH):
+        return CHROMEDRIVER_PATH, "CHROMEDRIVER_PATH"
+
+    major = installed_chrome_major()
+    found = _from_manifest(load_manifest(), major)
+    if found is not None:
+        return found
+    with _manifest_lock():
+        # Another process may have downloaded it while this one waited for the lock
+        manifest = load_manifest()
+        found = _from_manifest(manifest, major)
+        if found is not None:
+            return found
+        path = ChromeDriverManager().install()
+        # Without a Chrome version the driver is kept under its own version, so later runs find it
+        manifest[major or driver_major(path)] = path
+        save_manifest(manifest)
+    return path, f"download (Chrome {major or 'version unknown'})"
+
+
+@functools.cache
+def chromedriver_path() -> str:
+    """Resolve ChromeDriver once per process, downloading only when no driver matches installed Chrome"""
+    started = time.perf_counter()
+    path, source = _resolve()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    get_logger("ChromeDriver").info("ChromeDriver resolved from %s in %.1fms: %s", source, elapsed_ms, path)
+    return path
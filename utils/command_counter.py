@@ -0,0 +1,54 @@
+import time
+from collections import Counter, defaultdict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class CommandCounter:
+    """Count WebDriver commands a driver sends to chromedriver and the time they take, by command name
+
+    Installed on the driver's command executor, so every HTTP round trip is seen, including those made
+    by expected conditions and action chains.
+    """
+
+    def __init__(self, driver: WebDriver):
+        self.counts: Counter[str] = Counter()
+        self.seconds: defaultdict[str, float] = defaultdict(float)
+        self._execute = driver.command_executor.execute
+        driver.command_executor.execute = self._counted_execute
+
+    @classmethod
+    def of(cls, driver: WebDriver) -> "CommandCounter":
+        """Return counter of a driver, installing it on first use"""
+        counter = getattr(driver, "command_counter", None)
+        if counter is None:
+            counter = cls(driver)
+            driver.command_counter = counter
+        return counter
+
+    def _counted_execute(self, command: str, params: dict):
+        started = time.perf_counter()
+        try:
+            return self._execute(command, params)
+        finally:
+            self.counts[command] += 1
+            self.seconds[command] += time.perf_counter() - started
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def reset(self) -> None:
+        self.counts.clear()
+        self.seconds.clear()
+
+    def summary(self) -> dict:
+        """Return counts and seconds per command as plain data for reports"""
+        return {
+            "total": self.total,
+            "seconds": round(sum(self.seconds.values()), 6),
+            "commands": {
+                command: {"count": count, "seconds": round(self.seconds[command], 6)}
+                for command, count in self.counts.most_common()
+            },
+        }
@@ -0,0 +1,65 @@
+import os
+
+from dotenv import load_dotenv
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from pages.base_page import PAGE_LOAD_STRATEGY
+from utils.browser_profile import FAST_PROFILE, apply_fast_profile, set_asset_blocking
+from utils.chromedriver import chromedriver_path
+
+load_dotenv()
+
+HEADLESS_VALUE = os.getenv("HEADLESS", "headless").strip().lower()
+HEADLESS = HEADLESS_VALUE != "ui"
+
+
+def create_driver(fast_profile: bool = FAST_PROFILE) -> webdriver.Chrome:
+    """Launch Chrome WebDriver with disabled popups and automation detection"""
+    options = Options()
+
+    # Turn off password popups
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "profile.password_manager_leak_detection": False,
+    }
+    options.add_experimental_option("prefs", prefs)
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+
+    # Chrome args to make tests stable
+    base_arguments = [
+        "--window-size=1920,1080",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-features=PasswordCheck,PasswordLeakDetection,SafetyTipUI,PasswordManagerOnboarding",
+        "--disable-save-password-bubble",
+        "--disable-notifications",
+        "--disable-infobars",
+        "--disable-extensions",
+        "--disable-blink-features=AutomationControlled",
+        "--no-first-run",
+        "--disable-search-engine-choice-screen",
+    ]
+
+    # Add headless if needed
+    if HEADLESS:
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+
+    for argument in base_arguments:
+        options.add_argument(argument)
+
+    # Shared disk cache, profile copied from template and no background work
+    profile = apply_fast_profile(options) if fast_profile else None
+
+    # Setup ChromeDriver
+    service = ChromeService(executable_path=chromedriver_path())
+
+    driver = webdriver.Chrome(service=service, options=options)
+    if profile is not None:
+        # Profile copy is removed when the driver object goes away
+        driver.profile_dir = profile
+        set_asset_blocking(driver, True)
+    return driver
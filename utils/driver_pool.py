@@ -0,0 +1,295 @@
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from data.tests_data import Links
+from utils.logger import get_logger
+
+CLEAR_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+# JS heap of the page a test left behind, the memory cap is checked against it
+HEAP_SIZE_SCRIPT = "return performance.memory ? performance.memory.usedJSHeapSize : 0;"
+
+
+@dataclass
+class PoolStats:
+    """Counters and timings collected by the driver pool"""
+
+    launches: int = 0
+    launch_seconds: float = 0.0
+    quits: int = 0
+    quit_seconds: float = 0.0
+    reuses: int = 0
+    resets: int = 0
+    reset_seconds: float = 0.0
+    relaunches: int = 0
+    hits: int = 0
+    misses: int = 0
+    miss_wait_seconds: float = 0.0
+    recycled: int = 0
+
+    @property
+    def avg_launch(self) -> float:
+        return self.launch_seconds / self.launches if self.launches else 0.0
+
+    @property
+    def avg_quit(self) -> float:
+        return self.quit_seconds / self.quits if self.quits else 0.0
+
+    @property
+    def avg_reset(self) -> float:
+        return self.reset_seconds / self.resets if self.resets else 0.0
+
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated wall time saved by reusing browsers instead of relaunching them"""
+        return max(0.0, self.reuses * (self.avg_launch + self.avg_quit - self.avg_reset))
+
+    def summary_lines(self) -> list[str]:
+        return [
+            f"Browsers launched: {self.launches} (avg {self.avg_launch:.2f}s), relaunched after failure: {self.relaunches}",
+            f"Browsers reused: {self.reuses}, avg reset: {self.avg_reset:.3f}s",
+            f"Warm browser hits: {self.hits}, misses: {self.misses} (waited {self.miss_wait_seconds:.1f}s), "
+            f"recycled for idle time or memory: {self.recycled}",
+            f"Estimated time saved by reuse: {self.saved_seconds:.1f}s",
+        ]
+
+
+class DriverPool:
+    """Keep browsers alive across tests and reset their state between them
+
+    With spares, background threads keep that many browsers launched and sitting on BASE_URL, so a test
+    takes a warm browser at once while its replacement starts in parallel. max_size caps browsers alive
+    at once (0 for no cap), idle_timeout recycles browsers idle for longer (0 to keep them) and
+    max_memory_mb recycles browsers whose page JS heap grew past the cap (0 for no cap).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        reuse: bool = True,
+        spares: int = 0,
+        max_size: int = 0,
+        idle_timeout: float = 0.0,
+        max_memory_mb: float = 0.0,
+    ):
+        self.factory = factory
+        self.reuse = reuse
+        self.spares = spares
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_memory_mb = max_memory_mb
+        # Ready browsers with the time they became idle, released ones last so they are reused first
+        self.idle: list[tuple[WebDriver, float]] = []
+        # Warmed up browsers no test has used yet
+        self.fresh: set[WebDriver] = set()
+        self.in_use = 0
+        self.launching = 0
+        self.lock = threading.Lock()
+        self.ready = threading.Condition(self.lock)
+        self.warmer = ThreadPoolExecutor(max_workers=spares, thread_name_prefix="BrowserWarmer") if spares else None
+        self.stats = PoolStats()
+        self.logger = get_logger(self.__class__.__name__)
+        self.top_up()
+
+    @property
+    def size(self) -> int:
+        """Browsers alive or starting"""
+        return self.in_use + len(self.idle) + self.launching
+
+    def acquire(self) -> WebDriver:
+        """Take a healthy ready browser, wait for one being warmed up or launch a new one"""
+        started = time.perf_counter()
+        self.expire_idle()
+        waited = False
+        while True:
+            with self.ready:
+                # A browser still starting, or one a test releases once the pool is at max_size
+                while not self.idle and (self.launching or (self.max_size and self.size >= self.max_size)):
+                    waited = True
+                    self.ready.wait()
+                driver = self.idle.pop()[0] if self.idle else None
+                self.in_use += 1
+            if driver is None:
+                try:
+                    driver = self.launch()
+                except Exception:
+                    with self.lock:
+                        self.in_use -= 1
+                    raise
+                waited = True
+                break
+            if self.is_healthy(driver):
+                with self.lock:
+                    if driver in self.fresh:
+                        self.fresh.discard(driver)
+                    else:
+                        self.stats.reuses += 1
+                self.logger.debug("Reusing pooled browser")
+                break
+            self.logger.warning("Pooled browser failed health check, relaunching")
+            with self.lock:
+                self.fresh.discard(driver)
+                self.in_use -= 1
+                self.stats.relaunches += 1
+            self.quit(driver)
+
+        with self.lock:
+            if waited:
+                self.stats.misses += 1
+                self.stats.miss_wait_seconds += time.perf_counter() - started
+            else:
+                self.stats.hits += 1
+        self.top_up()
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        """Reset browser state and return it to the pool, quitting it if reset fails"""
+        with self.lock:
+            self.in_use -= 1
+        if not self.reuse or self.over_memory_cap(driver):
+            self.quit(driver)
+            self.freed()
+            return
+        try:
+            self.reset(driver)
+        except WebDriverException as error:
+            self.logger.warning("Browser reset failed, dropping it from pool: %s", error.msg)
+            with self.lock:
+                self.stats.relaunches += 1
+            self.quit(driver)
+            self.freed()
+            return
+        with self.ready:
+            self.idle.append((driver, time.monotonic()))
+            self.ready.notify()
+
+    def freed(self) -> None:
+        """Let a test waiting at max_size launch a browser in place of one that was quit, or warm a spare"""
+        with self.ready:
+            self.ready.notify()
+        self.top_up()
+
+    def top_up(self) -> None:
+        """Start background launches until spares browsers are ready or starting"""
+        if self.warmer is None:
+            return
+        with self.lock:
+            needed = self.spares - len(self.idle) - self.launching
+            if self.max_size:
+                needed = min(needed, self.max_size - self.size)
+            self.launching += max(needed, 0)
+        for _ in range(needed):
+            self.warmer.submit(self.warm_launch)
+
+    def warm_launch(self) -> None:
+        """Launch a browser and open BASE_URL so DNS, TLS and the app bundle are warm"""
+        try:
+            driver = self.launch()
+        except Exception as error:
+            # Wake up tests waiting for this browser so they launch their own
+            self.logger.warning("Background browser launch failed: %s", error)
+            with self.ready:
+                self.launching -= 1
+                self.ready.notify_all()
+            return
+        try:
+            driver.get(Links.BASE_URL)
+        except WebDriverException as error:
+            self.logger.debug("Warm-up navigation failed, health check decides on use: %s", error.msg)
+        with self.ready:
+            self.launching -= 1
+            self.fresh.add(driver)
+            self.idle.insert(0, (driver, time.monotonic()))
+            self.ready.notify()
+
+    def expire_idle(self) -> None:
+        """Quit browsers idle for longer than idle_timeout, spares are warmed up again in their place"""
+        if not self.idle_timeout:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        with self.lock:
+            expired = [driver for driver, since in self.idle if since < deadline]
+            self.idle = [(driver, since) for driver, since in self.idle if since >= deadline]
+            self.fresh.difference_update(expired)
+            self.stats.recycled += len(expired)
+        for driver in expired:
+            self.logger.debug("Recycling browser idle for over %.0fs", self.idle_timeout)
+            self.quit(driver)
+
+    def over_memory_cap(self, driver: WebDriver) -> bool:
+        """Check whether the page a test left uses more JS heap than max_memory_mb"""
+        if not self.max_memory_mb:
+            return False
+        try:
+            heap_mb = (driver.execute_script(HEAP_SIZE_SCRIPT) or 0) / 2**20
+        except WebDriverException:
+            return False
+        if heap_mb <= self.max_memory_mb:
+            return False
+        self.logger.debug("Recycling browser using %.0fMB of JS heap", heap_mb)
+        with self.lock:
+            self.stats.recycled += 1
+        return True
+
+    def launch(self) -> WebDriver:
+        """Start a new browser"""
+        started = time.perf_counter()
+        driver = self.factory()
+        elapsed = time.perf_counter() - started
+        with self.lock:
+            self.stats.launches += 1
+            self.stats.launch_seconds += elapsed
+        self.logger.debug("Launched browser in %.2fs", elapsed)
+        return driver
+
+    def quit(self, driver: WebDriver) -> None:
+        """Quit browser ignoring errors from an already dead session"""
+        started = time.perf_counter()
+        try:
+            driver.quit()
+        except WebDriverException as error:
+            self.logger.debug("Ignoring error on browser quit: %s", error.msg)
+        with self.lock:
+            self.stats.quits += 1
+            self.stats.quit_seconds += time.perf_counter() - started
+
+    def reset(self, driver: WebDriver) -> None:
+        """Close extra windows, clear cookies and web storage and open base URL"""
+        started = time.perf_counter()
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if not self._on_app_origin(driver):
+            driver.get(Links.BASE_URL)
+        driver.delete_all_cookies()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        driver.get(Links.BASE_URL)
+        self.stats.resets += 1
+        self.stats.reset_seconds += time.perf_counter() - started
+
+    def is_healthy(self, driver: WebDriver) -> bool:
+        """Check that browser session still responds to commands"""
+        try:
+            return driver.execute_script("return document.readyState") is not None
+        except WebDriverException:
+            return False
+
+    def close(self) -> None:
+        """Wait for background launches and quit all idle browsers"""
+        if self.warmer is not None:
+            self.warmer.shutdown(wait=True)
+        while self.idle:
+            self.quit(self.idle.pop()[0])
+
+    @staticmethod
+    def _on_app_origin(driver: WebDriver) -> bool:
+        current, base = urlsplit(driver.current_url), urlsplit(Links.BASE_URL)
+        return (current.scheme, current.netloc) == (base.scheme, base.netloc)
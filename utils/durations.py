@@ -0,0 +1,63 @@
+import json
+import os
+
+# Durations of previous runs, used to balance tests across xdist workers
+DURATIONS_FILE = os.getenv(
+    "DURATIONS_FILE", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".test_durations.json")
+)
+
+
+def load_durations(path: str = DURATIONS_FILE) -> dict[str, float]:
+    """Read recorded test durations, empty if there is no history yet"""
+    try:
+        with open(path, encoding="utf-8") as file:
+            return {nodeid: float(seconds) for nodeid, seconds in json.load(file).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_durations(durations: dict[str, float], path: str = DURATIONS_FILE) -> None:
+    """Merge durations of this run into recorded history"""
+    history = load_durations(path)
+    history.update(durations)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(dict(sorted(history.items())), file, indent=2)
+        file.write("\n")
+
+
+def _module(nodeid: str) -> str:
+    return nodeid.split("::", 1)[0]
+
+
+def estimate(durations: dict[str, float], nodeids: list[str]) -> list[float]:
+    """Expected duration of each test
+
+    Tests without history count as the average recorded test of their module, or of the whole suite
+    for a new module, so new tests don't all look free and pile up in one place.
+    """
+    by_module: dict[str, list[float]] = {}
+    for nodeid, seconds in durations.items():
+        by_module.setdefault(_module(nodeid), []).append(seconds)
+    overall = sum(durations.values()) / len(durations) if durations else 1.0
+    module_average = {module: sum(values) / len(values) for module, values in by_module.items()}
+    return [durations.get(nodeid, module_average.get(_module(nodeid), overall)) for nodeid in nodeids]
+
+
+def partition(nodeids: list[str], durations: dict[str, float], count: int) -> list[list[str]]:
+    """Split tests into count shards of about equal expected duration
+
+    Longest tests go first to the shard with the least work, ties broken by node id and shard index,
+    so the same tests and history always give the same shards on every machine. Each shard keeps
+    collection order.
+    """
+    expected = dict(zip(nodeids, estimate(durations, nodeids), strict=True))
+    totals = [0.0] * count
+    assigned: dict[str, int] = {}
+    for nodeid in sorted(nodeids, key=lambda nodeid: (-expected[nodeid], nodeid)):
+        shard = min(range(count), key=lambda index: (totals[index], index))
+        assigned[nodeid] = shard
+        totals[shard] += expected[nodeid]
+    shards: list[list[str]] = [[] for _ in range(count)]
+    for nodeid in nodeids:
+        shards[assigned[nodeid]].append(nodeid)
+    return shards
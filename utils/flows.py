@@ -0,0 +1,74 @@
+import json
+import os
+
+# Steps each test walked through checkpoints in previous runs, used to keep shared flow prefixes on one xdist worker
+FLOWS_FILE = os.getenv("FLOWS_FILE", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".test_flows.json"))
+
+
+def load_flows(path: str = FLOWS_FILE) -> dict[str, list[str]]:
+    """Read recorded test flows, empty if there is no history yet"""
+    try:
+        with open(path, encoding="utf-8") as file:
+            return {nodeid: list(steps) for nodeid, steps in json.load(file).items()}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_flows(flows: dict[str, list[str]], path: str = FLOWS_FILE) -> None:
+    """Merge flows of this run into recorded history"""
+    history = load_flows(path)
+    history.update(flows)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(dict(sorted(history.items())), file, indent=2)
+        file.write("\n")
+
+
+def prefixes(steps: list[str]) -> list[tuple[str, ...]]:
+    """Every non-empty prefix of a flow, shortest first"""
+    return [tuple(steps[:depth]) for depth in range(1, len(steps) + 1)]
+
+
+class FlowTrie:
+    """Test flows as paths of step names, flows that start with the same steps share a branch
+
+    Each node is a step reached through one particular prefix. Checkpoints run every node once and restore
+    it for the tests below, so the UI steps a suite runs scale with the nodes instead of the sum of all flows.
+    """
+
+    def __init__(self, flows: dict[str, list[str]] | None = None):
+        self.root: dict[str, dict] = {}
+        self.tests = 0
+        self.steps = 0
+        for steps in (flows or {}).values():
+            self.add(steps)
+
+    def add(self, steps: list[str]) -> None:
+        node = self.root
+        for step in steps:
+            node = node.setdefault(step, {})
+        self.tests += 1
+        self.steps += len(steps)
+
+    def _nodes(self) -> list[dict]:
+        nodes, stack = [], list(self.root.values())
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.values())
+        return nodes
+
+    @property
+    def unique_steps(self) -> int:
+        return len(self._nodes())
+
+    @property
+    def branch_points(self) -> int:
+        """Nodes after which flows go different ways, where a checkpoint is forked"""
+        return sum(len(node) > 1 for node in [self.root, *self._nodes()])
+
+    def summary_lines(self) -> list[str]:
+        return [
+            f"Flows of {self.tests} tests: {self.steps} steps, {self.unique_steps} unique, "
+            f"{self.branch_points} branch points, replaying every flow from the start would run "
+            f"{self.steps - self.unique_steps} more steps"
+        ]
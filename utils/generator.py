@@ -1,4 +1,29 @@
-from faker import Faker
+import json
+import os
+import tempfile
+import zlib
+from importlib.metadata import version
+from typing import NamedTuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Seed of the identity pool, the same seed gives every test the same data in every run
+DATA_SEED = int(os.getenv("DATA_SEED", "0"))
+DATA_POOL_SIZE = int(os.getenv("DATA_POOL_SIZE", "1000"))
+if DATA_POOL_SIZE < 1:
+    raise ValueError(f"DATA_POOL_SIZE must be at least 1, got {DATA_POOL_SIZE}")
+# Generated identities are kept between runs, so Faker is only loaded when the pool has to be refilled
+DATA_POOL_FILE = os.getenv(
+    "DATA_POOL_FILE", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".data_pool.json")
+)
+
+
+class Identity(NamedTuple):
+    first_name: str
+    last_name: str
+    zip_code: str
 
 
 class DataGenerator:
@@ -6,6 +31,8 @@ class DataGenerator:
 
     def __init__(self, seed=None):
         """Initialize data generator with optional seed"""
+        from faker import Faker
+
         self.fake = Faker()
         if seed:
             self.fake.seed(seed)
@@ -21,3 +48,90 @@ class DataGenerator:
     def zip_code(self):
         """Generate random zip code"""
         return self.fake.postcode()
+
+
+class IdentityPool:
+    """Checkout identities generated in bulk from one seed, shared by all tests of a session"""
+
+    def __init__(self, seed: int = DATA_SEED, size: int = DATA_POOL_SIZE, path: str | None = DATA_POOL_FILE):
+        self.seed = seed
+        self.size = size
+        self.path = path
+        self._identities: list[Identity] | None = None
+        self.refilled = False
+
+    @property
+    def identities(self) -> list[Identity]:
+        """Identities of the pool, read from the pool file or generated on first use"""
+        if self._identities is None:
+            self._identities = self._load() or self._refill()
+        return self._identities
+
+    def _key(self) -> dict:
+        # Another Faker release may generate other values for the same seed
+        return {"seed": self.seed, "size": self.size, "faker": version("faker")}
+
+    def _load(self) -> list[Identity] | None:
+        if self.path is None:
+            return None
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if stored.get("key") != self._key():
+            return None
+        return [Identity(*identity) for identity in stored["identities"]]
+
+    def _refill(self) -> list[Identity]:
+        from faker import Faker
+
+        fake = Faker()
+        fake.seed_instance(self.seed)
+        identities = [Identity(fake.first_name(), fake.last_name(), fake.postcode()) for _ in range(self.size)]
+        self.refilled = True
+        if self.path is not None:
+            # Written atomically, xdist workers may refill at the same time
+            directory = os.path.dirname(self.path) or "."
+            with tempfile.NamedTemporaryFile("w", dir=directory, suffix=".tmp", delete=False, encoding="utf-8") as file:
+                json.dump({"key": self._key(), "identities": identities}, file)
+            os.replace(file.name, self.path)
+        return identities
+
+    def test_seed(self, name: str) -> int:
+        """Seed of a test, derived from the pool seed and the test name so it does not depend on run order"""
+        return zlib.crc32(f"{self.seed}:{name}".encode())
+
+    def generator(self, seed: int) -> "PooledDataGenerator":
+        return PooledDataGenerator(self, seed)
+
+
+class PooledDataGenerator:
+    """DataGenerator drawing from an IdentityPool, the n-th call of each field belongs to the n-th identity
+
+    Identities are taken from the pool position given by the seed on, so a seed reproduces the same data.
+    """
+
+    def __init__(self, pool: IdentityPool, seed: int):
+        self.pool = pool
+        self.seed = seed
+        self.calls = dict.fromkeys(Identity._fields, 0)
+
+    def _next(self, field: str) -> str:
+        identities = self.pool.identities
+        identity = identities[(self.seed + self.calls[field]) % len(identities)]
+        self.calls[field] += 1
+        return getattr(identity, field)
+
+    def identity(self) -> Identity:
+        """Next complete checkout identity"""
+        return Identity(*(self._next(field) for field in Identity._fields))
+
+    def first_name(self) -> str:
+        return self._next("first_name")
+
+    def last_name(self) -> str:
+        return self._next("last_name")
+
+    def zip_code(self) -> str:
+        return self._next("zip_code")
@@ -0,0 +1,576 @@
+(function () {
+    "use strict";
+
+    var config = window.APP_CONFIG;
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var REDIRECT_ERROR_KEY = "redirect-error";
+    var PRODUCTS = config.products;
+    var PRODUCTS_BY_ID = {};
+    PRODUCTS.forEach(function (product) {
+        PRODUCTS_BY_ID[product.id] = product;
+    });
+    var SORT_OPTIONS = [
+        ["az", "Name (A to Z)"],
+        ["za", "Name (Z to A)"],
+        ["lohi", "Price (low to high)"],
+        ["hilo", "Price (high to low)"],
+    ];
+    var ERROR_ICON =
+        '<svg width="10" height="10" viewBox="0 0 10 10"><path d="M1 1L9 9M9 1L1 9" stroke="currentColor" stroke-width="2"/></svg>';
+
+    function esc(value) {
+        return String(value)
+            .replace(/&/g, "&amp;")
+            .replace(/</g, "&lt;")
+            .replace(/>/g, "&gt;")
+            .replace(/"/g, "&quot;");
+    }
+
+    function slug(product) {
+        return product.name.replace(/\s+/g, "-").toLowerCase();
+    }
+
+    function price(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    // Session
+
+    function getSessionUser() {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setSessionUser(username) {
+        var expires = new Date(Date.now() + 10 * 60 * 1000).toUTCString();
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; expires=" + expires + "; path=/";
+    }
+
+    function clearSessionUser() {
+        document.cookie = SESSION_COOKIE + "=; expires=Thu, 01 Jan 1970 00:00:00 GMT; path=/";
+    }
+
+    // Cart
+
+    function getCart() {
+        try {
+            var cart = JSON.parse(window.localStorage.getItem(CART_KEY) || "[]");
+            return Array.isArray(cart) ? cart.filter(function (id) { return id in PRODUCTS_BY_ID; }) : [];
+        } catch (error) {
+            return [];
+        }
+    }
+
+    function setCart(cart) {
+        if (cart.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(cart));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+        renderBadge();
+    }
+
+    function addToCart(id) {
+        var cart = getCart();
+        if (cart.indexOf(id) === -1) {
+            cart.push(id);
+        }
+        setCart(cart);
+    }
+
+    function removeFromCart(id) {
+        setCart(getCart().filter(function (item) { return item !== id; }));
+    }
+
+    function cartItemTotal() {
+        return getCart().reduce(function (total, id) { return total + PRODUCTS_BY_ID[id].price; }, 0);
+    }
+
+    // Shared fragments
+
+    function renderBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) {
+            return;
+        }
+        var count = getCart().length;
+        var badge = link.querySelector(".shopping_cart_badge");
+        if (!count) {
+            if (badge) {
+                badge.remove();
+            }
+            return;
+        }
+        if (!badge) {
+            badge = document.createElement("span");
+            badge.className = "shopping_cart_badge";
+            badge.setAttribute("data-test", "shopping-cart-badge");
+            link.appendChild(badge);
+        }
+        badge.textContent = String(count);
+    }
+
+    function cartButtonHtml(product, idPrefix) {
+        var inCart = getCart().indexOf(product.id) !== -1;
+        var action = inCart ? "remove" : "add-to-cart";
+        var id = idPrefix === null ? action : action + "-" + slug(product);
+        var cls = inCart ? "btn btn_secondary btn_small btn_inventory" : "btn btn_primary btn_small btn_inventory";
+        return (
+            '<button class="' + cls + '" data-test="' + esc(id) + '" id="' + esc(id) + '" name="' + esc(id) +
+            '" data-product-id="' + product.id + '">' + (inCart ? "Remove" : "Add to cart") + "</button>"
+        );
+    }
+
+    function bindCartButton(button, product, perProductIds) {
+        button.addEventListener("click", function () {
+            var inCart = getCart().indexOf(product.id) !== -1;
+            if (inCart) {
+                removeFromCart(product.id);
+            } else {
+                addToCart(product.id);
+            }
+            var action = inCart ? "add-to-cart" : "remove";
+            var id = perProductIds ? action + "-" + slug(product) : action;
+            button.id = id;
+            button.name = id;
+            button.setAttribute("data-test", id);
+            button.className = inCart
+                ? "btn btn_primary btn_small btn_inventory"
+                : "btn btn_secondary btn_small btn_inventory";
+            button.textContent = inCart ? "Add to cart" : "Remove";
+        });
+    }
+
+    function headerHtml(secondaryHtml) {
+        var links = [
+            ["inventory_sidebar_link", "All Items"],
+            ["about_sidebar_link", "About"],
+            ["logout_sidebar_link", "Logout"],
+            ["reset_sidebar_link", "Reset App State"],
+        ];
+        return (
+            '<div id="header_container" class="header_container">' +
+            '<div class="primary_header" data-test="primary-header">' +
+            '<div id="menu_button_container">' +
+            '<div class="bm-burger-button"><button id="react-burger-menu-btn" type="button">Open Menu</button></div>' +
+            '<div class="bm-menu-wrap" hidden><div class="bm-menu"><nav class="bm-item-list">' +
+            links
+                .map(function (link) {
+                    return (
+                        '<a id="' + link[0] + '" class="bm-item menu-item" href="#" data-test="' +
+                        link[0].replace(/_/g, "-") + '">' + link[1] + "</a>"
+                    );
+                })
+                .join("") +
+            '</nav></div><div class="bm-cross-button"><button id="react-burger-cross-btn" type="button">Close Menu</button></div></div>' +
+            "</div>" +
+            '<div class="header_label"><div class="app_logo">Swag Labs</div></div>' +
+            '<div id="shopping_cart_container" class="shopping_cart_container">' +
+            '<a class="shopping_cart_link" data-test="shopping-cart-link" href="#"></a>' +
+            "</div>" +
+            "</div>" +
+            '<div class="header_secondary_container" data-test="secondary-header">' +
+            secondaryHtml +
+            "</div>" +
+            "</div>"
+        );
+    }
+
+    function titleHtml(title) {
+        return '<span class="title" data-test="title">' + esc(title) + "</span>";
+    }
+
+    function bindHeader(root) {
+        var menu = root.querySelector(".bm-menu-wrap");
+        root.querySelector("#react-burger-menu-btn").addEventListener("click", function () {
+            menu.hidden = false;
+        });
+        root.querySelector("#react-burger-cross-btn").addEventListener("click", function () {
+            menu.hidden = true;
+        });
+        root.querySelector("#inventory_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            go("/inventory.html");
+        });
+        root.querySelector("#about_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            go("https://saucelabs.com/");
+        });
+        root.querySelector("#logout_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            clearSessionUser();
+            go("/");
+        });
+        root.querySelector("#reset_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            setCart([]);
+            menu.hidden = true;
+        });
+        root.querySelector(".shopping_cart_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            go("/cart.html");
+        });
+        renderBadge();
+    }
+
+    function pageHtml(secondaryHtml, contentsHtml) {
+        return (
+            '<div id="page_wrapper" class="page_wrapper"><div id="contents_wrapper">' +
+            headerHtml(secondaryHtml) +
+            contentsHtml +
+            "</div></div>"
+        );
+    }
+
+    function errorHtml(message) {
+        return (
+            '<h3 data-test="error"><button class="error-button" data-test="error-button" type="button">' +
+            ERROR_ICON + "</button>" + esc(message) + "</h3>"
+        );
+    }
+
+    function showError(container, message) {
+        container.innerHTML = errorHtml(message);
+        container.classList.add("error");
+        container.querySelector(".error-button").addEventListener("click", function () {
+            container.innerHTML = "";
+            container.classList.remove("error");
+        });
+    }
+
+    function cartItemsHtml(withButtons) {
+        return getCart()
+            .map(function (id) {
+                var product = PRODUCTS_BY_ID[id];
+                return (
+                    '<div class="cart_item" data-test="inventory-item">' +
+                    '<div class="cart_quantity" data-test="item-quantity">1</div>' +
+                    '<div class="cart_item_label">' +
+                    '<a href="#" id="item_' + id + '_title_link" data-test="item-' + id + '-title-link">' +
+                    '<div class="inventory_item_name" data-test="inventory-item-name">' + esc(product.name) + "</div></a>" +
+                    '<div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(product.desc) + "</div>" +
+                    '<div class="item_pricebar">' +
+                    '<div class="inventory_item_price" data-test="inventory-item-price">' + price(product.price) + "</div>" +
+                    (withButtons ? cartButtonHtml(product, "") : "") +
+                    "</div></div></div>"
+                );
+            })
+            .join("");
+    }
+
+    function bindProductLinks(root) {
+        Array.prototype.forEach.call(root.querySelectorAll("a[id^='item_']"), function (link) {
+            link.addEventListener("click", function (event) {
+                event.preventDefault();
+                go("/inventory-item.html?id=" + link.id.split("_")[1]);
+            });
+        });
+    }
+
+    // Pages
+
+    function renderLogin(root) {
+        root.innerHTML =
+            '<div class="login_container"><div class="login_logo">Swag Labs</div>' +
+            '<div class="login_wrapper"><div class="login_wrapper-inner">' +
+            '<div id="login_button_container" class="form_column"><div class="login-box"><form>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" ' +
+            'data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" ' +
+            'data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '<div class="error-message-container"></div>' +
+            '<input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" name="login-button" value="Login">' +
+            "</form></div></div></div></div></div>";
+
+        var errorContainer = root.querySelector(".error-message-container");
+        var redirectError = window.sessionStorage.getItem(REDIRECT_ERROR_KEY);
+        if (redirectError) {
+            window.sessionStorage.removeItem(REDIRECT_ERROR_KEY);
+            showError(errorContainer, redirectError);
+        }
+
+        root.querySelector("form").addEventListener("submit", function (event) {
+            event.preventDefault();
+            var username = root.querySelector("#user-name").value;
+            var password = root.querySelector("#password").value;
+            if (!username) {
+                showError(errorContainer, "Epic sadface: Username is required");
+            } else if (!password) {
+                showError(errorContainer, "Epic sadface: Password is required");
+            } else if (config.users[username] !== password) {
+                showError(errorContainer, "Epic sadface: Username and password do not match any user in this service");
+            } else if (config.lockedUsers.indexOf(username) !== -1) {
+                showError(errorContainer, "Epic sadface: Sorry, this user has been locked out.");
+            } else {
+                setSessionUser(username);
+                go("/inventory.html");
+            }
+        });
+    }
+
+    function sortedProducts(order) {
+        var products = PRODUCTS.slice();
+        var byName = function (a, b) { return a.name < b.name ? -1 : a.name > b.name ? 1 : 0; };
+        if (order === "za") {
+            products.sort(function (a, b) { return byName(b, a); });
+        } else if (order === "lohi") {
+            products.sort(function (a, b) { return a.price - b.price; });
+        } else if (order === "hilo") {
+            products.sort(function (a, b) { return b.price - a.price; });
+        } else {
+            products.sort(byName);
+        }
+        return products;
+    }
+
+    function inventoryListHtml(order) {
+        return sortedProducts(order)
+            .map(function (product) {
+                return (
+                    '<div class="inventory_item" data-test="inventory-item">' +
+                    '<div class="inventory_item_img"><a href="#" id="item_' + product.id + '_img_link" data-test="item-' +
+                    product.id + '-img-link"><img alt="' + esc(product.name) + '" class="inventory_item_img" src="/static/media/' +
+                    esc(product.image) + '"></a></div>' +
+                    '<div class="inventory_item_description" data-test="inventory-item-description">' +
+                    '<div class="inventory_item_label">' +
+                    '<a href="#" id="item_' + product.id + '_title_link" data-test="item-' + product.id + '-title-link">' +
+                    '<div class="inventory_item_name " data-test="inventory-item-name">' + esc(product.name) + "</div></a>" +
+                    '<div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(product.desc) + "</div>" +
+                    "</div>" +
+                    '<div class="pricebar">' +
+                    '<div class="inventory_item_price" data-test="inventory-item-price">' + price(product.price) + "</div>" +
+                    cartButtonHtml(product, "") +
+                    "</div></div></div>"
+                );
+            })
+            .join("");
+    }
+
+    function bindInventoryList(list) {
+        Array.prototype.forEach.call(list.querySelectorAll("button[data-product-id]"), function (button) {
+            bindCartButton(button, PRODUCTS_BY_ID[Number(button.getAttribute("data-product-id"))], true);
+        });
+        bindProductLinks(list);
+    }
+
+    function renderInventory(root) {
+        var options = SORT_OPTIONS.map(function (option) {
+            return '<option value="' + option[0] + '">' + option[1] + "</option>";
+        }).join("");
+        root.innerHTML = pageHtml(
+            titleHtml("Products") +
+                '<div class="right_component"><span class="select_container">' +
+                '<span class="active_option" data-test="active-option">' + SORT_OPTIONS[0][1] + "</span>" +
+                '<select class="product_sort_container" data-test="product-sort-container">' + options + "</select>" +
+                "</span></div>",
+            '<div id="inventory_container" class="inventory_container"><div>' +
+                '<div class="inventory_list" data-test="inventory-list">' + inventoryListHtml("az") + "</div>" +
+                "</div></div>"
+        );
+        bindHeader(root);
+
+        var list = root.querySelector(".inventory_list");
+        var select = root.querySelector(".product_sort_container");
+        bindInventoryList(list);
+        select.addEventListener("change", function () {
+            root.querySelector(".active_option").textContent = select.options[select.selectedIndex].text;
+            list.innerHTML = inventoryListHtml(select.value);
+            bindInventoryList(list);
+        });
+    }
+
+    function renderProduct(root) {
+        var id = Number(new URLSearchParams(window.location.search).get("id"));
+        var product = PRODUCTS_BY_ID[id];
+        var details = product
+            ? '<img class="inventory_details_img" alt="' + esc(product.name) + '" src="/static/media/' + esc(product.image) + '">' +
+              '<div class="inventory_details_desc_container">' +
+              '<div class="inventory_details_name large_size" data-test="inventory-item-name">' + esc(product.name) + "</div>" +
+              '<div class="inventory_details_desc large_size" data-test="inventory-item-desc">' + esc(product.desc) + "</div>" +
+              '<div class="inventory_details_price" data-test="inventory-item-price">' + price(product.price) + "</div>" +
+              cartButtonHtml(product, null) +
+              "</div>"
+            : '<div class="inventory_details_desc_container">' +
+              '<div class="inventory_details_name large_size" data-test="inventory-item-name">ITEM NOT FOUND</div>' +
+              "</div>";
+        root.innerHTML = pageHtml(
+            '<div class="left_component"><button class="btn btn_secondary back btn_large inventory_details_back_button" ' +
+                'data-test="back-to-products" id="back-to-products" name="back-to-products">Back to products</button></div>',
+            '<div id="inventory_item_container" class="inventory_item_container"><div class="inventory_details">' +
+                '<div class="inventory_details_container">' + details + "</div></div></div>"
+        );
+        bindHeader(root);
+
+        root.querySelector("#back-to-products").addEventListener("click", function () {
+            go("/inventory.html");
+        });
+        if (product) {
+            bindCartButton(root.querySelector("button[data-product-id]"), product, false);
+        }
+    }
+
+    function renderCart(root) {
+        root.innerHTML = pageHtml(
+            titleHtml("Your Cart"),
+            '<div id="cart_contents_container" class="cart_contents_container"><div>' +
+                '<div class="cart_list" data-test="cart-list">' +
+                '<div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>' +
+                '<div class="cart_desc_label" data-test="cart-desc-label">Description</div>' +
+                cartItemsHtml(true) +
+                "</div>" +
+                '<div class="cart_footer">' +
+                '<button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping" ' +
+                'name="continue-shopping">Continue Shopping</button>' +
+                '<button class="btn btn_action btn_medium checkout_button" data-test="checkout" id="checkout" ' +
+                'name="checkout">Checkout</button>' +
+                "</div></div></div>"
+        );
+        bindHeader(root);
+        bindProductLinks(root.querySelector(".cart_list"));
+
+        Array.prototype.forEach.call(root.querySelectorAll(".cart_item button[data-product-id]"), function (button) {
+            button.addEventListener("click", function () {
+                removeFromCart(Number(button.getAttribute("data-product-id")));
+                button.closest(".cart_item").remove();
+            });
+        });
+        root.querySelector("#continue-shopping").addEventListener("click", function () {
+            go("/inventory.html");
+        });
+        root.querySelector("#checkout").addEventListener("click", function () {
+            go("/checkout-step-one.html");
+        });
+    }
+
+    function renderCheckoutStepOne(root) {
+        var field = function (id, test, placeholder) {
+            return (
+                '<div class="form_group"><input class="input_error form_input" placeholder="' + placeholder +
+                '" type="text" data-test="' + test + '" id="' + id + '" name="' + id + '" autocorrect="off" ' +
+                'autocapitalize="none" value=""></div>'
+            );
+        };
+        root.innerHTML = pageHtml(
+            titleHtml("Checkout: Your Information"),
+            '<div id="checkout_info_container" class="checkout_info_container"><div class="checkout_info_wrapper"><form>' +
+                '<div class="checkout_info">' +
+                field("first-name", "firstName", "First Name") +
+                field("last-name", "lastName", "Last Name") +
+                field("postal-code", "postalCode", "Zip/Postal Code") +
+                '<div class="error-message-container"></div>' +
+                "</div>" +
+                '<div class="checkout_buttons">' +
+                '<button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" ' +
+                'name="cancel" type="button">Cancel</button>' +
+                '<input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" ' +
+                'id="continue" name="continue" value="Continue">' +
+                "</div></form></div></div>"
+        );
+        bindHeader(root);
+
+        var errorContainer = root.querySelector(".error-message-container");
+        root.querySelector("#cancel").addEventListener("click", function () {
+            go("/cart.html");
+        });
+        root.querySelector("form").addEventListener("submit", function (event) {
+            event.preventDefault();
+            if (!root.querySelector("#first-name").value) {
+                showError(errorContainer, "Error: First Name is required");
+            } else if (!root.querySelector("#last-name").value) {
+                showError(errorContainer, "Error: Last Name is required");
+            } else if (!root.querySelector("#postal-code").value) {
+                showError(errorContainer, "Error: Postal Code is required");
+            } else {
+                go("/checkout-step-two.html");
+            }
+        });
+    }
+
+    function renderCheckoutStepTwo(root) {
+        var itemTotal = cartItemTotal();
+        var tax = Number((itemTotal * 0.08).toFixed(2));
+        root.innerHTML = pageHtml(
+            titleHtml("Checkout: Overview"),
+            '<div id="checkout_summary_container" class="checkout_summary_container"><div>' +
+                '<div class="cart_list" data-test="cart-list">' +
+                '<div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>' +
+                '<div class="cart_desc_label" data-test="cart-desc-label">Description</div>' +
+                cartItemsHtml(false) +
+                "</div>" +
+                '<div class="summary_info">' +
+                '<div class="summary_info_label" data-test="payment-info-label">Payment Information:</div>' +
+                '<div class="summary_value_label" data-test="payment-info-value">SauceCard #31337</div>' +
+                '<div class="summary_info_label" data-test="shipping-info-label">Shipping Information:</div>' +
+                '<div class="summary_value_label" data-test="shipping-info-value">Free Pony Express Delivery!</div>' +
+                '<div class="summary_info_label" data-test="total-info-label">Price Total</div>' +
+                '<div class="summary_subtotal_label" data-test="subtotal-label">Item total: ' + price(itemTotal) + "</div>" +
+                '<div class="summary_tax_label" data-test="tax-label">Tax: ' + price(tax) + "</div>" +
+                '<div class="summary_info_label summary_total_label" data-test="total-label">Total: ' +
+                price(itemTotal + tax) + "</div>" +
+                '<div class="cart_footer">' +
+                '<button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" ' +
+                'name="cancel">Cancel</button>' +
+                '<button class="btn btn_action btn_medium cart_button" data-test="finish" id="finish" name="finish">Finish</button>' +
+                "</div></div></div></div>"
+        );
+        bindHeader(root);
+        bindProductLinks(root.querySelector(".cart_list"));
+
+        root.querySelector("#cancel").addEventListener("click", function () {
+            go("/inventory.html");
+        });
+        root.querySelector("#finish").addEventListener("click", function () {
+            setCart([]);
+            go("/checkout-complete.html");
+        });
+    }
+
+    function renderCheckoutComplete(root) {
+        root.innerHTML = pageHtml(
+            titleHtml("Checkout: Complete!"),
+            '<div id="checkout_complete_container" class="checkout_complete_container">' +
+                '<h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>' +
+                '<div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just ' +
+                "as fast as the pony can get there!</div>" +
+                '<button class="btn btn_primary btn_small" data-test="back-to-products" id="back-to-products" ' +
+                'name="back-to-products">Back Home</button>' +
+                "</div>"
+        );
+        bindHeader(root);
+
+        root.querySelector("#back-to-products").addEventListener("click", function () {
+            go("/inventory.html");
+        });
+    }
+
+    var ROUTES = {
+        "/": renderLogin,
+        "/inventory.html": renderInventory,
+        "/inventory-item.html": renderProduct,
+        "/cart.html": renderCart,
+        "/checkout-step-one.html": renderCheckoutStepOne,
+        "/checkout-step-two.html": renderCheckoutStepTwo,
+        "/checkout-complete.html": renderCheckoutComplete,
+    };
+
+    function render() {
+        var path = window.location.pathname;
+        var root = document.getElementById("root");
+        if (path !== "/" && !getSessionUser()) {
+            window.sessionStorage.setItem(
+                REDIRECT_ERROR_KEY,
+                "Epic sadface: You can only access '" + path + "' when you are logged in."
+            );
+            window.location.replace("/");
+            return;
+        }
+        (ROUTES[path] || renderLogin)(root);
+    }
+
+    render();
+})();
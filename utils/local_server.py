@@ -0,0 +1,188 @@
+import asyncio
+import json
+import os
+import threading
+from dataclasses import asdict
+from urllib.parse import unquote, urlsplit
+
+from data.catalog import PRODUCTS
+from data.tests_data import Users
+from utils.logger import get_logger
+
+APP_DIR = os.path.join(os.path.dirname(__file__), "local_app")
+
+# Paths the app renders client side; every one of them serves the same HTML shell
+PAGE_PATHS = (
+    "/",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+)
+
+# Saucedemo users that behave like the standard user here
+EXTRA_USERS = ("problem_user", "performance_glitch_user", "error_user", "visual_user")
+
+PLACEHOLDER_IMAGE = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="120" height="150">'
+    b'<rect width="120" height="150" fill="#e2e2e2"/></svg>'
+)
+
+REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+def _app_config() -> dict:
+    """Users and catalog handed to the app in the HTML shell"""
+    users = dict.fromkeys(EXTRA_USERS, Users.STANDARD_USER_PASSWORD)
+    users[Users.STANDARD_USER_NAME] = Users.STANDARD_USER_PASSWORD
+    users[Users.LOCKED_USER_NAME] = Users.LOCKED_USER_PASSWORD
+    return {
+        "users": users,
+        "lockedUsers": [Users.LOCKED_USER_NAME],
+        "products": [asdict(product) for product in PRODUCTS],
+    }
+
+
+def _read_asset(name: str) -> bytes:
+    with open(os.path.join(APP_DIR, name), "rb") as asset:
+        return asset.read()
+
+
+def _response(status: int, body: bytes, content_type: str, cache: str = "no-cache") -> bytes:
+    """Build a complete HTTP/1.1 response with keep-alive"""
+    head = (
+        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Cache-Control: {cache}\r\n"
+        "Connection: keep-alive\r\n"
+        "\r\n"
+    )
+    return head.encode("ascii") + body
+
+
+def build_routes() -> dict[str, bytes]:
+    """Render every response once so serving a request is a dict lookup"""
+    config = json.dumps(_app_config()).replace("</", "<\\/")
+    shell = _read_asset("index.html").replace(b"{{CONFIG}}", config.encode("utf-8"))
+    page = _response(200, shell, "text/html; charset=utf-8")
+    routes = dict.fromkeys(PAGE_PATHS, page)
+    routes["/static/js/app.js"] = _response(
+        200, _read_asset("app.js"), "application/javascript; charset=utf-8", "public, max-age=3600"
+    )
+    routes["/static/css/app.css"] = _response(
+        200, _read_asset("app.css"), "text/css; charset=utf-8", "public, max-age=3600"
+    )
+    routes["/favicon.ico"] = _response(204, b"", "image/x-icon", "public, max-age=3600")
+    image = _response(200, PLACEHOLDER_IMAGE, "image/svg+xml", "public, max-age=3600")
+    for product in PRODUCTS:
+        routes[f"/static/media/{product.image}"] = image
+    return routes
+
+
+class LocalServer:
+    """Asyncio HTTP server that stands in for www.saucedemo.com"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self.routes = build_routes()
+        self.not_found = _response(404, b"Not Found", "text/plain; charset=utf-8")
+        self.bad_request = _response(400, b"Bad Request", "text/plain; charset=utf-8")
+        self.not_allowed = _response(405, b"Method Not Allowed", "text/plain; charset=utf-8")
+        self.requests = 0
+        self.logger = get_logger(self.__class__.__name__)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> None:
+        """Run the event loop in a daemon thread and wait until the socket is listening"""
+        self._thread = threading.Thread(target=self._run, name="local-saucedemo", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise RuntimeError(f"Local server failed to start on {self.host}:{self.port}") from self._error
+        self.logger.info(f"Local server listening on {self.base_url}")
+
+    def stop(self) -> None:
+        """Close the listening socket and stop the event loop"""
+        if self._loop is None or self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self.logger.info(f"Local server stopped after {self.requests} requests")
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, reuse_address=True)
+            )
+        except OSError as error:
+            self._error = error
+            self._ready.set()
+            self._loop.close()
+            return
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            # Browsers hold idle keep-alive connections, drop them before closing the loop
+            pending = asyncio.all_tasks(self._loop)
+            for task in pending:
+                task.cancel()
+            self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            self._loop.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve keep-alive requests on one connection until the client closes it"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                response, keep_alive = await self._respond(head, reader)
+                writer.write(response)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, head: bytes, reader: asyncio.StreamReader) -> tuple[bytes, bool]:
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3:
+            return self.bad_request, False
+        method, target, version = parts
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        if length:
+            await reader.readexactly(length)
+        keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+        self.requests += 1
+        if method not in ("GET", "HEAD"):
+            return self.not_allowed, keep_alive
+        response = self.routes.get(unquote(urlsplit(target).path), self.not_found)
+        if method == "HEAD":
+            response = response.split(b"\r\n\r\n", 1)[0] + b"\r\n\r\n"
+        return response, keep_alive
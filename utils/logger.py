@@ -1,57 +1,201 @@
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
 from datetime import datetime
-
-# Shared handlers so all loggers write to same file
-_file_handler = None
-_console_handler = None
+from logging.handlers import QueueHandler, QueueListener
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+LOG_FILE_LEVEL = logging.getLevelName(os.getenv("LOG_FILE_LEVEL", "DEBUG").strip().upper())
+LOG_CONSOLE_LEVEL = logging.getLevelName(os.getenv("LOG_CONSOLE_LEVEL", "INFO").strip().upper())
+# "text" for classic log lines, "jsonl" for one JSON object per record
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").strip().lower()
+# Per-component levels like "CartPage=INFO,DriverPool=WARNING"
+LOG_LEVELS = {
+    name.strip(): logging.getLevelName(level.strip().upper())
+    for name, _, level in (item.partition("=") for item in os.getenv("LOG_LEVELS", "").split(","))
+    if name.strip() and level.strip()
+}
+
+LOGS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
+# Records logged by log_test_start, used to cut worker logs into per-test blocks
+TEST_SEPARATOR = "=" * 80
+TEST_START_PREFIX = "Starting test: "
+
+# Shared handlers so all loggers write to same file through one background thread
+_queue_handler = None
+_listener = None
 _log_filepath = None
 
 
-def get_logger(name: str) -> logging.Logger:
-    global _file_handler, _console_handler, _log_filepath
+class LazyQueueHandler(QueueHandler):
+    """Queue records with only their message rendered, the writer thread formats them
+
+    Once the writer thread is stopped, records go straight to its handlers instead.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.fallback: list[logging.Handler] = []
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Args may change before the writer thread gets to the record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if not self.fallback:
+            super().enqueue(record)
+            return
+        for handler in self.fallback:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format record as one JSON object per line"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def file_formatter(log_format: str = LOG_FORMAT) -> logging.Formatter:
+    if log_format == "jsonl":
+        return JsonLinesFormatter()
+    return logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+def log_filepath(worker: str | None = None) -> str:
+    """Return log file of this run, one per xdist worker when running in parallel
+
+    The controller sets LOG_RUN_ID before workers start, so all files of a run share a timestamp.
+    """
+    run_id = os.getenv("LOG_RUN_ID") or datetime.now().strftime("%Y%m%d_%H%M%S")
+    extension = "jsonl" if LOG_FORMAT == "jsonl" else "log"
+    suffix = f"_{worker}" if worker else ""
+    return os.path.join(LOGS_DIR, f"test_run_{run_id}{suffix}.{extension}")
+
 
+def _start_listener() -> None:
+    global _queue_handler, _listener, _log_filepath
+
+    os.makedirs(LOGS_DIR, exist_ok=True)
+
+    _log_filepath = log_filepath(os.getenv("PYTEST_XDIST_WORKER"))
+
+    file_handler = logging.FileHandler(_log_filepath, encoding="utf-8")
+    file_handler.setLevel(LOG_FILE_LEVEL)
+    file_handler.setFormatter(file_formatter())
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(LOG_CONSOLE_LEVEL)
+    console_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"))
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = LazyQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Write out queued records and stop the writer thread, later records are written synchronously"""
+    global _listener
+    if _listener is not None:
+        _queue_handler.fallback = list(_listener.handlers)
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     if logger.handlers:
         return logger
 
-    logger.setLevel(logging.DEBUG)
+    # Records below every handler's level are dropped before they are created or formatted
+    logger.setLevel(LOG_LEVELS.get(name, min(LOG_FILE_LEVEL, LOG_CONSOLE_LEVEL)))
 
-    # Create handlers once
-    if _file_handler is None:
-        logs_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
-        os.makedirs(logs_dir, exist_ok=True)
+    # Create handler and writer thread once
+    if _queue_handler is None:
+        _start_listener()
 
-        log_filename = f"test_run_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        _log_filepath = os.path.join(logs_dir, log_filename)
+    logger.addHandler(_queue_handler)
 
-        _file_handler = logging.FileHandler(_log_filepath, encoding="utf-8")
-        _file_handler.setLevel(logging.DEBUG)
-        _file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
+    return logger
 
-        _console_handler = logging.StreamHandler()
-        _console_handler.setLevel(logging.INFO)
-        _console_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S")
-        )
 
-    logger.addHandler(_file_handler)
-    logger.addHandler(_console_handler)
-
-    return logger
+def _record_fields(line: str) -> tuple[str, str]:
+    """Return time and message of a text or JSON Lines log record, empty for continuation lines"""
+    if line.startswith("{"):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            return "", ""
+        return record.get("time", ""), record.get("message", "")
+    parts = line.rstrip("\n").split(" - ", 4)
+    return (parts[0], parts[4]) if len(parts) == 5 else ("", "")
+
+
+def merge_logs(paths: list[str], output_path: str, test_order: list[str] | None = None) -> None:
+    """Write several logs as one file made of whole test blocks, like the log of a serial run
+
+    A block starts at the separator before "Starting test: <nodeid>" and runs until the next block.
+    Blocks follow test_order when given (xdist workers of one run), otherwise the time each test
+    started (shards run on different machines). Lines logged before a file's first test come first.
+    """
+    preamble: list[str] = []
+    blocks: dict[str, list[str]] = {}
+    for path in paths:
+        current = preamble
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                message = _record_fields(line)[1]
+                if message.startswith(TEST_START_PREFIX) and "::" in message:
+                    block = blocks.setdefault(message.removeprefix(TEST_START_PREFIX), [])
+                    # Move separator logged right before the start into the new block
+                    if current and _record_fields(current[-1])[1] == TEST_SEPARATOR:
+                        block.append(current.pop())
+                    current = block
+                current.append(line)
+
+    if test_order is None:
+        ordered = sorted(blocks, key=lambda nodeid: _record_fields(blocks[nodeid][0])[0])
+    else:
+        position = {nodeid: index for index, nodeid in enumerate(test_order)}
+        ordered = sorted(blocks, key=lambda nodeid: position.get(nodeid, len(position)))
+    with open(output_path, "w", encoding="utf-8") as file:
+        file.writelines(preamble)
+        for nodeid in ordered:
+            file.writelines(blocks[nodeid])
 
 
 def log_test_start(logger: logging.Logger, test_name: str, params: dict = None) -> None:
-    logger.info(f"{'=' * 80}")
-    logger.info(f"Starting test: {test_name}")
+    logger.info(TEST_SEPARATOR)
+    logger.info(f"{TEST_START_PREFIX}{test_name}")
     if params:
         logger.info(f"Test parameters: {params}")
-    logger.info(f"{'=' * 80}")
+    logger.info(TEST_SEPARATOR)
 
 
 def log_test_end(logger: logging.Logger, test_name: str, status: str = "COMPLETED") -> None:
@@ -0,0 +1,107 @@
+"""Merge pytest-html reports, logs and duration histories of shards run with --shard=i/N
+
+    uv run python -m utils.merge_shards --reports shard-*/reports/test_report.html \
+        --logs shard-*/logs/test_run_*.log --durations shard-*/.test_durations.json
+"""
+
+import argparse
+import html
+import json
+import re
+
+from utils.durations import DURATIONS_FILE, load_durations, save_durations
+from utils.logger import merge_logs
+
+DATA_BLOB = re.compile(r'data-jsonblob="([^"]*)"')
+# Outcome filter checkbox and its count, "disabled/>" in pytest-html 4.1 and "disabled>" in 4.2
+OUTCOME_FILTER = re.compile(r'(data-test-result="(\w+)")[^>]*?(\s*/?>\s*<span class="\2">)\d+')
+RUN_COUNT = re.compile(r'<p class="run-count">(\d+) (?:tests?) took ([^<]*)\.</p>')
+# Outcomes counted in "N tests took ..." by pytest-html
+RUN_OUTCOMES = ("passed", "failed", "xpassed", "xfailed")
+
+
+def _seconds(duration: str) -> float:
+    """Parse duration as written by pytest-html: "80 ms" or "00:01:05" """
+    if duration.endswith(" ms"):
+        return int(duration[:-3]) / 1000
+    hours, minutes, seconds = (int(part) for part in duration.split(":"))
+    return hours * 3600 + minutes * 60 + seconds
+
+
+def _outcome_filter(match: re.Match, count: int) -> str:
+    """Rewrite outcome filter checkbox and its count, disabled when there are no such tests"""
+    return f"{match[1]}{'' if count else ' disabled'}{match[3]}{count}"
+
+
+def _report_data(page: str) -> dict:
+    return json.loads(html.unescape(DATA_BLOB.search(page)[1]))
+
+
+def count_outcomes(data: dict) -> dict[str, int]:
+    """Count results in report data the way pytest-html does, one per row, reruns and setup errors included"""
+    outcomes: dict[str, int] = {}
+    for results in data["tests"].values():
+        for result in results:
+            outcome = result["result"].lower()
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    return outcomes
+
+
+def merge_reports(paths: list[str], output_path: str) -> None:
+    """Write one self-contained pytest-html report with the tests and outcome counts of all shards
+
+    The first report is the template. Outcome counts are taken from the report data, not from the rendered
+    markup, which differs between pytest-html versions. Run time is that of the slowest shard since shards
+    run side by side.
+    """
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            pages.append(file.read())
+
+    data = _report_data(pages[0])
+    durations = []
+    for page in pages:
+        data["tests"].update(_report_data(page)["tests"])
+        if match := RUN_COUNT.search(page):
+            durations.append(match[2])
+    outcomes = count_outcomes(data)
+
+    merged = DATA_BLOB.sub(lambda _: f'data-jsonblob="{html.escape(json.dumps(data))}"', pages[0], count=1)
+    merged = OUTCOME_FILTER.sub(lambda match: _outcome_filter(match, outcomes.get(match[2], 0)), merged)
+    count = sum(outcomes.get(outcome, 0) for outcome in RUN_OUTCOMES)
+    slowest = max(durations, key=_seconds, default="0 ms")
+    merged = RUN_COUNT.sub(
+        f'<p class="run-count">{count} {"tests" if count > 1 else "test"} took {slowest} on {len(pages)} shards.</p>',
+        merged,
+        count=1,
+    )
+    with open(output_path, "w", encoding="utf-8") as file:
+        file.write(merged)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reports", nargs="*", default=[], help="pytest-html reports of all shards")
+    parser.add_argument("--logs", nargs="*", default=[], help="test_run_*.log files of all shards")
+    parser.add_argument("--durations", nargs="*", default=[], help="duration histories of all shards")
+    parser.add_argument("--report-out", default="reports/test_report.html", help="merged report path")
+    parser.add_argument("--log-out", default="logs/test_run_merged.log", help="merged log path")
+    args = parser.parse_args()
+
+    if args.reports:
+        merge_reports(args.reports, args.report_out)
+        print(f"Merged {len(args.reports)} reports into {args.report_out}")
+    if args.logs:
+        merge_logs(args.logs, args.log_out)
+        print(f"Merged {len(args.logs)} logs into {args.log_out}")
+    if args.durations:
+        history: dict[str, float] = {}
+        for path in args.durations:
+            history.update(load_durations(path))
+        save_durations(history)
+        print(f"Merged {len(args.durations)} duration histories into {DURATIONS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import logging
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.browser_wait import BrowserWait
+from utils.logger import get_logger
+from utils.page_state import PageState
+
+
+class PageContext:
+    """Waits, loggers and page state shared by all page objects of a driver
+
+    Page objects are built per test, the driver outlives them. Keeping these helpers on the driver means
+    building a page object is a few dictionary lookups instead of new waits and a logger lookup.
+    """
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.page_state = PageState.of(driver)
+        self.waits: dict[float, WebDriverWait] = {}
+        self.browser_waits: dict[float, BrowserWait] = {}
+        self.loggers: dict[str, logging.Logger] = {}
+        # Page transitions timed since the driver was handed to the current test
+        self.transitions: list[dict] = []
+
+    @classmethod
+    def of(cls, driver: WebDriver) -> "PageContext":
+        """Return context shared by all page objects of a driver"""
+        context = getattr(driver, "page_context", None)
+        if context is None:
+            context = cls(driver)
+            driver.page_context = context
+        return context
+
+    def wait(self, timeout: float) -> WebDriverWait:
+        """Return polling wait with given timeout"""
+        if timeout not in self.waits:
+            self.waits[timeout] = WebDriverWait(self.driver, timeout, 0.3)
+        return self.waits[timeout]
+
+    def browser_wait(self, timeout: float) -> BrowserWait:
+        """Return in-browser wait with given default timeout"""
+        if timeout not in self.browser_waits:
+            self.browser_waits[timeout] = BrowserWait(self.driver, timeout)
+        return self.browser_waits[timeout]
+
+    def logger(self, name: str) -> logging.Logger:
+        """Return logger for a page class"""
+        if name not in self.loggers:
+            self.loggers[name] = get_logger(name)
+        return self.loggers[name]
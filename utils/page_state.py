@@ -0,0 +1,140 @@
+import contextlib
+import uuid
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Commands that only read from the browser and can't change the page
+READ_ONLY_COMMANDS = frozenset(
+    {
+        Command.FIND_ELEMENT,
+        Command.FIND_ELEMENTS,
+        Command.FIND_CHILD_ELEMENT,
+        Command.FIND_CHILD_ELEMENTS,
+        Command.GET_ELEMENT_TEXT,
+        Command.GET_ELEMENT_ATTRIBUTE,
+        Command.GET_ELEMENT_PROPERTY,
+        Command.GET_ELEMENT_TAG_NAME,
+        Command.GET_ELEMENT_RECT,
+        Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+        Command.IS_ELEMENT_ENABLED,
+        Command.IS_ELEMENT_SELECTED,
+        Command.GET_CURRENT_URL,
+        Command.GET_TITLE,
+        Command.GET_PAGE_SOURCE,
+        Command.GET_ALL_COOKIES,
+        Command.GET_COOKIE,
+        Command.W3C_GET_WINDOW_HANDLES,
+        Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+        Command.GET_WINDOW_RECT,
+        Command.SCREENSHOT,
+        Command.ELEMENT_SCREENSHOT,
+    }
+)
+
+# Mark current document and flag it dirty on any DOM change except highlight style tweaks
+ARM_SCRIPT = """
+var token = arguments[0];
+if (!window.__pageStateObserver) {
+    window.__pageStateObserver = new MutationObserver(function (mutations) {
+        for (var i = 0; i < mutations.length; i++) {
+            if (mutations[i].type !== "attributes" || mutations[i].attributeName !== "style") {
+                window.__pageStateDirty = true;
+                return;
+            }
+        }
+    });
+    window.__pageStateObserver.observe(document.documentElement, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+}
+window.__pageStateToken = token;
+window.__pageStateDirty = false;
+"""
+CHECK_SCRIPT = "return window.__pageStateToken === arguments[0] && !window.__pageStateDirty;"
+
+
+class PageState:
+    """Values scraped from the current page, kept until the page may have changed
+
+    Every WebDriver command that is not a pure read bumps the generation, except those sent by producers
+    while scraping. While the generation is the one a value was stored in, reading it costs no round trip.
+    After that one script call checks that the document is the same and the MutationObserver saw no change
+    before the value is reused.
+    """
+
+    def __init__(self, driver: WebDriver):
+        self.driver = driver
+        self.values: dict[str, Any] = {}
+        self.generation = 0
+        self.armed_generation = -1
+        self.token = ""
+        self.hits = 0
+        self.misses = 0
+        self._internal = False
+        self._execute = driver.execute
+        driver.execute = self._tracked_execute
+
+    @classmethod
+    def of(cls, driver: WebDriver) -> "PageState":
+        """Return page state shared by all page objects of a driver"""
+        state = getattr(driver, "page_state", None)
+        if state is None:
+            state = cls(driver)
+            driver.page_state = state
+        return state
+
+    def _tracked_execute(self, driver_command: str, params: dict | None = None):
+        if not self._internal and driver_command not in READ_ONLY_COMMANDS:
+            self.generation += 1
+        return self._execute(driver_command, params)
+
+    @contextlib.contextmanager
+    def _untracked(self) -> Iterator[None]:
+        internal, self._internal = self._internal, True
+        try:
+            yield
+        finally:
+            self._internal = internal
+
+    def _script(self, script: str, *args):
+        with self._untracked():
+            return self.driver.execute_script(script, *args)
+
+    def cached(self, key: str, producer: Callable[[], Any]) -> Any:
+        """Return value stored for key on this page state, scraping it with producer otherwise"""
+        if key in self.values and self.is_valid():
+            self.hits += 1
+            return self.values[key]
+        self.misses += 1
+        # Producers only read the page, their script calls must not drop the other stored values
+        with self._untracked():
+            value = producer()
+        self.store(key, value)
+        return value
+
+    def store(self, key: str, value: Any) -> None:
+        """Remember value and mark the page so later changes are noticed, keeping values the page still matches"""
+        if self.armed_generation != self.generation and not (self.values and self.is_valid()):
+            self.values.clear()
+            self.token = uuid.uuid4().hex
+            self._script(ARM_SCRIPT, self.token)
+            self.armed_generation = self.generation
+        self.values[key] = value
+
+    def is_valid(self) -> bool:
+        """Check that stored values still describe the page"""
+        if self.armed_generation == self.generation:
+            return True
+        if self._script(CHECK_SCRIPT, self.token):
+            self.armed_generation = self.generation
+            return True
+        self.invalidate()
+        return False
+
+    def invalidate(self) -> None:
+        """Drop all stored values"""
+        self.values.clear()
+        self.armed_generation = -1
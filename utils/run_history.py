@@ -0,0 +1,379 @@
+"""Run history: per-test and per-action timings of every run in SQLite, with slowdown detection
+
+uv run python -m utils.run_history runs
+uv run python -m utils.run_history test test_purchase_one_item
+uv run python -m utils.run_history regressions --run 42
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+import pytest
+from dotenv import load_dotenv
+
+from utils.action_timings import action_timings
+
+load_dotenv()
+
+RUN_HISTORY = os.getenv("RUN_HISTORY", "true").strip().lower() != "false"
+RUN_HISTORY_DB = os.getenv(
+    "RUN_HISTORY_DB", os.path.join(os.path.dirname(os.path.dirname(__file__)), ".run_history.db")
+)
+# Previous runs in the same environment a run is compared against, and the smallest slowdown reported
+RUN_HISTORY_BASELINE = int(os.getenv("RUN_HISTORY_BASELINE", "20"))
+RUN_HISTORY_THRESHOLD = float(os.getenv("RUN_HISTORY_THRESHOLD", "0.2"))
+# Fewer baseline values than this say nothing about the usual spread
+MIN_BASELINE = 5
+# Robust z-score a value must exceed, and spread assumed at least for metrics that barely vary
+Z_LIMIT = 3.0
+NOISE_FLOOR = 0.05
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    git_commit TEXT NOT NULL,
+    git_dirty INTEGER NOT NULL,
+    environment TEXT NOT NULL,
+    settings TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    commands INTEGER,
+    command_seconds REAL,
+    PRIMARY KEY (run_id, nodeid)
+);
+CREATE TABLE IF NOT EXISTS actions (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    page TEXT NOT NULL,
+    action TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    wait_seconds REAL NOT NULL,
+    p50_ms REAL NOT NULL,
+    p95_ms REAL NOT NULL,
+    p99_ms REAL NOT NULL,
+    PRIMARY KEY (run_id, page, action)
+);
+CREATE INDEX IF NOT EXISTS tests_by_nodeid ON tests (nodeid, run_id);
+CREATE INDEX IF NOT EXISTS runs_by_environment ON runs (environment, id);
+"""
+
+
+def git_revision() -> tuple[str, bool]:
+    """Return current commit and whether the work tree has uncommitted changes"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout
+        status = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+    return commit.strip(), bool(status.strip())
+
+
+def environment_key(settings: dict) -> str:
+    """Short hash of the settings that affect timings, runs are only compared within one environment"""
+    return hashlib.sha1(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:10]
+
+
+def is_slowdown(value: float, baseline: list[float], threshold: float = RUN_HISTORY_THRESHOLD) -> bool:
+    """Check value is both threshold slower than the baseline median and far outside its usual spread
+
+    Spread is the median absolute deviation, so a few slow outliers in the baseline don't hide a slowdown.
+    """
+    if len(baseline) < MIN_BASELINE:
+        return False
+    median = statistics.median(baseline)
+    if median <= 0:
+        return False
+    deviation = statistics.median(abs(sample - median) for sample in baseline)
+    spread = max(1.4826 * deviation, NOISE_FLOOR * median)
+    return value > median * (1 + threshold) and (value - median) / spread > Z_LIMIT
+
+
+@dataclass
+class Regression:
+    """Metric of a run that is significantly worse than in the baseline runs"""
+
+    name: str
+    metric: str
+    value: float
+    baseline: float
+    runs: int
+
+    @property
+    def change(self) -> float:
+        return self.value / self.baseline - 1
+
+    def describe(self) -> str:
+        return (
+            f"{self.name} {self.metric} {self.change:+.0%} vs last {self.runs} runs "
+            f"({self.value:.3g} vs median {self.baseline:.3g})"
+        )
+
+
+class RunHistory:
+    """SQLite store of test runs"""
+
+    def __init__(self, path: str = RUN_HISTORY_DB):
+        self.path = path
+        # Shards may run side by side on one machine and finish at the same time
+        self.db = sqlite3.connect(path, timeout=30)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def add_run(
+        self, started: datetime, seconds: float, settings: dict, tests: dict[str, dict], actions: dict[str, dict]
+    ) -> int:
+        """Store a run with its tests and the action percentiles of ActionTimings.aggregate(), return run id"""
+        commit, dirty = git_revision()
+        with self.db:
+            run_id = self.db.execute(
+                "INSERT INTO runs (started, seconds, git_commit, git_dirty, environment, settings) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    started.isoformat(timespec="seconds"),
+                    seconds,
+                    commit,
+                    dirty,
+                    environment_key(settings),
+                    json.dumps(settings, sort_keys=True),
+                ),
+            ).lastrowid
+            self.db.executemany(
+                "INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        nodeid,
+                        test["outcome"],
+                        test["seconds"],
+                        test.get("commands"),
+                        test.get("command_seconds"),
+                    )
+                    for nodeid, test in tests.items()
+                ],
+            )
+            self.db.executemany(
+                "INSERT INTO actions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        page,
+                        action,
+                        stats["count"],
+                        stats["seconds"],
+                        stats["wait_seconds"],
+                        stats["total"]["p50"],
+                        stats["total"]["p95"],
+                        stats["total"]["p99"],
+                    )
+                    for page, page_actions in actions.items()
+                    for action, stats in page_actions.items()
+                ],
+            )
+        return run_id
+
+    def latest_run(self) -> int | None:
+        row = self.db.execute("SELECT max(id) FROM runs").fetchone()
+        return row[0]
+
+    def _baseline_runs(self, run_id: int, runs: int) -> list[int]:
+        """Previous runs in the same environment as run"""
+        rows = self.db.execute(
+            "SELECT id FROM runs WHERE environment = (SELECT environment FROM runs WHERE id = ?) AND id < ? "
+            "ORDER BY id DESC LIMIT ?",
+            (run_id, run_id, runs),
+        ).fetchall()
+        return [row["id"] for row in rows]
+
+    def regressions(
+        self, run_id: int, runs: int = RUN_HISTORY_BASELINE, threshold: float = RUN_HISTORY_THRESHOLD
+    ) -> list[Regression]:
+        """Compare passed tests and actions of a run against the previous runs in its environment
+
+        Tests are checked for duration and WebDriver round trips, actions for their p50.
+        """
+        baseline_runs = self._baseline_runs(run_id, runs)
+        if len(baseline_runs) < MIN_BASELINE:
+            return []
+        marks = ", ".join("?" * len(baseline_runs))
+        history: dict[tuple[str, str], list[float]] = {}
+        for row in self.db.execute(
+            f"SELECT nodeid, seconds, commands FROM tests WHERE outcome = 'passed' AND run_id IN ({marks})",
+            baseline_runs,
+        ):
+            history.setdefault((row["nodeid"], "duration"), []).append(row["seconds"])
+            if row["commands"] is not None:
+                history.setdefault((row["nodeid"], "round trips"), []).append(row["commands"])
+        actions = self.db.execute(f"SELECT page, action, p50_ms FROM actions WHERE run_id IN ({marks})", baseline_runs)
+        for row in actions:
+            history.setdefault((f"{row['page']}.{row['action']}", "p50 ms"), []).append(row["p50_ms"])
+
+        current: dict[tuple[str, str], float] = {}
+        for row in self.db.execute(
+            "SELECT nodeid, seconds, commands FROM tests WHERE outcome = 'passed' AND run_id = ?", (run_id,)
+        ):
+            current[(row["nodeid"], "duration")] = row["seconds"]
+            if row["commands"] is not None:
+                current[(row["nodeid"], "round trips")] = row["commands"]
+        for row in self.db.execute("SELECT page, action, p50_ms FROM actions WHERE run_id = ?", (run_id,)):
+            current[(f"{row['page']}.{row['action']}", "p50 ms")] = row["p50_ms"]
+
+        found = [
+            Regression(name, metric, value, statistics.median(history[name, metric]), len(history[name, metric]))
+            for (name, metric), value in current.items()
+            if is_slowdown(value, history.get((name, metric), []), threshold)
+        ]
+        return sorted(found, key=lambda regression: -regression.change)
+
+
+class RunHistoryPlugin:
+    """Pytest plugin recording each run in the history and reporting slowdowns in the terminal summary"""
+
+    def __init__(self, settings: dict, path: str = RUN_HISTORY_DB):
+        self.settings = settings
+        self.path = path
+        self.started = datetime.now()
+        self.started_counter = time.perf_counter()
+        self.tests: dict[str, dict] = {}
+        self.run_id: int | None = None
+        self.found: list[Regression] = []
+
+    def pytest_runtest_logreport(self, report):
+        test = self.tests.setdefault(report.nodeid, {"outcome": "passed", "seconds": 0.0})
+        test["seconds"] += report.duration
+        if hasattr(report, "wasxfail"):
+            test["outcome"] = "xfailed" if report.skipped else "xpassed"
+        elif report.failed:
+            test["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped:
+            test["outcome"] = "skipped"
+        for name, value in report.user_properties:
+            if name == "webdriver_commands":
+                test["commands"] = value["total"]
+                test["command_seconds"] = value["seconds"]
+
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_sessionfinish(self, session):
+        # Record after the other sessionfinish hooks merged worker action timings, before the terminal summary
+        yield
+        if not self.tests:
+            return
+        history = RunHistory(self.path)
+        try:
+            seconds = time.perf_counter() - self.started_counter
+            self.run_id = history.add_run(
+                self.started, seconds, self.settings, self.tests, action_timings.aggregate()["pages"]
+            )
+            self.found = history.regressions(self.run_id)
+        finally:
+            history.close()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.run_id is None:
+            return
+        terminalreporter.write_sep("-", "run history")
+        terminalreporter.write_line(f"Recorded run {self.run_id} in {self.path}")
+        if self.found:
+            terminalreporter.write_line("Slower than previous runs in this environment:")
+            for regression in self.found[:20]:
+                terminalreporter.write_line(f"  {regression.describe()}")
+
+
+def _print_rows(rows: list[sqlite3.Row]) -> None:
+    if not rows:
+        print("No rows")
+        return
+    columns = rows[0].keys()
+    values = [["" if row[column] is None else str(row[column]) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(value[index]) for value in values)) for index, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths, strict=True)))
+    for value in values:
+        print("  ".join(cell.ljust(width) for cell, width in zip(value, widths, strict=True)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=RUN_HISTORY_DB, help="history database")
+    commands = parser.add_subparsers(dest="command", required=True)
+    runs = commands.add_parser("runs", help="latest runs with outcome counts")
+    runs.add_argument("--limit", type=int, default=10)
+    test = commands.add_parser("test", help="duration, round trips and outcome of matching tests per run")
+    test.add_argument("pattern", help="part of the test node id")
+    test.add_argument("--limit", type=int, default=20)
+    slowest = commands.add_parser("slowest", help="slowest tests of a run")
+    slowest.add_argument("--run", type=int, help="run id, latest by default")
+    slowest.add_argument("--limit", type=int, default=10)
+    actions = commands.add_parser("actions", help="p50 of matching page object actions per run")
+    actions.add_argument("pattern", help="part of the action name, e.g. action_fill_text")
+    actions.add_argument("--limit", type=int, default=20)
+    regressions = commands.add_parser("regressions", help="tests and actions of a run slower than its baseline")
+    regressions.add_argument("--run", type=int, help="run id, latest by default")
+    regressions.add_argument("--baseline", type=int, default=RUN_HISTORY_BASELINE, help="previous runs compared")
+    regressions.add_argument("--threshold", type=float, default=RUN_HISTORY_THRESHOLD, help="smallest slowdown")
+    args = parser.parse_args()
+
+    history = RunHistory(args.db)
+    db = history.db
+    if args.command == "runs":
+        _print_rows(
+            db.execute(
+                "SELECT id, started, round(runs.seconds, 1) AS seconds, substr(git_commit, 1, 10) AS git_commit, "
+                "git_dirty AS dirty, environment, count(nodeid) AS tests, "
+                "sum(outcome = 'passed') AS passed, sum(outcome IN ('failed', 'error')) AS failed "
+                "FROM runs LEFT JOIN tests ON tests.run_id = runs.id GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?",
+                (args.limit,),
+            ).fetchall()
+        )
+    elif args.command == "test":
+        _print_rows(
+            db.execute(
+                "SELECT run_id, started, substr(git_commit, 1, 10) AS git_commit, nodeid, outcome, "
+                "round(tests.seconds, 3) AS seconds, commands FROM tests JOIN runs ON runs.id = tests.run_id "
+                "WHERE nodeid LIKE ? ORDER BY run_id DESC, nodeid LIMIT ?",
+                (f"%{args.pattern}%", args.limit),
+            ).fetchall()
+        )
+    elif args.command == "slowest":
+        _print_rows(
+            db.execute(
+                "SELECT nodeid, outcome, round(seconds, 3) AS seconds, commands FROM tests WHERE run_id = ? "
+                "ORDER BY seconds DESC LIMIT ?",
+                (args.run or history.latest_run(), args.limit),
+            ).fetchall()
+        )
+    elif args.command == "actions":
+        _print_rows(
+            db.execute(
+                "SELECT run_id, page, action, calls, p50_ms, p95_ms, p99_ms, "
+                "round(100 * wait_seconds / max(seconds, 1e-9)) AS wait_pct FROM actions "
+                "WHERE action LIKE ? ORDER BY run_id DESC, page LIMIT ?",
+                (f"%{args.pattern}%", args.limit),
+            ).fetchall()
+        )
+    else:
+        run_id = args.run or history.latest_run()
+        found = history.regressions(run_id, args.baseline, args.threshold) if run_id else []
+        print(f"Run {run_id}: {len(found)} slowdowns against up to {args.baseline} previous runs")
+        for regression in found:
+            print(f"  {regression.describe()}")
+    history.close()
+
+
+if __name__ == "__main__":
+    main()
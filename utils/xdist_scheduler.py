@@ -0,0 +1,89 @@
+from xdist.scheduler import LoadScheduling
+from xdist.workermanage import WorkerController
+
+from utils.durations import estimate, load_durations
+from utils.flows import load_flows, prefixes
+
+# Tests queued on a worker, the running one included, so it never waits for the controller
+QUEUE_DEPTH = 2
+# Longest pending tests a worker picks its next test from, preferring the one whose flow it has checkpoints for
+AFFINITY_WINDOW = 4
+
+
+class DurationScheduling(LoadScheduling):
+    """Hand out tests longest first, one at a time, to whichever worker frees up
+
+    Default load scheduling sends consecutive chunks of the collection, so the long checkout flows
+    that sit next to each other end up on the same worker. Longest-processing-time-first order with
+    single-test dispatch keeps workers finishing close together.
+
+    Checkpoints are kept per worker, so among the next few longest tests a worker gets the one that shares
+    most flow steps with tests it already ran and can restore its prefix instead of walking it.
+    """
+
+    def __init__(
+        self,
+        config,
+        log=None,
+        durations: dict[str, float] | None = None,
+        flows: dict[str, list[str]] | None = None,
+    ):
+        super().__init__(config, log)
+        self.durations = load_durations() if durations is None else durations
+        self.flows = load_flows() if flows is None else flows
+        # Flow prefixes of the tests sent to each worker, which it has checkpoints for
+        self.node2prefixes: dict[WorkerController, set[tuple[str, ...]]] = {}
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        # Initial distribution already happened, reschedule on all nodes
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        expected = estimate(self.durations, self.collection)
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: -expected[index])
+        if not self.collection:
+            return
+
+        for _ in range(QUEUE_DEPTH):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node: WorkerController, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            if len(self.node2pending[node]) < QUEUE_DEPTH:
+                self._send_tests(node, QUEUE_DEPTH - len(self.node2pending[node]))
+        else:
+            node.shutdown()
+
+        self.log("num items waiting for node:", len(self.pending))
+
+    def _shared_steps(self, index: int, known: set[tuple[str, ...]]) -> int:
+        return sum(prefix in known for prefix in prefixes(self.flows.get(self.collection[index], [])))
+
+    def _send_tests(self, node: WorkerController, num: int) -> None:
+        known = self.node2prefixes.setdefault(node, set())
+        for _ in range(num):
+            if not self.pending:
+                return
+            window = range(min(AFFINITY_WINDOW, len(self.pending)))
+            position = max(window, key=lambda position: (self._shared_steps(self.pending[position], known), -position))
+            index = self.pending.pop(position)
+            known.update(prefixes(self.flows.get(self.collection[index], [])))
+            self.node2pending[node].append(index)
+            node.send_runtest_some([index])